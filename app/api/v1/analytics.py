@@ -3,7 +3,6 @@ API эндпоинты для системы аналитики
 """
 
 from datetime import datetime
-from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -11,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import get_current_user
 from app.core.database import get_db
+from app.core.serialization import ORJSONResponse
 from app.models.analytics import (
     AnalyticsEvent as AnalyticsEventModel,
 )
@@ -28,6 +28,9 @@ from app.models.analytics import (
 )
 from app.models.user import User
 from app.schemas.analytics import (
+    ANALYTICS_EVENT_LIST_ADAPTER,
+    PROJECT_METRICS_LIST_ADAPTER,
+    USER_METRICS_LIST_ADAPTER,
     AnalyticsEvent,
     AnalyticsEventCreate,
     AnalyticsQuery,
@@ -36,8 +39,10 @@ from app.schemas.analytics import (
     DashboardCreate,
     DashboardUpdate,
     ProjectMetrics,
+    ProjectSummary,
     SprintMetrics,
     UserMetrics,
+    UserSummary,
 )
 from app.services.analytics_service import AnalyticsService
 
@@ -166,7 +171,9 @@ async def track_event(
         entity_id=event_data.entity_id,
         event_data=event_data.event_data,
         session_id=event_data.session_id,
-        ip_address=event_data.ip_address,
+        ip_address=(
+            str(event_data.ip_address) if event_data.ip_address is not None else None
+        ),
         user_agent=event_data.user_agent,
     )
 
@@ -197,7 +204,7 @@ async def get_events(
         limit=limit,
     )
 
-    return [convert_analytics_event(event) for event in events]
+    return ANALYTICS_EVENT_LIST_ADAPTER.validate_python(events, from_attributes=True)
 
 
 # === Метрики проектов ===
@@ -224,7 +231,7 @@ async def get_project_metrics(
         end_date=end_date,
     )
 
-    return [convert_project_metrics(metric) for metric in metrics]
+    return PROJECT_METRICS_LIST_ADAPTER.validate_python(metrics, from_attributes=True)
 
 
 @router.post("/projects/{project_id}/metrics/calculate", response_model=ProjectMetrics)
@@ -252,13 +259,13 @@ async def calculate_project_metrics(
     return convert_project_metrics(metrics)
 
 
-@router.get("/projects/{project_id}/summary", response_model=dict[str, Any])
+@router.get("/projects/{project_id}/summary", response_model=ProjectSummary)
 async def get_project_summary(
     project_id: UUID,
     days: int = Query(30, ge=1, le=365, description="Количество дней"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
+) -> ProjectSummary:
     """Получает сводную информацию по проекту"""
     analytics_service = AnalyticsService(db)
 
@@ -269,7 +276,7 @@ async def get_project_summary(
         days=days,
     )
 
-    return summary
+    return ProjectSummary.model_validate(summary)
 
 
 # === Метрики пользователей ===
@@ -298,7 +305,7 @@ async def get_user_metrics(
         end_date=end_date,
     )
 
-    return [convert_user_metrics(metric) for metric in metrics]
+    return USER_METRICS_LIST_ADAPTER.validate_python(metrics, from_attributes=True)
 
 
 @router.post("/users/{user_id}/metrics/calculate", response_model=UserMetrics)
@@ -328,13 +335,13 @@ async def calculate_user_metrics(
     return convert_user_metrics(metrics)
 
 
-@router.get("/users/{user_id}/summary", response_model=dict[str, Any])
+@router.get("/users/{user_id}/summary", response_model=UserSummary)
 async def get_user_summary(
     user_id: UUID,
     days: int = Query(30, ge=1, le=365, description="Количество дней"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
+) -> UserSummary:
     """Получает сводную информацию по пользователю"""
     analytics_service = AnalyticsService(db)
 
@@ -347,7 +354,7 @@ async def get_user_summary(
         days=days,
     )
 
-    return summary
+    return UserSummary.model_validate(summary)
 
 
 # === Метрики спринтов ===
@@ -491,7 +498,7 @@ async def query_analytics(
 async def get_analytics_overview(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Получает обзор аналитики для пользователя"""
     analytics_service = AnalyticsService(db)
 
@@ -503,15 +510,17 @@ async def get_analytics_overview(
 
     # TODO: Добавить больше данных для обзора
 
-    return {
-        "user_summary": user_summary,
-        "recent_activity": [],  # TODO: Получить последние события
-        "quick_stats": {
-            "tasks_completed_today": 0,  # TODO: Посчитать задачи за сегодня
-            "time_logged_today": 0,  # TODO: Посчитать время за сегодня
-            "active_projects": user_summary.get("projects", {}).get("active", 0),
-        },
-    }
+    return ORJSONResponse(
+        {
+            "user_summary": user_summary,
+            "recent_activity": [],  # TODO: Получить последние события
+            "quick_stats": {
+                "tasks_completed_today": 0,  # TODO: Посчитать задачи за сегодня
+                "time_logged_today": 0,  # TODO: Посчитать время за сегодня
+                "active_projects": user_summary.get("projects", {}).get("active", 0),
+            },
+        }
+    )
 
 
 # === Автоматический сбор метрик ===
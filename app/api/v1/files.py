@@ -21,6 +21,7 @@ from app.core.database import get_db
 from app.models.file import FileType
 from app.models.user import User
 from app.schemas.file import (
+    FILE_RESPONSE_LIST_ADAPTER,
     FileListResponse,
     FileResponse,
     FileStatsResponse,
@@ -206,7 +207,7 @@ async def get_user_files(
     )
 
     return FileListResponse(
-        files=[FileResponse.model_validate(f) for f in files],
+        files=FILE_RESPONSE_LIST_ADAPTER.validate_python(files, from_attributes=True),
         total=len(files),
         offset=offset,
         limit=limit,
@@ -241,7 +242,7 @@ async def get_task_files(
     files = await file_service.get_task_files(task_id)
 
     return FileListResponse(
-        files=[FileResponse.model_validate(f) for f in files],
+        files=FILE_RESPONSE_LIST_ADAPTER.validate_python(files, from_attributes=True),
         total=len(files),
         offset=0,
         limit=len(files),
@@ -276,7 +277,7 @@ async def get_project_files(
     files = await file_service.get_project_files(project_id)
 
     return FileListResponse(
-        files=[FileResponse.model_validate(f) for f in files],
+        files=FILE_RESPONSE_LIST_ADAPTER.validate_python(files, from_attributes=True),
         total=len(files),
         offset=0,
         limit=len(files),
@@ -1,17 +1,22 @@
 """API эндпоинты для управления уведомлениями."""
 
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import get_current_user
 from app.core.database import get_db
+from app.core.serialization import ORJSONResponse, orjson_dumps_lines
 from app.models.user import User
 from app.schemas.notification import (
     NotificationBulkAction,
     NotificationList,
     NotificationMarkRead,
+    NotificationOut,
     NotificationPreferences,
     NotificationRead,
     NotificationStats,
@@ -29,7 +34,7 @@ async def get_notifications(
     offset: int = Query(0, ge=0, description="Смещение"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> NotificationList:
+) -> ORJSONResponse:
     """Получить список уведомлений текущего пользователя."""
     service = NotificationService(db)
 
@@ -48,12 +53,17 @@ async def get_notifications(
         else await service.get_unread_count(current_user.id) if unread_only else 100
     )  # TODO: реализовать подсчет
 
-    return NotificationList(
-        notifications=[NotificationRead.model_validate(n) for n in notifications],
-        total=total,
-        page=offset // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit,
+    # Список отдается в обход валидации pydantic (формат NotificationList);
+    # текущее время берется один раз на все уведомления
+    now = datetime.now(UTC)
+    return ORJSONResponse(
+        {
+            "notifications": [NotificationOut.from_orm(n, now) for n in notifications],
+            "total": total,
+            "page": offset // limit + 1,
+            "size": limit,
+            "pages": (total + limit - 1) // limit,
+        }
     )
 
 
@@ -78,6 +88,25 @@ async def get_unread_count(
     return {"unread_count": count}
 
 
+@router.get("/export")
+async def export_notifications(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Выгрузить все уведомления пользователя в формате JSON Lines.
+
+    Ответ отдается потоком по пачкам, без загрузки всех строк в память.
+    """
+    service = NotificationService(db)
+    now = datetime.now(UTC)
+
+    async def content() -> AsyncIterator[bytes]:
+        async for batch in service.iter_user_notifications(current_user.id):
+            yield orjson_dumps_lines(NotificationOut.from_orm(n, now) for n in batch)
+
+    return StreamingResponse(content(), media_type="application/x-ndjson")
+
+
 @router.get("/{notification_id}", response_model=NotificationRead)
 async def get_notification(
     notification_id: UUID,
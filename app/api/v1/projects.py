@@ -13,13 +13,15 @@ from app.core.database import get_db
 from app.models.project import Project, ProjectMember, ProjectRole
 from app.models.user import User
 from app.schemas.project import (
-    Project as ProjectSchema,
-)
-from app.schemas.project import (
+    PROJECT_LIST_ADAPTER,
+    PROJECT_MEMBER_LIST_ADAPTER,
     ProjectCreate,
     ProjectMemberCreate,
     ProjectUpdate,
 )
+from app.schemas.project import (
+    Project as ProjectSchema,
+)
 from app.schemas.project import (
     ProjectMember as ProjectMemberSchema,
 )
@@ -52,7 +54,7 @@ async def get_projects(
     )
     projects = result.scalars().all()
 
-    return [ProjectSchema.model_validate(project) for project in projects]
+    return PROJECT_LIST_ADAPTER.validate_python(projects, from_attributes=True)
 
 
 @router.post("/", response_model=ProjectSchema, status_code=status.HTTP_201_CREATED)
@@ -214,7 +216,7 @@ async def get_project_members(
     )
     members = result.scalars().all()
 
-    return [ProjectMemberSchema.model_validate(member) for member in members]
+    return PROJECT_MEMBER_LIST_ADAPTER.validate_python(members, from_attributes=True)
 
 
 @router.post("/{project_id}/members", response_model=ProjectMemberSchema)
@@ -2,7 +2,6 @@
 API роутеры для поиска
 """
 
-import json
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -13,12 +12,13 @@ from app.core.database import get_db
 from app.models.search import SearchableType
 from app.models.user import User
 from app.schemas.search import (
+    SAVED_SEARCH_LIST_ADAPTER,
+    SEARCH_RESULT_LIST_ADAPTER,
     ReindexResponse,
     SavedSearch,
     SaveSearchRequest,
     SearchQuery,
     SearchResponse,
-    SearchResult,
     SearchSuggestionsResponse,
 )
 from app.services.search_service import SearchService
@@ -42,7 +42,7 @@ async def search(
         entity_types = []
         for entity_type in search_query.entity_types:
             try:
-                entity_types.append(SearchableType(entity_type))
+                entity_types.append(SearchableType.validate(entity_type))
             except ValueError as err:
                 raise HTTPException(
                     status_code=400,
@@ -65,23 +65,8 @@ async def search(
         include_public=search_query.include_public,
     )
 
-    # Конвертируем результаты
-    search_results = []
-    for result in results:
-        search_results.append(
-            SearchResult(
-                id=result["id"],
-                entity_type=result["entity_type"],
-                entity_id=result["entity_id"],
-                title=result["title"],
-                content=result["content"],
-                rank=result["rank"],
-                project_id=result["project_id"],
-                is_public=result["is_public"],
-                metadata=result["metadata"],
-                entity_data=result["entity_data"],
-            )
-        )
+    # Конвертируем результаты одним вызовом; лишние ключи словарей игнорируются
+    search_results = SEARCH_RESULT_LIST_ADAPTER.validate_python(results)
 
     return SearchResponse(
         results=search_results,
@@ -135,26 +120,7 @@ async def save_search(
         is_public=save_request.is_public,
     )
 
-    # Конвертируем JSON строку в dict если необходимо
-    filters_dict = None
-    if saved_search.filters:
-        try:
-            filters_dict = json.loads(saved_search.filters)
-        except (json.JSONDecodeError, TypeError):
-            filters_dict = {}
-            # Логируем ошибку, но продолжаем с пустыми фильтрами
-            # В реальном приложении здесь можно добавить логирование
-
-    return SavedSearch(
-        id=saved_search.id,
-        name=saved_search.name,
-        query=saved_search.query,
-        filters=filters_dict,
-        user_id=saved_search.user_id,
-        is_public=saved_search.is_public,
-        created_at=saved_search.created_at.isoformat(),
-        updated_at=saved_search.updated_at.isoformat(),
-    )
+    return SavedSearch.model_validate(saved_search)
 
 
 @router.get("/saved-searches", response_model=list[SavedSearch])
@@ -172,32 +138,9 @@ async def get_saved_searches(
         include_public=public,
     )
 
-    result = []
-    for search in saved_searches:
-        # Конвертируем JSON строку в dict если необходимо
-        filters_dict = None
-        if search.filters:
-            try:
-                filters_dict = json.loads(search.filters)
-            except (json.JSONDecodeError, TypeError):
-                filters_dict = {}
-                # Логируем ошибку, но продолжаем с пустыми фильтрами
-                # В реальном приложении здесь можно добавить логирование
-
-        result.append(
-            SavedSearch(
-                id=search.id,
-                name=search.name,
-                query=search.query,
-                filters=filters_dict,
-                user_id=search.user_id,
-                is_public=search.is_public,
-                created_at=search.created_at.isoformat(),
-                updated_at=search.updated_at.isoformat(),
-            )
-        )
-
-    return result
+    return SAVED_SEARCH_LIST_ADAPTER.validate_python(
+        saved_searches, from_attributes=True
+    )
 
 
 @router.delete("/saved-searches/{search_id}")
@@ -9,12 +9,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import get_current_user
 from app.core.database import get_db
+from app.core.serialization import ORJSONResponse
 from app.models.user import User
 from app.schemas.share_link import (
     ShareableType,
     SharedContentResponse,
     ShareLinkAccess,
     ShareLinkCreate,
+    ShareLinkOut,
     ShareLinkResponse,
     ShareLinkStats,
     ShareLinkUpdate,
@@ -50,13 +52,14 @@ async def get_user_share_links(
     offset: int = 0,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[ShareLinkResponse]:
+) -> ORJSONResponse:
     """Получить публичные ссылки пользователя."""
     service = ShareLinkService(db)
     share_links = await service.get_user_share_links(
         current_user.id, shareable_type, limit, offset
     )
-    return [ShareLinkResponse.model_validate(link.to_dict()) for link in share_links]
+    # Список отдается в обход валидации pydantic (формат ShareLinkResponse)
+    return ORJSONResponse([ShareLinkOut.from_orm(link) for link in share_links])
 
 
 @router.get("/stats", response_model=ShareLinkStats)
@@ -3,7 +3,7 @@ API роутеры для управления временными запися
 """
 
 import uuid
-from datetime import UTC, date, datetime, time
+from datetime import UTC, date, datetime, time, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
@@ -138,43 +138,32 @@ async def create_time_entry(
 
     # TODO: Проверить, что пользователь является участником проекта задачи
 
-    # Рассчитываем duration_minutes если не указано
+    # duration_minutes - генерируемая колонка: БД считает ее из start_time/end_time
     entry_data = time_entry_data.model_dump()
+    duration_minutes = entry_data.pop("duration_minutes", None)
 
-    # Если указаны start_time и end_time, рассчитываем duration
-    if (
-        not entry_data.get("duration_minutes")
-        and entry_data.get("start_time")
-        and entry_data.get("end_time")
-    ):
-        from datetime import datetime
-
-        start = entry_data["start_time"]
-        end = entry_data["end_time"]
-        if isinstance(start, str) and isinstance(end, str):
-            start = datetime.fromisoformat(start.replace("Z", "+00:00"))
-            end = datetime.fromisoformat(end.replace("Z", "+00:00"))
-
-        # Приводим к timezone-aware если нужно
-        if start.tzinfo is None:
-            start = start.replace(tzinfo=UTC)
-        if end.tzinfo is None:
-            end = end.replace(tzinfo=UTC)
-
-        duration = int((end - start).total_seconds() / 60)
-        # Проверяем, что длительность не отрицательная
-        if duration < 0:
+    # Приводим к timezone-aware если нужно
+    for field in ("start_time", "end_time"):
+        value = entry_data.get(field)
+        if value is not None and value.tzinfo is None:
+            entry_data[field] = value.replace(tzinfo=UTC)
+
+    start_time = entry_data.get("start_time")
+    end_time = entry_data.get("end_time")
+
+    if start_time and end_time:
+        if end_time < start_time:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Время окончания не может быть раньше времени начала",
             )
-        entry_data["duration_minutes"] = duration
-
-    # Если указана только длительность, устанавливаем текущее время как start_time
-    elif entry_data.get("duration_minutes") and not entry_data.get("start_time"):
-        from datetime import datetime
 
-        entry_data["start_time"] = datetime.now(UTC)
+    # Если указана только длительность, запись начинается сейчас (или в start_time)
+    # и заканчивается через duration_minutes
+    elif duration_minutes and not end_time:
+        start_time = start_time or datetime.now(UTC)
+        entry_data["start_time"] = start_time
+        entry_data["end_time"] = start_time + timedelta(minutes=duration_minutes)
 
     # Преобразуем task_id в UUID
     if "task_id" in entry_data:
@@ -273,19 +262,8 @@ async def stop_timer(
             detail="Нет активного таймера",
         )
 
-    # Рассчитываем продолжительность
-    from datetime import datetime
-
-    time_entry.end_time = datetime.now(UTC)
-    if time_entry.start_time:
-        # Приводим start_time к timezone-aware если он naive
-        start_time = time_entry.start_time
-        if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=UTC)
-
-        duration_seconds = int((time_entry.end_time - start_time).total_seconds())
-        time_entry.duration_minutes = duration_seconds // 60
-    time_entry.is_active = False
+    # Продолжительность пересчитает БД (генерируемая колонка)
+    time_entry.stop_timer()
 
     await db.commit()
     await db.refresh(time_entry)
@@ -353,21 +331,12 @@ async def update_time_entry(
 
     update_data = time_entry_update.model_dump(exclude_unset=True)
 
-    # Проверяем, нужно ли пересчитать duration_minutes
-    if "start_time" in update_data or "end_time" in update_data:
+    # duration_minutes считает БД; новая длительность сдвигает end_time
+    duration_minutes = update_data.pop("duration_minutes", None)
+    if duration_minutes is not None and "end_time" not in update_data:
         start_time = update_data.get("start_time", time_entry.start_time)
-        end_time = update_data.get("end_time", time_entry.end_time)
-
-        # Если оба времени указаны, рассчитываем duration
-        if start_time and end_time:
-            # Приводим к timezone-aware если нужно
-            if hasattr(start_time, "tzinfo") and start_time.tzinfo is None:
-                start_time = start_time.replace(tzinfo=UTC)
-            if hasattr(end_time, "tzinfo") and end_time.tzinfo is None:
-                end_time = end_time.replace(tzinfo=UTC)
-
-            duration_seconds = int((end_time - start_time).total_seconds())
-            update_data["duration_minutes"] = duration_seconds // 60
+        if start_time:
+            update_data["end_time"] = start_time + timedelta(minutes=duration_minutes)
 
     for field, value in update_data.items():
         setattr(time_entry, field, value)
@@ -464,19 +433,8 @@ async def stop_timer_for_entry(
             detail="Таймер уже остановлен",
         )
 
-    from datetime import datetime
-
-    time_entry.end_time = datetime.now(UTC)
-    time_entry.is_active = False
-
-    # Рассчитываем продолжительность
-    if time_entry.start_time:
-        start_time = time_entry.start_time
-        if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=UTC)
-
-        duration_seconds = int((time_entry.end_time - start_time).total_seconds())
-        time_entry.duration_minutes = duration_seconds // 60
+    # Продолжительность пересчитает БД (генерируемая колонка)
+    time_entry.stop_timer()
 
     await db.commit()
     await db.refresh(time_entry)
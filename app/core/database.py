@@ -2,15 +2,23 @@
 Настройка базы данных и SQLAlchemy
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable, Sequence
 from contextlib import asynccontextmanager
-from typing import TypeVar
+from typing import Any, TypeVar
 
+from sqlalchemy import Table
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
-__all__ = ["engine", "AsyncSessionLocal", "get_db", "init_db", "close_db"]
+__all__ = [
+    "engine",
+    "AsyncSessionLocal",
+    "get_db",
+    "init_db",
+    "close_db",
+    "bulk_copy",
+]
 
 T = TypeVar("T")
 
@@ -21,6 +29,9 @@ engine = create_async_engine(
     future=True,
     pool_pre_ping=True,
     pool_recycle=300,
+    # Кэш скомпилированных запросов (по умолчанию 500): хватает на все формы
+    # запросов приложения, включая lambda_stmt, без вытеснения
+    query_cache_size=1200,
     connect_args={
         "server_settings": {
             "application_name": "timeto_do",
@@ -89,6 +100,46 @@ async def get_db_session_context() -> AsyncGenerator[AsyncSession]:
             raise
 
 
+async def bulk_copy(
+    session: AsyncSession,
+    table: Table,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> int:
+    """
+    Массовая вставка строк через COPY FROM STDIN (бинарный формат asyncpg)
+
+    Для больших пачек COPY в разы быстрее параметризованных INSERT.
+    Выполняется на соединении сессии, то есть в ее транзакции; commit
+    остается за вызывающим кодом.
+
+    Python-умолчания ORM (id=uuid4, default=...) не применяются: такие
+    колонки нужно передать явно, иначе сработает только server_default.
+
+    Args:
+        session: Сессия базы данных
+        table: Таблица (Model.__table__)
+        columns: Имена колонок в порядке значений строк
+        rows: Строки-кортежи значений
+
+    Returns:
+        int: Количество вставленных строк
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is None:
+        raise RuntimeError("Соединение с базой данных уже закрыто")
+    status = await driver_connection.copy_records_to_table(
+        table.name,
+        records=rows,
+        columns=list(columns),
+        schema_name=table.schema,
+    )
+    # asyncpg возвращает статус команды вида "COPY 42"
+    return int(status.split()[-1])
+
+
 async def init_db() -> None:
     """Инициализация базы данных - создание всех таблиц"""
     from app.models.base import Base
@@ -0,0 +1,48 @@
+"""
+Быстрая JSON-сериализация на базе orjson
+"""
+
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# orjson нативно сериализует UUID, datetime и dataclass.
+# Наивные datetime трактуем как UTC; UTC пишется как "Z", как у pydantic,
+# чтобы ответы в обход response_model совпадали с валидируемыми
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def orjson_default(obj: Any) -> Any:
+    """Сериализация типов, которые orjson не поддерживает нативно"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    # orjson нативно кодирует только сам uuid.UUID, а asyncpg отдает подкласс
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def orjson_dumps(obj: Any) -> bytes:
+    """Сериализовать объект в JSON (bytes)"""
+    return orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+def orjson_dumps_lines(items: Iterable[Any]) -> bytes:
+    """Сериализовать объекты в JSON Lines (по объекту на строку)"""
+    option = ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+    return b"".join(
+        orjson.dumps(item, default=orjson_default, option=option) for item in items
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON-ответ, сериализуемый через orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
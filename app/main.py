@@ -17,7 +17,7 @@ from pydantic import ValidationError
 from app.api.v1.api import api_router
 from app.core import close_db, close_redis, init_db, init_redis
 from app.core.config import settings
-from app.schemas.auth import update_auth_forward_refs
+from app.core.serialization import ORJSONResponse
 
 
 @asynccontextmanager
@@ -26,9 +26,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Startup
     print(f"🚀 Запуск {settings.PROJECT_NAME} v{settings.VERSION}")
 
-    # Обновление forward references для Pydantic
-    update_auth_forward_refs()
-
     # Инициализация базы данных
     await init_db()
 
@@ -55,6 +52,7 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Настройка шаблонов и статических файлов
@@ -2,6 +2,8 @@
 Middleware для проверки подписок и лимитов
 """
 
+import logging
+import time
 import uuid
 from collections.abc import Callable
 from typing import Any
@@ -9,7 +11,39 @@ from typing import Any
 from fastapi import HTTPException, Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.services.subscription_service import SubscriptionService
+from app.services.subscription_service import (
+    SubscriptionService,
+    allowed_file_types_header,
+)
+
+
+class _SampledErrorFilter(logging.Filter):
+    """Прореживание повторяющихся ошибок при шторме исключений
+
+    В пределах секунды пропускает первые burst записей, затем каждую
+    sample_rate-ю, чтобы сбой БД не превращал логирование в узкое место.
+    """
+
+    def __init__(self, burst: int = 10, sample_rate: int = 100) -> None:
+        super().__init__()
+        self.burst = burst
+        self.sample_rate = sample_rate
+        self._window_start = 0.0
+        self._count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        if now - self._window_start >= 1.0:
+            self._window_start = now
+            self._count = 0
+        self._count += 1
+        if self._count <= self.burst:
+            return True
+        return (self._count - self.burst) % self.sample_rate == 0
+
+
+logger = logging.getLogger(__name__)
+logger.addFilter(_SampledErrorFilter())
 
 
 class SubscriptionMiddleware(BaseHTTPMiddleware):
@@ -118,7 +152,11 @@ class SubscriptionMiddleware(BaseHTTPMiddleware):
             raise
         except Exception as e:
             # Логируем ошибки, но не блокируем запрос
-            print(f"Subscription middleware error: {e}")
+            logger.exception(
+                "Subscription middleware error: %s",
+                e,
+                extra={"path": request.url.path, "user_id": str(user_id)},
+            )
 
 
 class SubscriptionInfoMiddleware(BaseHTTPMiddleware):
@@ -133,8 +171,8 @@ class SubscriptionInfoMiddleware(BaseHTTPMiddleware):
             response.headers["X-Storage-Limit"] = str(limits["storage_limit"])
             response.headers["X-Files-Limit"] = str(limits["file_count_limit"])
             response.headers["X-Max-File-Size"] = str(limits["max_file_size"])
-            response.headers["X-Allowed-File-Types"] = ",".join(
-                limits["allowed_file_types"]
+            response.headers["X-Allowed-File-Types"] = allowed_file_types_header(
+                tuple(limits["allowed_file_types"])
             )
 
         if hasattr(request.state, "storage_warning"):
@@ -7,14 +7,18 @@ from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
+    DDL,
     BigInteger,
     Boolean,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    event,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -26,11 +30,28 @@ if TYPE_CHECKING:
 
 from app.models.base import Base
 
+# Колонки аналитики хранят наивное UTC-время: сервис сравнивает их с
+# datetime.utcnow(), а границы секций считаются в UTC, поэтому значение
+# по умолчанию не должно зависеть от часового пояса сервера БД
+_UTC_NOW = text("timezone('utc', now())")
+
 
 class AnalyticsEvent(Base):
     """Модель для сбора событий аналитики"""
 
     __tablename__ = "analytics_events"
+    __table_args__ = (
+        # GIN-индекс для фильтрации событий по содержимому event_data (@>)
+        Index(
+            "ix_analytics_events_event_data_gin",
+            "event_data",
+            postgresql_using="gin",
+            postgresql_ops={"event_data": "jsonb_path_ops"},
+        ),
+        # Таблица секционирована по месяцам: запросы за период читают
+        # только нужные секции, старые секции можно отсоединять целиком
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     event_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
@@ -47,8 +68,9 @@ class AnalyticsEvent(Base):
 
     # Метаданные события
     event_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Ключ секционирования обязан входить в первичный ключ
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, index=True
+        DateTime, primary_key=True, server_default=_UTC_NOW, index=True
     )
     session_id: Mapped[str | None] = mapped_column(
         String(100), nullable=True, index=True
@@ -62,18 +84,51 @@ class AnalyticsEvent(Base):
     )
 
 
+# Секция по умолчанию принимает строки, для месяца которых еще нет секции
+event.listen(
+    AnalyticsEvent.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS analytics_events_default "
+        "PARTITION OF analytics_events DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+def analytics_events_partition_ddl(month_start: datetime) -> DDL:
+    """DDL для создания месячной секции analytics_events"""
+    start = month_start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return DDL(
+        f"CREATE TABLE IF NOT EXISTS analytics_events_{start:%Y_%m} "
+        f"PARTITION OF analytics_events "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
 class ProjectMetrics(Base):
     """Метрики проектов"""
 
     __tablename__ = "project_metrics"
+    __table_args__ = (
+        # Запросы аналитики всегда фильтруют по project_id + period_type
+        # и диапазону дат: составной индекс отдает диапазон одним сканом
+        Index(
+            "ix_project_metrics_project_period_date",
+            "project_id",
+            "period_type",
+            "date",
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
-    project_id: Mapped[UUID] = mapped_column(
-        ForeignKey("projects.id"), nullable=False, index=True
-    )
+    project_id: Mapped[UUID] = mapped_column(ForeignKey("projects.id"), nullable=False)
 
     # Временные рамки
-    date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     period_type: Mapped[str] = mapped_column(
         String(20), nullable=False
     )  # daily, weekly, monthly
@@ -94,7 +149,7 @@ class ProjectMetrics(Base):
 
     # Дополнительные метрики
     custom_metrics: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=_UTC_NOW)
 
     # Отношения
     project: Mapped["Project"] = relationship("Project", back_populates="metrics")
@@ -104,14 +159,17 @@ class UserMetrics(Base):
     """Метрики пользователей"""
 
     __tablename__ = "user_metrics"
+    __table_args__ = (
+        # Запросы аналитики всегда фильтруют по user_id + period_type
+        # и диапазону дат: составной индекс отдает диапазон одним сканом
+        Index("ix_user_metrics_user_period_date", "user_id", "period_type", "date"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
-    user_id: Mapped[UUID] = mapped_column(
-        ForeignKey("users.id"), nullable=False, index=True
-    )
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     # Временные рамки
-    date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     period_type: Mapped[str] = mapped_column(
         String(20), nullable=False
     )  # daily, weekly, monthly
@@ -132,7 +190,7 @@ class UserMetrics(Base):
 
     # Дополнительные метрики
     custom_metrics: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=_UTC_NOW)
 
     # Отношения
     user: Mapped["User"] = relationship("User", back_populates="metrics")
@@ -174,7 +232,7 @@ class SprintMetrics(Base):
     # Дополнительные данные
     burndown_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     retrospective_summary: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=_UTC_NOW)
 
     # Отношения
     sprint: Mapped["Sprint"] = relationship("Sprint", back_populates="metrics")
@@ -214,7 +272,7 @@ class AnalyticsReport(Base):
     schedule_config: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Временные метки
-    generated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    generated_at: Mapped[datetime] = mapped_column(DateTime, server_default=_UTC_NOW)
     expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_accessed: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     access_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -250,8 +308,8 @@ class Dashboard(Base):
     )  # в секундах
 
     # Метаданные
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=_UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=_UTC_NOW)
     last_viewed: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     view_count: Mapped[int] = mapped_column(Integer, default=0)
 
@@ -28,19 +28,20 @@ class BaseModel(Base):
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        index=True,
     )
 
+    # Метки времени ставит сервер: INSERT не передает их параметрами,
+    # значения возвращаются через RETURNING
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=func.now(),
+        server_default=func.now(),
         nullable=False,
         comment="Дата создания",
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=func.now(),
+        server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
         comment="Дата обновления",
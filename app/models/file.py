@@ -7,7 +7,17 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -19,6 +29,22 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
+# Единицы измерения размера файла (степени 1024)
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def format_file_size(size: int) -> str:
+    """Форматировать размер файла в байтах (например, "1.5 KB")"""
+    # Индекс единицы = log1024(size), считается через bit_length без цикла
+    index = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
+
+
+def get_file_extension(filename: str) -> str:
+    """Расширение файла в нижнем регистре без точки"""
+    return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+
 class FileType(str, Enum):
     """Типы файлов"""
 
@@ -34,6 +60,16 @@ class File(BaseModel):
     """Модель файла"""
 
     __tablename__ = "files"
+    __table_args__ = (
+        # Частичный индекс для галереи изображений пользователя:
+        # покрывает фильтр file_type='image' и сортировку по дате загрузки
+        Index(
+            "ix_files_images",
+            "uploader_id",
+            "uploaded_at",
+            postgresql_where=text("file_type = 'image' AND NOT is_deleted"),
+        ),
+    )
 
     # Основные поля
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -89,7 +125,7 @@ class File(BaseModel):
     @property
     def file_extension(self) -> str:
         """Расширение файла"""
-        return self.filename.split(".")[-1].lower() if "." in self.filename else ""
+        return get_file_extension(self.filename)
 
     @property
     def is_image(self) -> bool:
@@ -104,12 +140,7 @@ class File(BaseModel):
     @property
     def formatted_size(self) -> str:
         """Форматированный размер файла"""
-        size: float = self.file_size
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        return format_file_size(self.file_size or 0)
 
     def increment_download_count(self) -> None:
         """Увеличить счетчик скачиваний"""
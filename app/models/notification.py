@@ -1,12 +1,26 @@
 """Модель уведомлений для системы Time to DO."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.serialization import orjson_dumps
 from app.models.base import BaseModel
 
 
@@ -14,6 +28,18 @@ class Notification(BaseModel):
     """Модель уведомлений пользователей."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Частичный индекс для ленты непрочитанных: фильтр по пользователю,
+        # сортировка по дате (обратный проход) и подсчет непрочитанных.
+        # notification_type включен для фильтра по типу без чтения таблицы
+        Index(
+            "ix_notifications_user_unread_feed",
+            "user_id",
+            "created_at",
+            postgresql_where=text("NOT is_read"),
+            postgresql_include=["notification_type"],
+        ),
+    )
 
     # Поля модели
     user_id: Mapped[UUID] = mapped_column(
@@ -48,7 +74,6 @@ class Notification(BaseModel):
         Boolean,
         default=False,
         nullable=False,
-        index=True,
         comment="Прочитано ли уведомление",
     )
 
@@ -100,8 +125,8 @@ class Notification(BaseModel):
     )
 
     # Метаданные для расширения функциональности
-    metadata_json: Mapped[str | None] = mapped_column(
-        Text,
+    metadata_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB(none_as_null=True),
         nullable=True,
         comment="Метаданные в JSON",
     )
@@ -130,7 +155,7 @@ class Notification(BaseModel):
         """Отметить уведомление как прочитанное."""
         if not self.is_read:
             self.is_read = True
-            self.read_at = datetime.utcnow()
+            self.read_at = datetime.now(UTC)
 
     def mark_as_unread(self) -> None:
         """Отметить уведомление как непрочитанное."""
@@ -142,71 +167,103 @@ class Notification(BaseModel):
         """Ожидает прочтения пользователем."""
         return not self.is_read
 
-    @property
+    @hybrid_property
     def is_recent(self) -> bool:
         """Проверить, является ли уведомление недавним (менее 24 часов)."""
+        return self.is_recent_at(datetime.now(UTC))
+
+    @is_recent.inplace.expression
+    @classmethod
+    def _is_recent_expression(cls) -> ColumnElement[bool]:
+        """SQL-выражение is_recent для фильтрации на стороне БД."""
+        return cls.created_at > func.now() - timedelta(hours=24)
+
+    def is_recent_at(self, now: datetime) -> bool:
+        """Проверить, является ли уведомление недавним относительно момента now.
+
+        Позволяет один раз взять текущее время на весь список уведомлений.
+        """
         if not self.created_at:
             return False
-        return (datetime.now(UTC) - self.created_at).total_seconds() < 86400
+        return (now - self.created_at).total_seconds() < 86400
+
+    def to_dict(self, now: datetime | None = None) -> dict:
+        """Преобразовать уведомление в словарь.
 
-    def to_dict(self) -> dict:
-        """Преобразовать уведомление в словарь."""
+        UUID и datetime возвращаются как есть: их кодирует orjson
+        (см. to_json и ORJSONResponse) без промежуточных строк.
+        """
         return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
+            "id": self.id,
+            "user_id": self.user_id,
             "title": self.title,
             "message": self.message,
             "notification_type": self.notification_type,
             "is_read": self.is_read,
-            "read_at": self.read_at.isoformat() if self.read_at else None,
-            "project_id": str(self.project_id) if self.project_id else None,
-            "task_id": str(self.task_id) if self.task_id else None,
-            "sprint_id": str(self.sprint_id) if self.sprint_id else None,
+            "read_at": self.read_at,
+            "project_id": self.project_id,
+            "task_id": self.task_id,
+            "sprint_id": self.sprint_id,
             "action_url": self.action_url,
             "metadata_json": self.metadata_json,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "is_recent": self.is_recent,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "is_recent": self.is_recent_at(now or datetime.now(UTC)),
         }
 
+    def to_json(self, now: datetime | None = None) -> bytes:
+        """Сериализовать уведомление в JSON.
+
+        Сериализуется slots-dataclass NotificationOut, а не словарь to_dict.
+        """
+        # Схемы импортируют модель, поэтому импорт локальный
+        from app.schemas.notification import NotificationOut
+
+        return orjson_dumps(NotificationOut.from_orm(self, now or datetime.now(UTC)))
+
 
 # Константы для типов уведомлений
 class NotificationType:
     """Типы уведомлений в системе."""
 
     # Задачи
-    TASK_ASSIGNED = "task_assigned"
-    TASK_COMPLETED = "task_completed"
-    TASK_OVERDUE = "task_overdue"
-    TASK_MOVED = "task_moved"
-    TASK_COMMENT_ADDED = "task_comment_added"
+    TASK_ASSIGNED: Final = "task_assigned"
+    TASK_COMPLETED: Final = "task_completed"
+    TASK_OVERDUE: Final = "task_overdue"
+    TASK_MOVED: Final = "task_moved"
+    TASK_COMMENT_ADDED: Final = "task_comment_added"
 
     # Проекты
-    PROJECT_CREATED = "project_created"
-    PROJECT_UPDATED = "project_updated"
-    PROJECT_MEMBER_ADDED = "project_member_added"
-    PROJECT_MEMBER_REMOVED = "project_member_removed"
+    PROJECT_CREATED: Final = "project_created"
+    PROJECT_UPDATED: Final = "project_updated"
+    PROJECT_MEMBER_ADDED: Final = "project_member_added"
+    PROJECT_MEMBER_REMOVED: Final = "project_member_removed"
 
     # Спринты
-    SPRINT_STARTED = "sprint_started"
-    SPRINT_COMPLETED = "sprint_completed"
-    SPRINT_TASK_ASSIGNED = "sprint_task_assigned"
+    SPRINT_STARTED: Final = "sprint_started"
+    SPRINT_COMPLETED: Final = "sprint_completed"
+    SPRINT_TASK_ASSIGNED: Final = "sprint_task_assigned"
 
     # Система
-    SYSTEM_ANNOUNCEMENT = "system_announcement"
-    WELCOME = "welcome"
-    DEADLINE_REMINDER = "deadline_reminder"
+    SYSTEM_ANNOUNCEMENT: Final = "system_announcement"
+    WELCOME: Final = "welcome"
+    DEADLINE_REMINDER: Final = "deadline_reminder"
 
     @classmethod
     def get_all_types(cls) -> list[str]:
         """Получить список всех типов уведомлений."""
-        return [
-            value
-            for key, value in cls.__dict__.items()
-            if not key.startswith("_") and isinstance(value, str)
-        ]
+        return list(_NOTIFICATION_TYPES_ORDERED)
 
     @classmethod
     def is_valid_type(cls, notification_type: str) -> bool:
         """Проверить, является ли тип уведомления валидным."""
-        return notification_type in cls.get_all_types()
+        return notification_type in NOTIFICATION_TYPES
+
+
+# Типы собираются один раз при импорте, а не сканированием __dict__ на каждый вызов
+_NOTIFICATION_TYPES_ORDERED: Final[tuple[str, ...]] = tuple(
+    value
+    for key, value in vars(NotificationType).items()
+    if not key.startswith("_") and isinstance(value, str)
+)
+NOTIFICATION_TYPES: Final[frozenset[str]] = frozenset(_NOTIFICATION_TYPES_ORDERED)
@@ -3,15 +3,23 @@
 """
 
 import uuid
+from enum import StrEnum
+from typing import Final
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text, func, select
 from sqlalchemy.dialects.postgresql import ENUM, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    column_property,
+    declared_attr,
+    mapped_column,
+    relationship,
+)
 
 from app.models.base import BaseModel
 
 
-class ProjectStatus(str):
+class ProjectStatus(StrEnum):
     """Статусы проекта"""
 
     ACTIVE = "ACTIVE"
@@ -20,7 +28,7 @@ class ProjectStatus(str):
     ON_HOLD = "ON_HOLD"
 
 
-class ProjectRole(str):
+class ProjectRole(StrEnum):
     """Роли в проекте"""
 
     OWNER = "OWNER"
@@ -28,25 +36,141 @@ class ProjectRole(str):
     VIEWER = "VIEWER"
 
 
+# Права участника как битовая маска: проверка роли - одно побитовое И
+PERMISSION_VIEW: Final = 0b0001
+PERMISSION_EDIT_TASKS: Final = 0b0010
+PERMISSION_EDIT: Final = 0b0100
+PERMISSION_MANAGE: Final = 0b1000
+
+ROLE_PERMISSIONS: Final[dict[str, int]] = {
+    ProjectRole.OWNER: (
+        PERMISSION_MANAGE | PERMISSION_EDIT | PERMISSION_EDIT_TASKS | PERMISSION_VIEW
+    ),
+    ProjectRole.MEMBER: PERMISSION_EDIT | PERMISSION_EDIT_TASKS | PERMISSION_VIEW,
+    ProjectRole.VIEWER: PERMISSION_VIEW,
+}
+
+
 # Создаем ENUM для SQLAlchemy
 ProjectStatusEnum = ENUM(
-    ProjectStatus.ACTIVE,
-    ProjectStatus.COMPLETED,
-    ProjectStatus.ARCHIVED,
-    ProjectStatus.ON_HOLD,
+    ProjectStatus.ACTIVE.value,
+    ProjectStatus.COMPLETED.value,
+    ProjectStatus.ARCHIVED.value,
+    ProjectStatus.ON_HOLD.value,
     name="projectstatus",
     create_type=True,  # Создаем тип автоматически
 )
 
 ProjectRoleEnum = ENUM(
-    ProjectRole.OWNER,
-    ProjectRole.MEMBER,
-    ProjectRole.VIEWER,
+    ProjectRole.OWNER.value,
+    ProjectRole.MEMBER.value,
+    ProjectRole.VIEWER.value,
     name="projectrole",
     create_type=True,  # Создаем тип автоматически
 )
 
 
+class ProjectMember(BaseModel):
+    """Модель участника проекта"""
+
+    __tablename__ = "project_members"
+    __table_args__ = (
+        # Покрывает выборку участников проекта и подсчет member_count по ролям
+        Index("ix_project_members_project_id_role", "project_id", "role"),
+    )
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id"),
+        nullable=False,
+        comment="ID проекта",
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id"),
+        nullable=False,
+        comment="ID пользователя",
+    )
+
+    role: Mapped[ProjectRole] = mapped_column(
+        ProjectRoleEnum,
+        default=ProjectRole.MEMBER,
+        nullable=False,
+        comment="Роль в проекте",
+    )
+
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        nullable=False,
+        comment="Активен ли участник",
+    )
+
+    invited_by_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id"),
+        nullable=True,
+        comment="Кто пригласил участника",
+    )
+
+    # Отношения
+    project = relationship(
+        "Project",
+        back_populates="members",
+    )
+
+    user = relationship(
+        "User",
+        foreign_keys=[user_id],
+        back_populates="project_memberships",
+    )
+
+    invited_by = relationship(
+        "User",
+        foreign_keys="ProjectMember.invited_by_id",
+    )
+
+    # Properties с правильной типизацией для mypy
+    @property
+    def status_str(self) -> str:
+        """Status как строка для схем"""
+        return "active" if self.is_active else "inactive"
+
+    @property
+    def role_str(self) -> str:
+        """Role как строка для схем"""
+        return str(self.role) if self.role else "member"
+
+    @property
+    def permissions(self) -> int:
+        """Битовая маска прав по роли"""
+        return ROLE_PERMISSIONS.get(self.role, 0)
+
+    @property
+    def can_manage_project(self) -> bool:
+        """Может ли управлять проектом"""
+        return bool(self.permissions & PERMISSION_MANAGE)
+
+    @property
+    def can_edit_project(self) -> bool:
+        """Может ли редактировать проект"""
+        return bool(self.permissions & PERMISSION_EDIT)
+
+    @property
+    def can_view_project(self) -> bool:
+        """Может ли просматривать проект"""
+        return bool(self.permissions & PERMISSION_VIEW)
+
+    @property
+    def can_edit_tasks(self) -> bool:
+        """Может ли редактировать задачи"""
+        return bool(self.permissions & PERMISSION_EDIT_TASKS)
+
+    def __repr__(self) -> str:
+        return f"<ProjectMember(user={self.user_id}, project={self.project_id}, role={self.role})>"
+
+
 class Project(BaseModel):
     """Модель проекта"""
 
@@ -92,9 +216,10 @@ class Project(BaseModel):
         comment="Разрешить внешний доступ",
     )
 
-    max_members: Mapped[str] = mapped_column(
-        String(10),
-        default="5",
+    max_members: Mapped[int] = mapped_column(
+        Integer,
+        default=5,
+        server_default="5",
         nullable=False,
         comment="Максимальное количество участников",
     )
@@ -135,111 +260,26 @@ class Project(BaseModel):
         cascade="all, delete-orphan",
     )
 
+    # Количество участников (без наблюдателей) считается в БД подзапросом.
+    # Отложено, чтобы не утяжелять списки проектов: включается через undefer()
+    @declared_attr
+    def member_count(cls) -> Mapped[int]:
+        """Количество участников проекта без наблюдателей"""
+        return column_property(
+            select(func.count(ProjectMember.id))
+            .where(
+                ProjectMember.project_id == cls.id,
+                ProjectMember.role != ProjectRole.VIEWER,
+            )
+            .correlate_except(ProjectMember)
+            .scalar_subquery(),
+            deferred=True,
+        )
+
     def __repr__(self) -> str:
         return f"<Project(name={self.name}, status={self.status})>"
 
-    @property
-    def member_count(self) -> int:
-        """Количество участников в проекте"""
-        return len([m for m in self.members if m.role != ProjectRole.VIEWER])
-
     @property
     def is_at_member_limit(self) -> bool:
         """Достигнут ли лимит участников"""
-        try:
-            max_limit = int(self.max_members)
-            return self.member_count >= max_limit
-        except (ValueError, TypeError):
-            return False
-
-
-class ProjectMember(BaseModel):
-    """Модель участника проекта"""
-
-    __tablename__ = "project_members"
-
-    project_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("projects.id"),
-        nullable=False,
-        comment="ID проекта",
-    )
-
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id"),
-        nullable=False,
-        comment="ID пользователя",
-    )
-
-    role: Mapped[ProjectRole] = mapped_column(
-        ProjectRoleEnum,
-        default=ProjectRole.MEMBER,
-        nullable=False,
-        comment="Роль в проекте",
-    )
-
-    is_active: Mapped[bool] = mapped_column(
-        Boolean,
-        default=True,
-        nullable=False,
-        comment="Активен ли участник",
-    )
-
-    invited_by_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id"),
-        nullable=True,
-        comment="Кто пригласил участника",
-    )
-
-    # Отношения
-    project = relationship(
-        "Project",
-        back_populates="members",
-    )
-
-    user = relationship(
-        "User",
-        foreign_keys=[user_id],
-        back_populates="project_memberships",
-    )
-
-    invited_by = relationship(
-        "User",
-        foreign_keys="ProjectMember.invited_by_id",
-    )
-
-    # Properties с правильной типизацией для mypy
-    @property
-    def status_str(self) -> str:
-        """Status как строка для схем"""
-        return "active" if self.is_active else "inactive"
-
-    @property
-    def role_str(self) -> str:
-        """Role как строка для схем"""
-        return str(self.role) if self.role else "member"
-
-    @property
-    def can_manage_project(self) -> bool:
-        """Может ли управлять проектом"""
-        return self.role == ProjectRole.OWNER
-
-    @property
-    def can_edit_project(self) -> bool:
-        """Может ли редактировать проект"""
-        return self.role in [ProjectRole.OWNER, ProjectRole.MEMBER]
-
-    @property
-    def can_view_project(self) -> bool:
-        """Может ли просматривать проект"""
-        return self.role in [ProjectRole.OWNER, ProjectRole.MEMBER, ProjectRole.VIEWER]
-
-    @property
-    def can_edit_tasks(self) -> bool:
-        """Может ли редактировать задачи"""
-        return self.role in [ProjectRole.OWNER, ProjectRole.MEMBER]
-
-    def __repr__(self) -> str:
-        return f"<ProjectMember(user={self.user_id}, project={self.project_id}, role={self.role})>"
+        return self.member_count >= self.max_members
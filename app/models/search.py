@@ -3,15 +3,17 @@
 """
 
 import uuid
+from enum import StrEnum
+from typing import Any
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import ENUM, TSVECTOR, UUID
+from sqlalchemy import Boolean, Computed, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import ENUM, JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
 
 
-class SearchableType(str):
+class SearchableType(StrEnum):
     """Типы сущностей для поиска"""
 
     TASK = "task"
@@ -19,30 +21,49 @@ class SearchableType(str):
     SPRINT = "sprint"
     COMMENT = "comment"
 
-    # Допустимые значения
-    _VALID_VALUES = {TASK, PROJECT, SPRINT, COMMENT}
-
-    def __new__(cls, value):
-        if value not in cls._VALID_VALUES:
-            raise ValueError(f"Invalid searchable type: {value}")
-        return super().__new__(cls, value)
+    @classmethod
+    def validate(cls, value: str) -> "SearchableType":
+        """Проверить тип сущности на границе API (ValueError для неизвестных)"""
+        return cls(value)
 
 
 # Создаем ENUM для SQLAlchemy
 SearchableTypeEnum = ENUM(
-    SearchableType.TASK,
-    SearchableType.PROJECT,
-    SearchableType.SPRINT,
-    SearchableType.COMMENT,
+    SearchableType.TASK.value,
+    SearchableType.PROJECT.value,
+    SearchableType.SPRINT.value,
+    SearchableType.COMMENT.value,
     name="searchabletype",
     create_type=True,
 )
 
+# Выражение генерируемой колонки search_vector
+SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector('russian', coalesce(title, '') || ' ' || coalesce(content, ''))"
+)
+
 
 class SearchIndex(BaseModel):
     """Индекс для полнотекстового поиска"""
 
     __tablename__ = "search_index"
+    __table_args__ = (
+        # GIN-индекс для полнотекстового поиска (@@) по search_vector
+        Index("ix_search_index_search_vector", "search_vector", postgresql_using="gin"),
+        # Одна запись индекса на сущность: покрывает поиск при переиндексации
+        Index(
+            "ix_search_index_entity",
+            "entity_type",
+            "entity_id",
+            unique=True,
+        ),
+        # Поиск внутри проектов: записи без проекта в индекс не попадают
+        Index(
+            "ix_search_index_project_id",
+            "project_id",
+            postgresql_where=text("project_id IS NOT NULL"),
+        ),
+    )
 
     # Основные поля
     title: Mapped[str] = mapped_column(
@@ -57,9 +78,11 @@ class SearchIndex(BaseModel):
         comment="Содержимое для поиска",
     )
 
-    # Полнотекстовый вектор для PostgreSQL
+    # Полнотекстовый вектор для PostgreSQL: генерируемая колонка,
+    # вычисляется самой БД при вставке и обновлении title/content
     search_vector: Mapped[str] = mapped_column(
         TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
         nullable=False,
         comment="Полнотекстовый вектор",
     )
@@ -98,8 +121,8 @@ class SearchIndex(BaseModel):
     )
 
     # Дополнительные метаданные в JSON
-    search_metadata: Mapped[str | None] = mapped_column(
-        Text,
+    search_metadata: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB(none_as_null=True),
         nullable=True,
         comment="Дополнительные метаданные в JSON",
     )
@@ -125,8 +148,8 @@ class SavedSearch(BaseModel):
         comment="Поисковый запрос",
     )
 
-    filters: Mapped[str | None] = mapped_column(
-        Text,
+    filters: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB(none_as_null=True),
         nullable=True,
         comment="Фильтры в JSON",
     )
@@ -153,7 +176,3 @@ class SavedSearch(BaseModel):
 
     def __repr__(self) -> str:
         return f"<SavedSearch(name={self.name}, user_id={self.user_id})>"
-
-
-# Триггеры для автоматического обновления search_vector
-# Это будет добавлено через миграции Alembic
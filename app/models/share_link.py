@@ -2,13 +2,25 @@
 Модель публичных ссылок для External Sharing
 """
 
+import uuid
 from datetime import UTC, datetime
+from enum import StrEnum
 
 # Импортируем для type hints, но избегаем циклических импортов
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    ForeignKey,
+    String,
+    Text,
+    and_,
+    func,
+    or_,
+)
 from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -17,7 +29,7 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
-class ShareableType(str):
+class ShareableType(StrEnum):
     """Типы объектов для шаринга"""
 
     PROJECT = "project"
@@ -25,7 +37,7 @@ class ShareableType(str):
     SPRINT = "sprint"
 
 
-class SharePermission(str):
+class SharePermission(StrEnum):
     """Уровни доступа для публичных ссылок"""
 
     VIEW = "view"  # Только просмотр
@@ -34,16 +46,16 @@ class SharePermission(str):
 
 # Создаем ENUM для SQLAlchemy
 ShareableTypeEnum = ENUM(
-    ShareableType.PROJECT,
-    ShareableType.TASK,
-    ShareableType.SPRINT,
+    ShareableType.PROJECT.value,
+    ShareableType.TASK.value,
+    ShareableType.SPRINT.value,
     name="shareabletype",
     create_type=True,
 )
 
 SharePermissionEnum = ENUM(
-    SharePermission.VIEW,
-    SharePermission.COMMENT,
+    SharePermission.VIEW.value,
+    SharePermission.COMMENT.value,
     name="sharepermission",
     create_type=True,
 )
@@ -58,11 +70,13 @@ class ShareLink(BaseModel):
     token: Mapped[str] = mapped_column(
         String(64), unique=True, nullable=False, index=True
     )
-    shareable_type: Mapped[str] = mapped_column(ShareableTypeEnum, nullable=False)
-    shareable_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    shareable_type: Mapped[ShareableType] = mapped_column(
+        ShareableTypeEnum, nullable=False
+    )
+    shareable_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
 
     # Настройки доступа
-    permission: Mapped[str] = mapped_column(
+    permission: Mapped[SharePermission] = mapped_column(
         SharePermissionEnum, nullable=False, default=SharePermission.VIEW
     )
     password: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -80,32 +94,60 @@ class ShareLink(BaseModel):
     # Метаданные
     title: Mapped[str | None] = mapped_column(String(255), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_by: Mapped[UUID] = mapped_column(
+    created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
 
     # Отношения
     creator: Mapped["User"] = relationship("User", back_populates="created_share_links")
 
-    @property
+    @hybrid_property
     def is_expired(self) -> bool:
         """Проверить, истекла ли ссылка."""
         if not self.expires_at:
             return False
         return datetime.now(UTC) > self.expires_at
 
-    @property
+    @is_expired.inplace.expression
+    @classmethod
+    def _is_expired_expression(cls) -> ColumnElement[bool]:
+        """SQL-выражение is_expired для фильтрации на стороне БД."""
+        return and_(cls.expires_at.is_not(None), cls.expires_at < func.now())
+
+    @hybrid_property
     def is_view_limit_exceeded(self) -> bool:
         """Проверить, превышен ли лимит просмотров."""
         if not self.max_views:
             return False
         return self.current_views >= self.max_views
 
-    @property
+    @is_view_limit_exceeded.inplace.expression
+    @classmethod
+    def _is_view_limit_exceeded_expression(cls) -> ColumnElement[bool]:
+        """SQL-выражение is_view_limit_exceeded."""
+        return and_(cls.max_views.is_not(None), cls.current_views >= cls.max_views)
+
+    @hybrid_property
     def is_accessible(self) -> bool:
-        """Проверить, доступна ли ссылка."""
-        return (
-            self.is_active and not self.is_expired and not self.is_view_limit_exceeded
+        """Проверить, доступна ли ссылка.
+
+        Условия проверены в одном месте от дешевого к дорогому: часы
+        читаются только для ссылок со сроком действия.
+        """
+        if not self.is_active:
+            return False
+        if self.expires_at and datetime.now(UTC) > self.expires_at:
+            return False
+        return not self.max_views or self.current_views < self.max_views
+
+    @is_accessible.inplace.expression
+    @classmethod
+    def _is_accessible_expression(cls) -> ColumnElement[bool]:
+        """SQL-выражение is_accessible без вложенных NOT."""
+        return and_(
+            cls.is_active.is_(True),
+            or_(cls.expires_at.is_(None), cls.expires_at >= func.now()),
+            or_(cls.max_views.is_(None), cls.current_views < cls.max_views),
         )
 
     def increment_views(self) -> None:
@@ -129,13 +171,13 @@ class ShareLink(BaseModel):
     def to_dict(self) -> dict:
         """Преобразовать в словарь."""
         return {
-            "id": str(self.id),
+            "id": self.id,
             "token": self.token,
             "shareable_type": self.shareable_type,
-            "shareable_id": str(self.shareable_id),
+            "shareable_id": self.shareable_id,
             "permission": self.permission,
             "has_password": bool(self.password),
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "expires_at": self.expires_at,
             "max_views": self.max_views,
             "current_views": self.current_views,
             "is_active": self.is_active,
@@ -144,8 +186,8 @@ class ShareLink(BaseModel):
             "is_accessible": self.is_accessible,
             "title": self.title,
             "description": self.description,
-            "created_by": str(self.created_by),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_by": self.created_by,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
             "public_url": self.get_public_url(),
         }
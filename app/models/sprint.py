@@ -4,15 +4,23 @@
 
 import uuid
 from datetime import datetime
+from enum import StrEnum
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Text, func, select
 from sqlalchemy.dialects.postgresql import ENUM, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    column_property,
+    declared_attr,
+    mapped_column,
+    relationship,
+)
 
 from app.models.base import BaseModel
+from app.models.task import Task, TaskStatus
 
 
-class SprintStatus(str):
+class SprintStatus(StrEnum):
     """Статусы спринта"""
 
     PLANNING = "planning"
@@ -23,15 +31,63 @@ class SprintStatus(str):
 
 # Создаем ENUM для SQLAlchemy
 SprintStatusEnum = ENUM(
-    SprintStatus.PLANNING,
-    SprintStatus.ACTIVE,
-    SprintStatus.COMPLETED,
-    SprintStatus.CANCELLED,
+    SprintStatus.PLANNING.value,
+    SprintStatus.ACTIVE.value,
+    SprintStatus.COMPLETED.value,
+    SprintStatus.CANCELLED.value,
     name="sprintstatus",
     create_type=True,  # Создаем тип автоматически
 )
 
 
+class SprintTask(BaseModel):
+    """Связь между спринтом и задачей"""
+
+    __tablename__ = "sprint_tasks"
+
+    sprint_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("sprints.id"),
+        nullable=False,
+        comment="ID спринта",
+    )
+
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id"),
+        nullable=False,
+        comment="ID задачи",
+    )
+
+    order: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Порядок задачи в спринте",
+    )
+
+    is_added_mid_sprint: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        nullable=False,
+        comment="Добавлена ли задача в середине спринта",
+    )
+
+    # Отношения
+    sprint = relationship(
+        "Sprint",
+        back_populates="sprint_tasks",
+    )
+
+    task = relationship(
+        "Task",
+        back_populates="sprint_tasks",
+    )
+
+    def __repr__(self) -> str:
+        return f"<SprintTask(sprint_id={self.sprint_id}, task_id={self.task_id})>"
+
+
 class Sprint(BaseModel):
     """Модель спринта"""
 
@@ -124,6 +180,31 @@ class Sprint(BaseModel):
         cascade="all, delete-orphan",
     )
 
+    # Счетчики задач считаются в БД коррелированными подзапросами.
+    # Отложены, чтобы не утяжелять списки спринтов: включаются через undefer()
+    @declared_attr
+    def task_count(cls) -> Mapped[int]:
+        """Количество задач в спринте"""
+        return column_property(
+            select(func.count(SprintTask.id))
+            .where(SprintTask.sprint_id == cls.id)
+            .correlate_except(SprintTask)
+            .scalar_subquery(),
+            deferred=True,
+        )
+
+    @declared_attr
+    def completed_task_count(cls) -> Mapped[int]:
+        """Количество выполненных задач в спринте"""
+        return column_property(
+            select(func.count(SprintTask.id))
+            .join(Task, Task.id == SprintTask.task_id)
+            .where(SprintTask.sprint_id == cls.id, Task.status == TaskStatus.DONE)
+            .correlate_except(SprintTask, Task)
+            .scalar_subquery(),
+            deferred=True,
+        )
+
     def __repr__(self) -> str:
         return f"<Sprint(name={self.name}, status={self.status})>"
 
@@ -145,61 +226,3 @@ class Sprint(BaseModel):
         if self.velocity_points is None or self.velocity_points == 0:
             return 0.0
         return (self.completed_points / self.velocity_points) * 100
-
-    @property
-    def task_count(self) -> int:
-        """Количество задач в спринте"""
-        return len(self.sprint_tasks)
-
-    @property
-    def completed_task_count(self) -> int:
-        """Количество выполненных задач в спринте"""
-        return len([st for st in self.sprint_tasks if st.task.status == "done"])
-
-
-class SprintTask(BaseModel):
-    """Связь между спринтом и задачей"""
-
-    __tablename__ = "sprint_tasks"
-
-    sprint_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("sprints.id"),
-        nullable=False,
-        comment="ID спринта",
-    )
-
-    task_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("tasks.id"),
-        nullable=False,
-        comment="ID задачи",
-    )
-
-    order: Mapped[int] = mapped_column(
-        Integer,
-        default=0,
-        nullable=False,
-        comment="Порядок задачи в спринте",
-    )
-
-    is_added_mid_sprint: Mapped[bool] = mapped_column(
-        Boolean,
-        default=False,
-        nullable=False,
-        comment="Добавлена ли задача в середине спринта",
-    )
-
-    # Отношения
-    sprint = relationship(
-        "Sprint",
-        back_populates="sprint_tasks",
-    )
-
-    task = relationship(
-        "Task",
-        back_populates="sprint_tasks",
-    )
-
-    def __repr__(self) -> str:
-        return f"<SprintTask(sprint_id={self.sprint_id}, task_id={self.task_id})>"
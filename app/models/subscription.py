@@ -3,11 +3,24 @@
 """
 
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
+from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING
-
-from sqlalchemy import UUID, Boolean, DateTime, ForeignKey, Integer, String, Text
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -40,6 +53,10 @@ class UserSubscription(BaseModel):
     """Подписка пользователя"""
 
     __tablename__ = "user_subscriptions"
+    __table_args__ = (
+        # Активная подписка пользователя проверяется на каждый запрос лимитов
+        Index("ix_user_subscriptions_user_active", "user_id", "is_active"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -50,25 +67,18 @@ class UserSubscription(BaseModel):
     storage_limit: Mapped[int] = mapped_column(Integer, nullable=False)  # в байтах
     file_count_limit: Mapped[int] = mapped_column(Integer, nullable=False)
     max_file_size: Mapped[int] = mapped_column(Integer, nullable=False)  # в байтах
-    allowed_file_types: Mapped[str] = mapped_column(Text, nullable=False)  # JSON
+    allowed_file_types: Mapped[list[str]] = mapped_column(JSONB, nullable=False)
     projects_limit: Mapped[int] = mapped_column(Integer, nullable=False)
     users_limit: Mapped[int] = mapped_column(Integer, nullable=False)
 
     # Статус
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(UTC), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(UTC), onupdate=datetime.now(UTC), nullable=False
-    )
 
     # Отношения
-    if TYPE_CHECKING:
-        user: Mapped["User"] = relationship("User", back_populates="subscription")
-    else:
-        user: Mapped[any] = relationship("User", back_populates="subscription")
+    user: Mapped["User"] = relationship(
+        "User", back_populates="subscription", lazy="raise_on_sql"
+    )
 
     def __repr__(self) -> str:
         return f"<UserSubscription(user_id={self.user_id}, plan={self.plan})>"
@@ -78,6 +88,15 @@ class AddOnPackage(BaseModel):
     """Пакеты дополнений"""
 
     __tablename__ = "addon_packages"
+    __table_args__ = (
+        # GIN-индекс для выборки пакетов по содержимому features (@>)
+        Index(
+            "ix_addon_packages_features_gin",
+            "features",
+            postgresql_using="gin",
+            postgresql_ops={"features": "jsonb_path_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     type: Mapped[AddOnType] = mapped_column(String(20), nullable=False)
@@ -85,13 +104,10 @@ class AddOnPackage(BaseModel):
     billing_cycle: Mapped[str] = mapped_column(
         String(20), default="monthly", nullable=False
     )
-    features: Mapped[str] = mapped_column(Text, nullable=False)  # JSON с параметрами
+    features: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(UTC), nullable=False
-    )
 
     def __repr__(self) -> str:
         return f"<AddOnPackage(name={self.name}, type={self.type}, price=${self.price/100})>"
@@ -101,6 +117,10 @@ class UserAddOn(BaseModel):
     """Купленные пакеты пользователей"""
 
     __tablename__ = "user_addons"
+    __table_args__ = (
+        # Пакеты ищутся по пользователю и конкретному пакету
+        Index("ix_user_addons_user_package", "user_id", "package_id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -113,25 +133,23 @@ class UserAddOn(BaseModel):
 
     # Статус покупки
     purchased_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(UTC), nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     auto_renew: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Использование
-    usage_data: Mapped[str] = mapped_column(
-        Text, nullable=True
-    )  # JSON с текущим использованием
-    last_usage_update: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    usage_data: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB(none_as_null=True), nullable=True
+    )
+    last_usage_update: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # Отношения
-    if TYPE_CHECKING:
-        user: Mapped["User"] = relationship("User")
-        package: Mapped[AddOnPackage] = relationship("AddOnPackage")
-    else:
-        user: Mapped[any] = relationship("User")
-        package: Mapped[any] = relationship("AddOnPackage")
+    user: Mapped["User"] = relationship("User", lazy="raise_on_sql")
+    package: Mapped[AddOnPackage] = relationship("AddOnPackage", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
         return f"<UserAddOn(user_id={self.user_id}, package_id={self.package_id})>"
@@ -141,11 +159,15 @@ class UsageTracker(BaseModel):
     """Трекер использования ресурсов"""
 
     __tablename__ = "usage_tracker"
+    __table_args__ = (
+        # Использование за день и за период: равенство по user_id, диапазон по date
+        Index("ix_usage_tracker_user_date", "user_id", "date"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     # Использование ресурсов
     storage_used: Mapped[int] = mapped_column(
@@ -158,19 +180,8 @@ class UsageTracker(BaseModel):
     video_uploads: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     audio_uploads: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
-    # Метаданные
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now, nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now, onupdate=datetime.now, nullable=False
-    )
-
     # Отношения
-    if TYPE_CHECKING:
-        user: Mapped["User"] = relationship("User")
-    else:
-        user: Mapped[any] = relationship("User")
+    user: Mapped["User"] = relationship("User", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
         return f"<UsageTracker(user_id={self.user_id}, date={self.date})>"
@@ -180,6 +191,10 @@ class BillingTransaction(BaseModel):
     """Транзакции биллинга"""
 
     __tablename__ = "billing_transactions"
+    __table_args__ = (
+        # История транзакций пользователя по дате
+        Index("ix_billing_transactions_user_created", "user_id", "created_at"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -189,7 +204,9 @@ class BillingTransaction(BaseModel):
     )
 
     # Детали транзакции
-    amount: Mapped[int] = mapped_column(Integer, nullable=False)  # в центах
+    # Точная десятичная сумма в единицах валюты (не центы): SUM(amount)
+    # и отчеты работают с Decimal без деления и плавающей точки
+    amount: Mapped[Decimal] = mapped_column(Numeric(19, 4), nullable=False)
     currency: Mapped[str] = mapped_column(String(3), default="USD", nullable=False)
     status: Mapped[str] = mapped_column(
         String(20), nullable=False
@@ -204,19 +221,13 @@ class BillingTransaction(BaseModel):
         UUID(as_uuid=True), nullable=True
     )  # subscription_id, addon_id
 
-    # Время
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(UTC), nullable=False
+    # Время (created_at - из BaseModel)
+    processed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
     )
-    processed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
 
     # Отношения
-    if TYPE_CHECKING:
-        user: Mapped["User"] = relationship("User")
-    else:
-        user: Mapped[any] = relationship("User")
+    user: Mapped["User"] = relationship("User", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
-        return (
-            f"<BillingTransaction(id={self.transaction_id}, amount=${self.amount/100})>"
-        )
+        return f"<BillingTransaction(id={self.transaction_id}, amount=${self.amount})>"
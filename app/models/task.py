@@ -3,15 +3,41 @@
 """
 
 import uuid
-
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
+from datetime import date
+from enum import StrEnum
+
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    Date,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    and_,
+    case,
+    cast,
+    func,
+    select,
+)
 from sqlalchemy.dialects.postgresql import ENUM, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import (
+    Mapped,
+    aliased,
+    column_property,
+    declared_attr,
+    mapped_column,
+    relationship,
+)
 
 from app.models.base import BaseModel
+from app.models.time_entry import TimeEntry
 
 
-class TaskStatus(str):
+class TaskStatus(StrEnum):
     """Статусы задач"""
 
     TODO = "todo"
@@ -21,7 +47,7 @@ class TaskStatus(str):
     BLOCKED = "blocked"
 
 
-class TaskPriority(str):
+class TaskPriority(StrEnum):
     """Приоритеты задач"""
 
     LOW = "low"
@@ -30,7 +56,7 @@ class TaskPriority(str):
     URGENT = "urgent"
 
 
-class StoryPoint(str):
+class StoryPoint(StrEnum):
     """Story Points для оценки задач"""
 
     ONE = "1"
@@ -45,33 +71,33 @@ class StoryPoint(str):
 
 # Создаем ENUM для SQLAlchemy
 TaskStatusEnum = ENUM(
-    TaskStatus.TODO,
-    TaskStatus.IN_PROGRESS,
-    TaskStatus.IN_REVIEW,
-    TaskStatus.DONE,
-    TaskStatus.BLOCKED,
+    TaskStatus.TODO.value,
+    TaskStatus.IN_PROGRESS.value,
+    TaskStatus.IN_REVIEW.value,
+    TaskStatus.DONE.value,
+    TaskStatus.BLOCKED.value,
     name="taskstatus",
     create_type=True,  # Создаем тип автоматически
 )
 
 TaskPriorityEnum = ENUM(
-    TaskPriority.LOW,
-    TaskPriority.MEDIUM,
-    TaskPriority.HIGH,
-    TaskPriority.URGENT,
+    TaskPriority.LOW.value,
+    TaskPriority.MEDIUM.value,
+    TaskPriority.HIGH.value,
+    TaskPriority.URGENT.value,
     name="taskpriority",
     create_type=True,  # Создаем тип автоматически
 )
 
 StoryPointEnum = ENUM(
-    StoryPoint.ONE,
-    StoryPoint.TWO,
-    StoryPoint.THREE,
-    StoryPoint.FIVE,
-    StoryPoint.EIGHT,
-    StoryPoint.THIRTEEN,
-    StoryPoint.TWENTY_ONE,
-    StoryPoint.UNKNOWN,
+    StoryPoint.ONE.value,
+    StoryPoint.TWO.value,
+    StoryPoint.THREE.value,
+    StoryPoint.FIVE.value,
+    StoryPoint.EIGHT.value,
+    StoryPoint.THIRTEEN.value,
+    StoryPoint.TWENTY_ONE.value,
+    StoryPoint.UNKNOWN.value,
     name="storypoint",
     create_type=True,  # Создаем тип автоматически
 )
@@ -81,6 +107,12 @@ class Task(BaseModel):
     """Модель задачи"""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Доска проекта и статистика: фильтр по проекту и статусу
+        Index("ix_tasks_project_status", "project_id", "status"),
+        # Задачи исполнителя без архивных
+        Index("ix_tasks_assignee_archived", "assignee_id", "is_archived"),
+    )
 
     title: Mapped[str] = mapped_column(
         String(255),
@@ -150,9 +182,10 @@ class Task(BaseModel):
         comment="ID родительской задачи",
     )
 
-    due_date: Mapped[str | None] = mapped_column(
-        String(20),  # ISO date string
+    due_date: Mapped[date | None] = mapped_column(
+        Date,
         nullable=True,
+        index=True,
         comment="Срок выполнения",
     )
 
@@ -162,13 +195,6 @@ class Task(BaseModel):
         comment="Оценка времени в часах",
     )
 
-    actual_hours: Mapped[int] = mapped_column(
-        Integer,
-        default=0,
-        nullable=False,
-        comment="Фактическое время в часах",
-    )
-
     is_archived: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
@@ -176,52 +202,68 @@ class Task(BaseModel):
         comment="Архивирована ли задача",
     )
 
-    # Отношения
+    # Отношения. lazy="raise_on_sql": неявная подгрузка в async-коде не работает,
+    # поэтому связи загружаются явно (selectinload / refresh), а случайный
+    # ленивый SELECT (N+1) сразу дает понятную ошибку
     project = relationship(
         "Project",
         back_populates="tasks",
+        lazy="raise_on_sql",
     )
 
     creator = relationship(
         "User",
         foreign_keys=[creator_id],
         back_populates="created_tasks",
+        lazy="raise_on_sql",
     )
 
     assignee = relationship(
         "User",
         foreign_keys=[assignee_id],
         back_populates="assigned_tasks",
+        lazy="raise_on_sql",
     )
 
     parent_task = relationship(
         "Task",
         remote_side="Task.id",
-        backref="subtasks",
+        back_populates="subtasks",
+        lazy="raise_on_sql",
+    )
+
+    subtasks = relationship(
+        "Task",
+        back_populates="parent_task",
+        lazy="raise_on_sql",
     )
 
     comments = relationship(
         "Comment",
         back_populates="task",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     time_entries = relationship(
         "TimeEntry",
         back_populates="task",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     sprint_tasks = relationship(
         "SprintTask",
         back_populates="task",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     notifications = relationship(
         "Notification",
         back_populates="task",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     def __repr__(self) -> str:
@@ -244,38 +286,80 @@ class Task(BaseModel):
 
     @property
     def has_subtasks(self) -> bool:
-        """Есть ли подзадачи"""
-        # Используем backref relationship для mypy
-        subtasks = getattr(self, "subtasks", [])
-        return len(subtasks) > 0
+        """Есть ли подзадачи.
 
-    @property
+        Требует загруженных subtasks (selectinload(Task.subtasks) или refresh).
+        """
+        return len(self.subtasks) > 0
+
+    @hybrid_property
     def completion_percentage(self) -> float:
-        """Процент выполнения"""
-        if not self.has_subtasks:
+        """Процент выполнения (требует загруженных subtasks)"""
+        subtasks = self.subtasks
+        if not subtasks:
             return 100.0 if self.status == TaskStatus.DONE else 0.0
 
         completed_subtasks = sum(
-            1
-            for subtask in getattr(self, "subtasks", [])
-            if subtask.status == TaskStatus.DONE
+            1 for subtask in subtasks if subtask.status == TaskStatus.DONE
+        )
+        return (completed_subtasks / len(subtasks)) * 100
+
+    @completion_percentage.inplace.expression
+    @classmethod
+    def _completion_percentage_expression(cls) -> ColumnElement[float]:
+        """SQL-выражение completion_percentage: один агрегат по подзадачам.
+
+        Подзадачи не загружаются в Python; без подзадач результат, как и в
+        Python-версии, зависит от статуса самой задачи.
+        """
+        subtask = aliased(cls)
+        done_count = func.count().filter(subtask.status == TaskStatus.DONE)
+        percentage = (
+            select(cast(done_count * 100.0 / func.nullif(func.count(), 0), Float))
+            .where(subtask.parent_task_id == cls.id)
+            .correlate_except(subtask)
+            .scalar_subquery()
+        )
+        own_percentage = case((cls.status == TaskStatus.DONE, 100.0), else_=0.0)
+        return func.coalesce(percentage, own_percentage)
+
+    @declared_attr
+    def actual_minutes(cls) -> Mapped[int]:
+        """Фактическое время по записям времени задачи.
+
+        Сумма по time_entries загружается вместе с задачей, поэтому не
+        расходится с записями, не требует отдельной записи в задачу при
+        остановке таймера и не вызывает ленивой загрузки при сериализации.
+        """
+        return column_property(
+            select(func.coalesce(func.sum(TimeEntry.duration_minutes), 0))
+            .where(TimeEntry.task_id == cls.id)
+            .correlate_except(TimeEntry)
+            .scalar_subquery()
         )
-        subtasks_list = getattr(self, "subtasks", [])
-        return (completed_subtasks / len(subtasks_list)) * 100 if subtasks_list else 0.0
 
-    @property
+    @hybrid_property
     def is_overdue(self) -> bool:
         """Просрочена ли задача"""
-        if not self.due_date or self.status == TaskStatus.DONE:
+        if self.due_date is None or self.status == TaskStatus.DONE:
             return False
-        # TODO: добавить проверку даты
-        return False
+        return self.due_date < date.today()
+
+    @is_overdue.inplace.expression
+    @classmethod
+    def _is_overdue_expression(cls) -> ColumnElement[bool]:
+        """SQL-выражение is_overdue: диапазон по индексу due_date"""
+        return and_(cls.due_date < func.current_date(), cls.status != TaskStatus.DONE)
 
 
 class Comment(BaseModel):
     """Модель комментария к задаче"""
 
     __tablename__ = "comments"
+    __table_args__ = (
+        # Комментарии задачи выводятся по дате создания
+        Index("ix_comments_task_created", "task_id", "created_at"),
+    )
 
     content: Mapped[str] = mapped_column(
         Text,
@@ -308,11 +392,13 @@ class Comment(BaseModel):
     task = relationship(
         "Task",
         back_populates="comments",
+        lazy="raise_on_sql",
     )
 
     author = relationship(
         "User",
         back_populates="comments",
+        lazy="raise_on_sql",
     )
 
     def __repr__(self) -> str:
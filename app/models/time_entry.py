@@ -5,17 +5,28 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
 
+# Длительность считается самой БД из start_time/end_time (полные минуты);
+# пока таймер не остановлен (end_time IS NULL), она NULL
+DURATION_MINUTES_EXPRESSION = (
+    "FLOOR(EXTRACT(EPOCH FROM (end_time - start_time)) / 60)::integer"
+)
+
 
 class TimeEntry(BaseModel):
     """Модель записи времени"""
 
     __tablename__ = "time_entries"
+    __table_args__ = (
+        # Записи пользователя за период
+        Index("ix_time_entries_user_start", "user_id", "start_time"),
+        Index("ix_time_entries_task_id", "task_id"),
+    )
 
     description: Mapped[str | None] = mapped_column(
         Text,
@@ -37,6 +48,7 @@ class TimeEntry(BaseModel):
 
     duration_minutes: Mapped[int | None] = mapped_column(
         Integer,
+        Computed(DURATION_MINUTES_EXPRESSION, persisted=True),
         nullable=True,
         comment="Длительность в минутах",
     )
@@ -66,11 +78,13 @@ class TimeEntry(BaseModel):
     user = relationship(
         "User",
         back_populates="time_entries",
+        lazy="raise_on_sql",
     )
 
     task = relationship(
         "Task",
         back_populates="time_entries",
+        lazy="raise_on_sql",
     )
 
     def __repr__(self) -> str:
@@ -94,12 +108,7 @@ class TimeEntry(BaseModel):
         return f"{hours:02d}:{minutes:02d}"
 
     def stop_timer(self) -> None:
-        """Остановить таймер"""
+        """Остановить таймер (duration_minutes пересчитает БД)"""
         if self.is_active and self.end_time is None:
-            from datetime import datetime
-
             self.end_time = datetime.now(UTC)
-            if self.start_time:
-                duration = self.end_time - self.start_time
-                self.duration_minutes = int(duration.total_seconds() / 60)
             self.is_active = False
@@ -3,6 +3,7 @@
 """
 
 from datetime import datetime
+from enum import StrEnum
 
 from sqlalchemy import Boolean, DateTime, String
 from sqlalchemy.dialects.postgresql import ENUM
@@ -11,7 +12,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
 
-class UserRole(str):
+class UserRole(StrEnum):
     """Роли пользователя в системе"""
 
     ADMIN = "ADMIN"
@@ -20,8 +21,8 @@ class UserRole(str):
 
 # Создаем ENUM для SQLAlchemy
 UserRoleEnum = ENUM(
-    UserRole.ADMIN,
-    UserRole.USER,
+    UserRole.ADMIN.value,
+    UserRole.USER.value,
     name="userrole",
     create_type=True,  # Создаем тип автоматически
 )
@@ -107,11 +108,12 @@ class User(BaseModel):
         comment="Последний вход в систему",
     )
 
-    # Отношения
+    # Отношения: только явная загрузка (см. Task), ленивый SELECT запрещен
     owned_projects = relationship(
         "Project",
         back_populates="owner",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     project_memberships = relationship(
@@ -119,36 +121,42 @@ class User(BaseModel):
         foreign_keys="ProjectMember.user_id",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     assigned_tasks = relationship(
         "Task",
         back_populates="assignee",
         foreign_keys="Task.assignee_id",
+        lazy="raise_on_sql",
     )
 
     created_tasks = relationship(
         "Task",
         back_populates="creator",
         foreign_keys="Task.creator_id",
+        lazy="raise_on_sql",
     )
 
     comments = relationship(
         "Comment",
         back_populates="author",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     created_share_links = relationship(
         "ShareLink",
         back_populates="creator",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     saved_searches = relationship(
         "SavedSearch",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     notifications = relationship(
@@ -156,6 +164,7 @@ class User(BaseModel):
         foreign_keys="Notification.user_id",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     sent_notifications = relationship(
@@ -163,78 +172,37 @@ class User(BaseModel):
         foreign_keys="Notification.sender_id",
         back_populates="sender",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     analytics_events = relationship(
         "AnalyticsEvent",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     metrics = relationship(
         "UserMetrics",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     dashboards = relationship(
         "Dashboard",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     analytics_reports = relationship(
         "AnalyticsReport",
         back_populates="creator",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
-    # Properties с правильной типизацией для mypy
-    @property
-    def id_str(self) -> str:
-        """ID как строка для схем"""
-        return str(self.id)
-
-    @property
-    def email_str(self) -> str:
-        """Email как строка для схем"""
-        return self.email
-
-    @property
-    def username_str(self) -> str | None:
-        """Username как строка для схем"""
-        return self.username
-
-    @property
-    def full_name_str(self) -> str | None:
-        """Full name как строка для схем"""
-        return self.full_name
-
-    @property
-    def avatar_url_str(self) -> str | None:
-        """Avatar URL как строка для схем"""
-        return self.avatar_url
-
-    @property
-    def is_active_bool(self) -> bool:
-        """Is active как bool для схем"""
-        return self.is_active
-
-    @property
-    def is_verified_bool(self) -> bool:
-        """Is verified как bool для схем"""
-        return self.is_verified
-
-    @property
-    def github_id_str(self) -> str | None:
-        """GitHub ID как строка для схем"""
-        return self.github_id
-
-    @property
-    def github_username_str(self) -> str | None:
-        """GitHub username как строка для схем"""
-        return self.github_username
-
     @property
     def is_superuser(self) -> bool:
         """Проверка на суперпользователя"""
@@ -244,6 +212,7 @@ class User(BaseModel):
         "TimeEntry",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
 
     subscription = relationship(
@@ -251,6 +220,7 @@ class User(BaseModel):
         back_populates="user",
         cascade="all, delete-orphan",
         uselist=False,
+        lazy="raise_on_sql",
     )
 
     def __repr__(self) -> str:
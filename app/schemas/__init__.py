@@ -2,30 +2,73 @@
 Pydantic схемы для API
 """
 
-from .auth import LoginRequest, Token, TokenData
-from .notification import (
-    NotificationCreate,
-    NotificationFactory,
-    NotificationList,
-    NotificationMarkRead,
-    NotificationPreferences,
-    NotificationRead,
-    NotificationStats,
-    NotificationUpdate,
-    TaskAssignedNotification,
-    TaskCompletedNotification,
-)
-from .project import (
-    Project,
-    ProjectCreate,
-    ProjectMember,
-    ProjectMemberCreate,
-    ProjectUpdate,
-)
-from .sprint import Sprint, SprintCreate, SprintTask, SprintUpdate
-from .task import Comment, CommentCreate, Task, TaskCreate, TaskUpdate
-from .time_entry import TimeEntry, TimeEntryCreate, TimeEntryUpdate
-from .user import User, UserCreate, UserInDB, UserUpdate
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .auth import LoginRequest, Token, TokenData
+    from .notification import (
+        NotificationCreate,
+        NotificationFactory,
+        NotificationList,
+        NotificationMarkRead,
+        NotificationPreferences,
+        NotificationRead,
+        NotificationStats,
+        NotificationUpdate,
+        TaskAssignedNotification,
+        TaskCompletedNotification,
+    )
+    from .project import (
+        Project,
+        ProjectCreate,
+        ProjectMember,
+        ProjectMemberCreate,
+        ProjectUpdate,
+    )
+    from .sprint import Sprint, SprintCreate, SprintTask, SprintUpdate
+    from .task import Comment, CommentCreate, Task, TaskCreate, TaskUpdate
+    from .time_entry import TimeEntry, TimeEntryCreate, TimeEntryUpdate
+    from .user import User, UserCreate, UserInDB, UserUpdate
+
+# Схемы импортируются лениво (PEP 562): импорт app.schemas.<модуль> или
+# одной схемы не тянет за собой построение всех Pydantic-классов пакета
+_LAZY_IMPORTS: dict[str, str] = {
+    "User": ".user",
+    "UserCreate": ".user",
+    "UserUpdate": ".user",
+    "UserInDB": ".user",
+    "Project": ".project",
+    "ProjectCreate": ".project",
+    "ProjectUpdate": ".project",
+    "ProjectMember": ".project",
+    "ProjectMemberCreate": ".project",
+    "Task": ".task",
+    "TaskCreate": ".task",
+    "TaskUpdate": ".task",
+    "Comment": ".task",
+    "CommentCreate": ".task",
+    "Sprint": ".sprint",
+    "SprintCreate": ".sprint",
+    "SprintUpdate": ".sprint",
+    "SprintTask": ".sprint",
+    "TimeEntry": ".time_entry",
+    "TimeEntryCreate": ".time_entry",
+    "TimeEntryUpdate": ".time_entry",
+    "Token": ".auth",
+    "TokenData": ".auth",
+    "LoginRequest": ".auth",
+    "NotificationCreate": ".notification",
+    "NotificationRead": ".notification",
+    "NotificationUpdate": ".notification",
+    "NotificationList": ".notification",
+    "NotificationStats": ".notification",
+    "NotificationPreferences": ".notification",
+    "NotificationMarkRead": ".notification",
+    "NotificationFactory": ".notification",
+    "TaskAssignedNotification": ".notification",
+    "TaskCompletedNotification": ".notification",
+}
 
 __all__ = [
     "User",
@@ -63,3 +106,19 @@ __all__ = [
     "TaskAssignedNotification",
     "TaskCompletedNotification",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Импорт схемы при первом обращении"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Кэшируем в пространстве имен пакета: следующие обращения без __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Имена пакета вместе с еще не загруженными схемами"""
+    return sorted([*globals(), *_LAZY_IMPORTS])
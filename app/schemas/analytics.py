@@ -2,11 +2,13 @@
 Pydantic схемы для системы аналитики
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, IPvAnyAddress, TypeAdapter
+
+from app.schemas.common import JsonDict, UserAgentStr
 
 
 class AnalyticsEventBase(BaseModel):
@@ -16,16 +18,17 @@ class AnalyticsEventBase(BaseModel):
     event_category: str = Field(..., description="Категория события")
     entity_type: str | None = Field(None, description="Тип сущности")
     entity_id: UUID | None = Field(None, description="ID сущности")
-    event_data: dict[str, Any] | None = Field(None, description="Данные события")
+    event_data: JsonDict | None = Field(None, description="Данные события")
     session_id: str | None = Field(None, description="ID сессии")
-    ip_address: str | None = Field(None, description="IP адрес")
     user_agent: str | None = Field(None, description="User Agent")
 
 
 class AnalyticsEventCreate(AnalyticsEventBase):
     """Схема создания события аналитики"""
 
-    pass
+    # Адрес разбирает нативный парсер pydantic-core; в БД пишется строкой
+    ip_address: IPvAnyAddress | None = Field(None, description="IP адрес")
+    user_agent: UserAgentStr | None = Field(None, description="User Agent")
 
 
 class AnalyticsEvent(AnalyticsEventBase):
@@ -33,10 +36,10 @@ class AnalyticsEvent(AnalyticsEventBase):
 
     id: UUID = Field(..., description="ID события")
     user_id: UUID | None = Field(None, description="ID пользователя")
+    ip_address: str | None = Field(None, description="IP адрес")
     timestamp: datetime = Field(..., description="Время события")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProjectMetricsBase(BaseModel):
@@ -55,9 +58,7 @@ class ProjectMetricsBase(BaseModel):
     active_users: int = Field(0, description="Активных пользователей")
     comments_count: int = Field(0, description="Комментариев")
     files_uploaded: int = Field(0, description="Загруженных файлов")
-    custom_metrics: dict[str, Any] | None = Field(
-        None, description="Дополнительные метрики"
-    )
+    custom_metrics: JsonDict | None = Field(None, description="Дополнительные метрики")
 
 
 class ProjectMetrics(ProjectMetricsBase):
@@ -66,8 +67,7 @@ class ProjectMetrics(ProjectMetricsBase):
     id: UUID = Field(..., description="ID метрик")
     created_at: datetime = Field(..., description="Время создания")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserMetricsBase(BaseModel):
@@ -84,9 +84,7 @@ class UserMetricsBase(BaseModel):
     files_uploaded: int = Field(0, description="Загруженных файлов")
     projects_active: int = Field(0, description="Активных проектов")
     sprints_participated: int = Field(0, description="Участий в спринтах")
-    custom_metrics: dict[str, Any] | None = Field(
-        None, description="Дополнительные метрики"
-    )
+    custom_metrics: JsonDict | None = Field(None, description="Дополнительные метрики")
 
 
 class UserMetrics(UserMetricsBase):
@@ -95,8 +93,7 @@ class UserMetrics(UserMetricsBase):
     id: UUID = Field(..., description="ID метрик")
     created_at: datetime = Field(..., description="Время создания")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SprintMetricsBase(BaseModel):
@@ -118,8 +115,8 @@ class SprintMetricsBase(BaseModel):
     average_task_completion_time: float | None = Field(
         None, description="Среднее время выполнения задачи"
     )
-    burndown_data: dict[str, Any] | None = Field(None, description="Данные burndown")
-    retrospective_summary: dict[str, Any] | None = Field(
+    burndown_data: JsonDict | None = Field(None, description="Данные burndown")
+    retrospective_summary: JsonDict | None = Field(
         None, description="Сводка ретроспективы"
     )
 
@@ -130,8 +127,7 @@ class SprintMetrics(SprintMetricsBase):
     id: UUID = Field(..., description="ID метрик")
     created_at: datetime = Field(..., description="Время создания")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AnalyticsReportBase(BaseModel):
@@ -142,14 +138,12 @@ class AnalyticsReportBase(BaseModel):
     report_type: str = Field(..., description="Тип отчета")
     scope_type: str = Field(..., description="Тип области (global/project/user)")
     scope_id: UUID | None = Field(None, description="ID области")
-    filters: dict[str, Any] | None = Field(None, description="Фильтры")
-    date_range: dict[str, Any] | None = Field(None, description="Диапазон дат")
-    metrics_config: dict[str, Any] | None = Field(
-        None, description="Конфигурация метрик"
-    )
+    filters: JsonDict | None = Field(None, description="Фильтры")
+    date_range: JsonDict | None = Field(None, description="Диапазон дат")
+    metrics_config: JsonDict | None = Field(None, description="Конфигурация метрик")
     is_public: bool = Field(False, description="Публичный отчет")
     is_scheduled: bool = Field(False, description="Запланированный отчет")
-    schedule_config: dict[str, Any] | None = Field(
+    schedule_config: JsonDict | None = Field(
         None, description="Конфигурация расписания"
     )
 
@@ -157,24 +151,23 @@ class AnalyticsReportBase(BaseModel):
 class AnalyticsReportCreate(AnalyticsReportBase):
     """Схема создания отчета"""
 
-    report_data: dict[str, Any] = Field(..., description="Данные отчета")
-    data_summary: dict[str, Any] | None = Field(None, description="Сводка данных")
+    report_data: JsonDict = Field(..., description="Данные отчета")
+    data_summary: JsonDict | None = Field(None, description="Сводка данных")
 
 
 class AnalyticsReport(AnalyticsReportBase):
     """Полная схема отчета"""
 
     id: UUID = Field(..., description="ID отчета")
-    report_data: dict[str, Any] = Field(..., description="Данные отчета")
-    data_summary: dict[str, Any] | None = Field(None, description="Сводка данных")
+    report_data: JsonDict = Field(..., description="Данные отчета")
+    data_summary: JsonDict | None = Field(None, description="Сводка данных")
     created_by: UUID | None = Field(None, description="ID создателя")
     generated_at: datetime = Field(..., description="Время генерации")
     expires_at: datetime | None = Field(None, description="Время истечения")
     last_accessed: datetime | None = Field(None, description="Последний доступ")
     access_count: int = Field(0, description="Количество доступов")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DashboardBase(BaseModel):
@@ -184,9 +177,9 @@ class DashboardBase(BaseModel):
     description: str | None = Field(None, description="Описание")
     is_default: bool = Field(False, description="Дашборд по умолчанию")
     is_public: bool = Field(False, description="Публичный дашборд")
-    layout_config: dict[str, Any] = Field(..., description="Конфигурация layout")
-    widgets: dict[str, Any] = Field(..., description="Виджеты")
-    filters: dict[str, Any] | None = Field(None, description="Фильтры")
+    layout_config: JsonDict = Field(..., description="Конфигурация layout")
+    widgets: JsonDict = Field(..., description="Виджеты")
+    filters: JsonDict | None = Field(None, description="Фильтры")
     refresh_interval: int | None = Field(
         None, description="Интервал обновления в секундах"
     )
@@ -208,8 +201,7 @@ class Dashboard(DashboardBase):
     last_viewed: datetime | None = Field(None, description="Последний просмотр")
     view_count: int = Field(0, description="Количество просмотров")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DashboardUpdate(BaseModel):
@@ -217,11 +209,9 @@ class DashboardUpdate(BaseModel):
 
     name: str | None = Field(None, description="Название")
     description: str | None = Field(None, description="Описание")
-    layout_config: dict[str, Any] | None = Field(
-        None, description="Конфигурация layout"
-    )
-    widgets: dict[str, Any] | None = Field(None, description="Виджеты")
-    filters: dict[str, Any] | None = Field(None, description="Фильтры")
+    layout_config: JsonDict | None = Field(None, description="Конфигурация layout")
+    widgets: JsonDict | None = Field(None, description="Виджеты")
+    filters: JsonDict | None = Field(None, description="Фильтры")
     refresh_interval: int | None = Field(None, description="Интервал обновления")
 
 
@@ -231,19 +221,19 @@ class DashboardUpdate(BaseModel):
 class ProjectSummary(BaseModel):
     """Сводка по проекту"""
 
-    project: dict[str, Any] = Field(..., description="Информация о проекте")
-    tasks: dict[str, Any] = Field(..., description="Статистика задач")
-    users: dict[str, Any] = Field(..., description="Статистика пользователей")
-    metrics: list[dict[str, Any]] = Field(..., description="Метрики за период")
+    project: JsonDict = Field(..., description="Информация о проекте")
+    tasks: JsonDict = Field(..., description="Статистика задач")
+    users: JsonDict = Field(..., description="Статистика пользователей")
+    metrics: list[JsonDict] = Field(..., description="Метрики за период")
 
 
 class UserSummary(BaseModel):
     """Сводка по пользователю"""
 
-    user: dict[str, Any] = Field(..., description="Информация о пользователе")
-    tasks: dict[str, Any] = Field(..., description="Статистика задач")
-    projects: dict[str, Any] = Field(..., description="Статистика проектов")
-    metrics: list[dict[str, Any]] = Field(..., description="Метрики за период")
+    user: JsonDict = Field(..., description="Информация о пользователе")
+    tasks: JsonDict = Field(..., description="Статистика задач")
+    projects: JsonDict = Field(..., description="Статистика проектов")
+    metrics: list[JsonDict] = Field(..., description="Метрики за период")
 
 
 class AnalyticsQuery(BaseModel):
@@ -255,26 +245,32 @@ class AnalyticsQuery(BaseModel):
     period_type: str = Field("daily", description="Тип периода")
     start_date: datetime | None = Field(None, description="Начальная дата")
     end_date: datetime | None = Field(None, description="Конечная дата")
-    filters: dict[str, Any] | None = Field(None, description="Фильтры")
+    filters: JsonDict | None = Field(None, description="Фильтры")
 
 
 class AnalyticsResponse(BaseModel):
     """Ответ аналитики"""
 
-    data: list[dict[str, Any]] = Field(..., description="Данные аналитики")
-    summary: dict[str, Any] | None = Field(None, description="Сводка")
-    metadata: dict[str, Any] = Field(..., description="Метаданные")
+    data: list[JsonDict] = Field(..., description="Данные аналитики")
+    summary: JsonDict | None = Field(None, description="Сводка")
+    metadata: JsonDict = Field(..., description="Метаданные")
 
 
-class WidgetConfig(BaseModel):
-    """Конфигурация виджета"""
+@dataclass(slots=True, frozen=True)
+class WidgetConfig:
+    """Конфигурация виджета.
 
-    id: str = Field(..., description="ID виджета")
-    type: str = Field(..., description="Тип виджета")
-    title: str = Field(..., description="Заголовок")
-    position: dict[str, int] = Field(..., description="Позиция (x, y, w, h)")
-    config: dict[str, Any] = Field(..., description="Конфигурация виджета")
-    refresh_interval: int | None = Field(None, description="Интервал обновления")
+    Внутри DashboardLayout pydantic валидирует dataclass по аннотациям полей.
+    """
+
+    id: str
+    type: str
+    title: str
+    # Позиция (x, y, w, h)
+    position: dict[str, int]
+    config: JsonDict
+    # Интервал обновления
+    refresh_interval: int | None = None
 
 
 class DashboardLayout(BaseModel):
@@ -285,33 +281,48 @@ class DashboardLayout(BaseModel):
     gap: int = Field(1, description="Отступ")
     widgets: list[WidgetConfig] = Field(..., description="Виджеты")
 
+    # Внутренняя схема, не входит в OpenAPI: строится при первом использовании
+    model_config = ConfigDict(defer_build=True)
+
 
-# === Схемы для популярных типов виджетов ===
+# === Конфигурации популярных типов виджетов ===
+# Внутренние формы без валидации: собираются из уже проверенного JSON
 
 
-class ChartWidgetConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ChartWidgetConfig:
     """Конфигурация виджета-графика"""
 
-    chart_type: str = Field(..., description="Тип графика (line/bar/pie)")
-    data_source: str = Field(..., description="Источник данных")
-    x_axis: str = Field(..., description="Ось X")
-    y_axis: str = Field(..., description="Ось Y")
-    aggregation: str | None = Field(None, description="Агрегация")
+    # Тип графика (line/bar/pie)
+    chart_type: str
+    data_source: str
+    x_axis: str
+    y_axis: str
+    aggregation: str | None = None
 
 
-class MetricWidgetConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MetricWidgetConfig:
     """Конфигурация виджета-метрики"""
 
-    metric_type: str = Field(..., description="Тип метрики")
-    data_source: str = Field(..., description="Источник данных")
-    format: str | None = Field(None, description="Форматирование")
-    comparison: dict[str, Any] | None = Field(None, description="Сравнение")
+    metric_type: str
+    data_source: str
+    format: str | None = None
+    comparison: JsonDict | None = None
 
 
-class TableWidgetConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TableWidgetConfig:
     """Конфигурация виджета-таблицы"""
 
-    data_source: str = Field(..., description="Источник данных")
-    columns: list[dict[str, Any]] = Field(..., description="Колонки")
-    pagination: dict[str, Any] | None = Field(None, description="Пагинация")
-    sorting: dict[str, Any] | None = Field(None, description="Сортировка")
+    data_source: str
+    columns: list[JsonDict]
+    pagination: JsonDict | None = None
+    sorting: JsonDict | None = None
+
+
+# === Адаптеры для списков ===
+# Списки строк валидируются одним вызовом pydantic-core, а не по строке
+ANALYTICS_EVENT_LIST_ADAPTER = TypeAdapter(list[AnalyticsEvent])
+PROJECT_METRICS_LIST_ADAPTER = TypeAdapter(list[ProjectMetrics])
+USER_METRICS_LIST_ADAPTER = TypeAdapter(list[UserMetrics])
@@ -9,95 +9,105 @@ Pydantic модели для валидации данных аналитики.
 """
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Annotated, Literal, Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    Field,
+    IPvAnyAddress,
+    NonNegativeInt,
+    field_validator,
+    model_validator,
+)
+
+from app.schemas.common import JsonDict, UserAgentStr
+
+# Допустимые значения проверяет pydantic-core при валидации Literal
+EventTypeLiteral = Literal[
+    "login",
+    "logout",
+    "task_created",
+    "task_completed",
+    "task_updated",
+    "project_created",
+    "project_updated",
+    "sprint_created",
+    "sprint_completed",
+    "file_uploaded",
+    "file_downloaded",
+    "search_query",
+    "dashboard_view",
+]
+EventCategoryLiteral = Literal[
+    "user_action",
+    "system_event",
+    "business_metric",
+    "ui_interaction",
+]
 
 
 class EventCreateRequest(BaseModel):
     """Запрос на создание события аналитики."""
 
-    event_type: str = Field(..., description="Тип события", min_length=1, max_length=50)
-    event_category: str = Field(
-        ..., description="Категория события", min_length=1, max_length=50
-    )
+    event_type: EventTypeLiteral = Field(..., description="Тип события")
+    event_category: EventCategoryLiteral = Field(..., description="Категория события")
     entity_type: str | None = Field(None, description="Тип сущности", max_length=50)
     entity_id: UUID | None = Field(None, description="ID сущности")
-    event_data: dict[str, Any] | None = Field(None, description="Данные события")
+    event_data: JsonDict | None = Field(None, description="Данные события")
     session_id: str | None = Field(None, description="ID сессии", max_length=100)
-    ip_address: str | None = Field(None, description="IP адрес", max_length=45)
-    user_agent: str | None = Field(None, description="User Agent", max_length=500)
-
-    @validator("event_type")
-    def validate_event_type(cls, v: str) -> str:
-        """Валидация типа события."""
-        allowed_types = {
-            "login",
-            "logout",
-            "task_created",
-            "task_completed",
-            "task_updated",
-            "project_created",
-            "project_updated",
-            "sprint_created",
-            "sprint_completed",
-            "file_uploaded",
-            "file_downloaded",
-            "search_query",
-            "dashboard_view",
-        }
-        if v not in allowed_types:
-            raise ValueError(f"Недопустимый тип события. Разрешенные: {allowed_types}")
-        return v
-
-    @validator("event_category")
-    def validate_event_category(cls, v: str) -> str:
-        """Валидация категории события."""
-        allowed_categories = {
-            "user_action",
-            "system_event",
-            "business_metric",
-            "ui_interaction",
-        }
-        if v not in allowed_categories:
-            raise ValueError(
-                f"Недопустимая категория. Разрешенные: {allowed_categories}"
-            )
-        return v
+    ip_address: IPvAnyAddress | None = Field(None, description="IP адрес")
+    user_agent: UserAgentStr | None = Field(None, description="User Agent")
 
 
-class MetricsQueryRequest(BaseModel):
-    """Запрос на получение метрик."""
+class MetricsQueryBase(BaseModel):
+    """Общие поля запроса на получение метрик."""
 
     metric_type: str = Field(..., description="Тип метрики")
-    scope_type: Literal["global", "project", "user", "sprint"] = Field(
-        ..., description="Тип области"
-    )
-    scope_id: UUID | None = Field(None, description="ID области")
     period_type: Literal["daily", "weekly", "monthly"] = Field(
         "daily", description="Тип периода"
     )
     start_date: datetime | None = Field(None, description="Начальная дата")
     end_date: datetime | None = Field(None, description="Конечная дата")
-    filters: dict[str, Any] | None = Field(None, description="Фильтры")
+    filters: JsonDict | None = Field(None, description="Фильтры")
 
-    @validator("end_date")
-    def validate_date_range(
-        cls, v: datetime | None, values: dict[str, Any]
-    ) -> datetime | None:
+    @model_validator(mode="after")
+    def validate_date_range(self) -> Self:
         """Валидация диапазона дат."""
-        if v and "start_date" in values and values["start_date"]:
-            if v <= values["start_date"]:
-                raise ValueError("Конечная дата должна быть после начальной")
-        return v
+        if self.start_date and self.end_date and self.end_date <= self.start_date:
+            raise ValueError("Конечная дата должна быть после начальной")
+        return self
+
+
+class GlobalMetricsQuery(MetricsQueryBase):
+    """Запрос на получение глобальных метрик."""
+
+    scope_type: Literal["global"] = Field(..., description="Тип области")
+
+
+class ScopedMetricsQuery(MetricsQueryBase):
+    """Запрос на получение метрик проекта, пользователя или спринта."""
+
+    scope_type: Literal["project", "user", "sprint"] = Field(
+        ..., description="Тип области"
+    )
+    scope_id: UUID = Field(..., description="ID области")
+
+
+# Запрос на получение метрик: вариант выбирается по scope_type,
+# поэтому scope_id обязателен на уровне типа, а не проверки в валидаторе
+MetricsQueryRequest = Annotated[
+    GlobalMetricsQuery | ScopedMetricsQuery, Field(discriminator="scope_type")
+]
 
-    @validator("scope_id")
-    def validate_scope_id(cls, v: UUID | None, values: dict[str, Any]) -> UUID | None:
-        """Валидация ID области."""
-        if values.get("scope_type") in ["project", "user", "sprint"] and not v:
-            raise ValueError("ID области обязателен для указанного типа области")
-        return v
+
+class WidgetPosition(BaseModel):
+    """Позиция виджета на сетке дашборда."""
+
+    x: NonNegativeInt = Field(..., description="Колонка")
+    y: NonNegativeInt = Field(..., description="Строка")
+    w: NonNegativeInt = Field(..., description="Ширина")
+    h: NonNegativeInt = Field(..., description="Высота")
 
 
 class DashboardWidgetConfig(BaseModel):
@@ -108,24 +118,12 @@ class DashboardWidgetConfig(BaseModel):
         ..., description="Тип виджета"
     )
     title: str = Field(..., description="Заголовок", min_length=1, max_length=100)
-    position: dict[str, int] = Field(..., description="Позиция (x, y, w, h)")
-    config: dict[str, Any] = Field(..., description="Конфигурация виджета")
+    position: WidgetPosition = Field(..., description="Позиция (x, y, w, h)")
+    config: JsonDict = Field(..., description="Конфигурация виджета")
     refresh_interval: int | None = Field(
         None, description="Интервал обновления в секундах", ge=30
     )
 
-    @validator("position")
-    def validate_position(cls, v: dict[str, int]) -> dict[str, int]:
-        """Валидация позиции виджета."""
-        required_keys = {"x", "y", "w", "h"}
-        if not all(key in v for key in required_keys):
-            raise ValueError(f"Позиция должна содержать ключи: {required_keys}")
-
-        if any(v[key] < 0 for key in ["x", "y", "w", "h"]):
-            raise ValueError("Координаты и размеры должны быть положительными")
-
-        return v
-
 
 class DashboardCreateRequest(BaseModel):
     """Запрос на создание дашборда."""
@@ -136,26 +134,27 @@ class DashboardCreateRequest(BaseModel):
     description: str | None = Field(None, description="Описание", max_length=500)
     is_default: bool = Field(False, description="Дашборд по умолчанию")
     is_public: bool = Field(False, description="Публичный дашборд")
-    layout_config: dict[str, Any] = Field(..., description="Конфигурация layout")
-    widgets: list[DashboardWidgetConfig] = Field(..., description="Виджеты")
-    filters: dict[str, Any] | None = Field(None, description="Фильтры")
+    layout_config: JsonDict = Field(..., description="Конфигурация layout")
+    widgets: list[DashboardWidgetConfig] = Field(
+        ..., description="Виджеты", min_length=1, max_length=20
+    )
+    filters: JsonDict | None = Field(None, description="Фильтры")
     refresh_interval: int | None = Field(None, description="Интервал обновления", ge=30)
 
-    @validator("widgets")
+    @field_validator("widgets")
+    @classmethod
     def validate_widgets(
         cls, v: list[DashboardWidgetConfig]
     ) -> list[DashboardWidgetConfig]:
-        """Валидация виджетов."""
-        if len(v) == 0:
-            raise ValueError("Дашборд должен содержать хотя бы один виджет")
+        """Проверка уникальности ID виджетов.
 
-        if len(v) > 20:
-            raise ValueError("Дашборд не может содержать более 20 виджетов")
-
-        # Проверка уникальности ID виджетов
-        widget_ids = [widget.id for widget in v]
-        if len(widget_ids) != len(set(widget_ids)):
-            raise ValueError("ID виджетов должны быть уникальными")
+        Число виджетов (1-20) ограничивает Field при разборе списка.
+        """
+        seen: set[str] = set()
+        for widget in v:
+            if widget.id in seen:
+                raise ValueError("ID виджетов должны быть уникальными")
+            seen.add(widget.id)
 
         return v
 
@@ -170,11 +169,5 @@ class AnalyticsFilterRequest(BaseModel):
     project_ids: list[UUID] | None = Field(None, description="ID проектов")
     start_date: datetime | None = Field(None, description="Начальная дата")
     end_date: datetime | None = Field(None, description="Конечная дата")
+    # Верхнюю границу проверяет le=1000 в pydantic-core, без Python-валидатора
     limit: int = Field(100, description="Лимит записей", ge=1, le=1000)
-
-    @validator("limit")
-    def validate_limit(cls, v: int) -> int:
-        """Валидация лимита."""
-        if v > 1000:
-            raise ValueError("Лимит не может превышать 1000 записей")
-        return v
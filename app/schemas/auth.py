@@ -2,22 +2,15 @@
 Схемы для аутентификации
 """
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Annotated
 
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints
 
-if TYPE_CHECKING:
-    from app.schemas.user import User
+from app.schemas.user import User
 
-
-def update_auth_forward_refs():
-    """Обновляет forward references для auth схем"""
-    # Импортируем User здесь для разрешения circular import
-    from app.schemas.user import User
-
-    # Обновляем forward references с правильным контекстом
-    LoginResponse.model_rebuild(_types_namespace={"User": User})
-    Token.model_rebuild()
+# Длину нового пароля проверяет pydantic-core, без Python-валидатора
+PasswordStr = Annotated[str, StringConstraints(min_length=6, max_length=128)]
 
 
 class Token(BaseModel):
@@ -29,7 +22,8 @@ class Token(BaseModel):
     expires_in: int
 
 
-class TokenData(BaseModel):
+@dataclass(slots=True, frozen=True)
+class TokenData:
     """Данные токена"""
 
     email: str | None = None
@@ -50,28 +44,21 @@ class LoginResponse(BaseModel):
     refresh_token: str
     token_type: str = "bearer"
     expires_in: int
-    user: "User"
+    user: User
+
+    # Схема строится при первом ответе /login, а не при импорте
+    model_config = ConfigDict(defer_build=True)
 
 
 class RegisterRequest(BaseModel):
     """Запрос на регистрацию"""
 
     email: EmailStr
-    password: str
+    password: PasswordStr
     username: str | None = None
     full_name: str | None = None
     role: str | None = None  # Опциональное поле роли для тестов
 
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Валидация пароля"""
-        if len(v) < 6:
-            raise ValueError("Пароль должен содержать минимум 6 символов")
-        if len(v) > 128:
-            raise ValueError("Пароль не должен превышать 128 символов")
-        return v
-
 
 class RefreshTokenRequest(BaseModel):
     """Запрос на обновление токена"""
@@ -89,11 +76,11 @@ class PasswordResetConfirm(BaseModel):
     """Подтверждение сброса пароля"""
 
     token: str
-    new_password: str
+    new_password: PasswordStr
 
 
 class PasswordChange(BaseModel):
     """Изменение пароля"""
 
     current_password: str
-    new_password: str
+    new_password: PasswordStr
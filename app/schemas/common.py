@@ -0,0 +1,36 @@
+"""
+Общие типы для Pydantic схем
+"""
+
+from typing import Annotated, Any
+
+from pydantic import BeforeValidator, StringConstraints
+
+# Именованный псевдоним: pydantic строит для него одно определение схемы
+# (definition-ref), которое переиспользуют все поля модели с этим типом,
+# вместо отдельной dict-схемы на каждое поле
+type JsonDict = dict[str, Any]
+
+
+def _uuid_to_str(value: Any) -> Any:
+    """Привести UUID из ORM-модели к строке"""
+    return str(value) if value is not None else None
+
+
+# Идентификаторы, которые ORM отдает как UUID, а API - строкой.
+# Один общий BeforeValidator вместо отдельного field_validator на каждое поле
+UUIDStr = Annotated[str, BeforeValidator(_uuid_to_str)]
+OptUUIDStr = Annotated[str | None, BeforeValidator(_uuid_to_str)]
+
+# Строковые ограничения, общие для схем уведомлений, ссылок и поиска
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+ShortStr = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+QueryStr = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+Str255 = Annotated[str, StringConstraints(max_length=255)]
+Str500 = Annotated[str, StringConstraints(max_length=500)]
+
+# User-Agent: только печатные ASCII-символы. Ограничения объявлены один раз,
+# чтобы регулярное выражение pydantic-core не компилировалось на каждое поле
+UserAgentStr = Annotated[
+    str, StringConstraints(max_length=500, pattern=r"^[\x20-\x7E]+$")
+]
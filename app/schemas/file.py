@@ -5,9 +5,9 @@ Pydantic схемы для файлов
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
 
-from app.models.file import FileType
+from app.models.file import FileType, format_file_size, get_file_extension
 
 
 class FileBase(BaseModel):
@@ -50,14 +50,34 @@ class FileResponse(FileBase):
         None, description="Дата последнего доступа"
     )
 
-    # Вычисляемые поля
-    file_extension: str = Field(..., description="Расширение файла")
-    formatted_size: str = Field(..., description="Форматированный размер файла")
-    is_image: bool = Field(..., description="Является ли файл изображением")
-    is_document: bool = Field(..., description="Является ли файл документом")
+    # Ответ собирается один раз на строку и не изменяется
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    class Config:
-        from_attributes = True
+    # Вычисляемые поля: выводятся из полей схемы при сериализации,
+    # а не читаются и валидируются как входные данные
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def file_extension(self) -> str:
+        """Расширение файла"""
+        return get_file_extension(self.filename)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def formatted_size(self) -> str:
+        """Форматированный размер файла"""
+        return format_file_size(self.file_size)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def is_image(self) -> bool:
+        """Является ли файл изображением"""
+        return self.file_type == FileType.IMAGE
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def is_document(self) -> bool:
+        """Является ли файл документом"""
+        return self.file_type == FileType.DOCUMENT
 
 
 class FileUploadResponse(BaseModel):
@@ -76,13 +96,22 @@ class FileListResponse(BaseModel):
     limit: int = Field(..., description="Лимит")
 
 
+class FileTypeStats(BaseModel):
+    """Статистика файлов одного типа"""
+
+    count: int = Field(..., description="Количество файлов")
+    size: int = Field(..., description="Суммарный размер в байтах")
+
+    model_config = ConfigDict(frozen=True)
+
+
 class FileStatsResponse(BaseModel):
     """Схема ответа со статистикой файлов"""
 
     total_files: int = Field(..., description="Общее количество файлов")
     total_size: int = Field(..., description="Общий размер в байтах")
     avg_file_size: float = Field(..., description="Средний размер файла")
-    type_stats: dict[str, dict[str, int]] = Field(
+    type_stats: dict[FileType, FileTypeStats] = Field(
         ..., description="Статистика по типам файлов"
     )
 
@@ -97,3 +126,7 @@ class FileSearchRequest(BaseModel):
     is_public: bool | None = Field(None, description="Фильтр по публичности")
     offset: int = Field(0, ge=0, description="Смещение")
     limit: int = Field(20, ge=1, le=100, description="Лимит")
+
+
+# Списки файлов валидируются одним вызовом pydantic-core, а не по строке
+FILE_RESPONSE_LIST_ADAPTER = TypeAdapter(list[FileResponse])
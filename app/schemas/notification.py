@@ -1,35 +1,49 @@
 """Pydantic схемы для уведомлений."""
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-
-from app.models.notification import NotificationType
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+from app.models.notification import Notification, NotificationType
+from app.schemas.common import NonEmptyStr, ShortStr, Str500
+
+# Значения NotificationType; допустимость проверяет pydantic-core
+NotificationTypeLiteral = Literal[
+    "task_assigned",
+    "task_completed",
+    "task_overdue",
+    "task_moved",
+    "task_comment_added",
+    "project_created",
+    "project_updated",
+    "project_member_added",
+    "project_member_removed",
+    "sprint_started",
+    "sprint_completed",
+    "sprint_task_assigned",
+    "system_announcement",
+    "welcome",
+    "deadline_reminder",
+]
+NotificationActionLiteral = Literal["mark_read", "mark_unread", "delete"]
 
 
 class NotificationBase(BaseModel):
     """Базовая схема уведомления."""
 
-    title: str = Field(
-        ..., min_length=1, max_length=255, description="Заголовок уведомления"
+    title: ShortStr = Field(..., description="Заголовок уведомления")
+    message: NonEmptyStr = Field(..., description="Сообщение уведомления")
+    notification_type: NotificationTypeLiteral = Field(
+        ..., description="Тип уведомления"
     )
-    message: str = Field(..., min_length=1, description="Сообщение уведомления")
-    notification_type: str = Field(..., description="Тип уведомления")
-    action_url: str | None = Field(None, max_length=500, description="URL для перехода")
-    metadata_json: str | None = Field(
-        None, description="Дополнительные метаданные в JSON"
+    action_url: Str500 | None = Field(None, description="URL для перехода")
+    metadata_json: dict[str, Any] | None = Field(
+        None, description="Дополнительные метаданные"
     )
 
-    @field_validator("notification_type")
-    @classmethod
-    def validate_notification_type(cls, v: str) -> str:
-        """Валидация типа уведомления."""
-        if not NotificationType.is_valid_type(v):
-            allowed_types = ", ".join(NotificationType.get_all_types())
-            raise ValueError(f"Тип уведомления должен быть одним из: {allowed_types}")
-        return v
-
 
 class NotificationCreate(NotificationBase):
     """Схема для создания уведомления."""
@@ -43,26 +57,17 @@ class NotificationCreate(NotificationBase):
 class NotificationUpdate(BaseModel):
     """Схема для обновления уведомления."""
 
-    title: str | None = Field(None, min_length=1, max_length=255)
-    message: str | None = Field(None, min_length=1)
-    notification_type: str | None = Field(None)
-    action_url: str | None = Field(None, max_length=500)
-    metadata_json: str | None = Field(None)
-
-    @field_validator("notification_type")
-    @classmethod
-    def validate_notification_type(cls, v: str | None) -> str | None:
-        """Валидация типа уведомления при обновлении."""
-        if v is not None and not NotificationType.is_valid_type(v):
-            allowed_types = ", ".join(NotificationType.get_all_types())
-            raise ValueError(f"Тип уведомления должен быть одним из: {allowed_types}")
-        return v
+    title: ShortStr | None = Field(None)
+    message: NonEmptyStr | None = Field(None)
+    notification_type: NotificationTypeLiteral | None = Field(None)
+    action_url: Str500 | None = Field(None)
+    metadata_json: dict[str, Any] | None = Field(None)
 
 
 class NotificationRead(NotificationBase):
     """Схема для чтения уведомления."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: UUID = Field(..., description="ID уведомления")
     user_id: UUID = Field(..., description="ID пользователя")
@@ -73,7 +78,58 @@ class NotificationRead(NotificationBase):
     read_at: datetime | None = Field(None, description="Время прочтения")
     created_at: datetime = Field(..., description="Время создания")
     updated_at: datetime = Field(..., description="Время обновления")
-    is_recent: bool = Field(..., description="Является ли уведомление недавним")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def is_recent(self) -> bool:
+        """Является ли уведомление недавним (менее 24 часов)"""
+        return (datetime.now(UTC) - self.created_at).total_seconds() < 86400
+
+
+@dataclass(slots=True, frozen=True)
+class NotificationOut:
+    """Легковесное представление уведомления для списков.
+
+    Повторяет поля NotificationRead, но без валидации pydantic:
+    orjson сериализует dataclass напрямую.
+    """
+
+    title: str
+    message: str
+    notification_type: str
+    action_url: str | None
+    metadata_json: dict[str, Any] | None
+    id: UUID
+    user_id: UUID
+    project_id: UUID | None
+    task_id: UUID | None
+    sprint_id: UUID | None
+    is_read: bool
+    read_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+    is_recent: bool
+
+    @classmethod
+    def from_orm(cls, notification: Notification, now: datetime) -> "NotificationOut":
+        """Собрать из ORM-модели, проверяя недавность относительно now."""
+        return cls(
+            title=notification.title,
+            message=notification.message,
+            notification_type=notification.notification_type,
+            action_url=notification.action_url,
+            metadata_json=notification.metadata_json,
+            id=notification.id,
+            user_id=notification.user_id,
+            project_id=notification.project_id,
+            task_id=notification.task_id,
+            sprint_id=notification.sprint_id,
+            is_read=notification.is_read,
+            read_at=notification.read_at,
+            created_at=notification.created_at,
+            updated_at=notification.updated_at,
+            is_recent=notification.is_recent_at(now),
+        )
 
 
 class NotificationMarkRead(BaseModel):
@@ -88,18 +144,9 @@ class NotificationBulkAction(BaseModel):
     notification_ids: list[UUID] = Field(
         ..., min_length=1, description="ID уведомлений"
     )
-    action: str = Field(..., description="Действие (mark_read, mark_unread, delete)")
-
-    @field_validator("action")
-    @classmethod
-    def validate_action(cls, v: str) -> str:
-        """Валидация действия."""
-        allowed_actions = ["mark_read", "mark_unread", "delete"]
-        if v not in allowed_actions:
-            raise ValueError(
-                f'Действие должно быть одним из: {", ".join(allowed_actions)}'
-            )
-        return v
+    action: NotificationActionLiteral = Field(
+        ..., description="Действие (mark_read, mark_unread, delete)"
+    )
 
 
 class NotificationStats(BaseModel):
@@ -203,12 +250,16 @@ class SprintCompletedNotification(BaseModel):
 
 # Фабрики для создания уведомлений
 class NotificationFactory:
-    """Фабрика для создания уведомлений."""
+    """Фабрика для создания уведомлений.
+
+    Поля собираются из уже провалидированных данных, поэтому схемы
+    создаются через model_construct без повторной валидации.
+    """
 
     @staticmethod
     def task_assigned(data: TaskAssignedNotification) -> NotificationCreate:
         """Создать уведомление о назначении задачи."""
-        return NotificationCreate(
+        return NotificationCreate.model_construct(
             user_id=data.assignee_id,
             title="Новая задача",
             message=f"Вам назначена новую задачу #{data.task_id}",
@@ -217,13 +268,13 @@ class NotificationFactory:
             project_id=None,
             sprint_id=None,
             action_url=f"/tasks/{data.task_id}",
-            metadata_json=f'{{"assigner_id": "{data.assigner_id}"}}',
+            metadata_json={"assigner_id": str(data.assigner_id)},
         )
 
     @staticmethod
     def task_completed(data: TaskCompletedNotification) -> NotificationCreate:
         """Создать уведомление о завершении задачи."""
-        return NotificationCreate(
+        return NotificationCreate.model_construct(
             user_id=data.completer_id,
             title="Задача завершена",
             message=f"Задача #{data.task_id} успешно завершена",
@@ -240,7 +291,7 @@ class NotificationFactory:
         data: ProjectMemberAddedNotification,
     ) -> NotificationCreate:
         """Создать уведомление о добавлении участника проекта."""
-        return NotificationCreate(
+        return NotificationCreate.model_construct(
             user_id=data.member_id,
             title="Добавление в проект",
             message=f"Вас добавили в проект #{data.project_id}",
@@ -249,13 +300,13 @@ class NotificationFactory:
             task_id=None,
             sprint_id=None,
             action_url=f"/projects/{data.project_id}",
-            metadata_json=f'{{"inviter_id": "{data.inviter_id}"}}',
+            metadata_json={"inviter_id": str(data.inviter_id)},
         )
 
     @staticmethod
     def sprint_started(data: SprintStartedNotification) -> NotificationCreate:
         """Создать уведомление о начале спринта."""
-        return NotificationCreate(
+        return NotificationCreate.model_construct(
             user_id=data.project_id,  # Будет заменено на ID участников
             title="Начало спринта",
             message=f"Спринт #{data.sprint_id} начался",
@@ -270,7 +321,7 @@ class NotificationFactory:
     @staticmethod
     def sprint_completed(data: SprintCompletedNotification) -> NotificationCreate:
         """Создать уведомление о завершении спринта."""
-        return NotificationCreate(
+        return NotificationCreate.model_construct(
             user_id=data.project_id,  # Будет заменено на ID участников
             title="Завершение спринта",
             message=f"Спринт #{data.sprint_id} завершен",
@@ -3,32 +3,56 @@
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, TypedDict
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
+
+from app.schemas.common import OptUUIDStr, UUIDStr
+
+
+def _validate_project_name(value: str) -> str:
+    """Проверить, что имя не пустое и не окружено пробелами"""
+    stripped = value.strip()
+    if not stripped:
+        raise ValueError("Имя проекта не может быть пустым")
+    if len(stripped) != len(value):
+        raise ValueError("Имя проекта не должно содержать только пробельные символы")
+    return value
+
+
+# Длину проверяет pydantic-core, до Python-проверки пробелов
+ProjectName = Annotated[
+    str,
+    StringConstraints(min_length=1, max_length=255),
+    AfterValidator(_validate_project_name),
+]
+
+
+class UserBrief(TypedDict, total=False):
+    """Краткие данные пользователя (владелец, участник, пригласивший)"""
+
+    id: UUIDStr
+    email: str
+    username: str | None
+    full_name: str | None
 
 
 class ProjectBase(BaseModel):
     """Базовая схема проекта"""
 
-    name: str = Field(..., min_length=1, max_length=255)
+    name: ProjectName
     description: str | None = None
     status: str = "ACTIVE"
     is_public: bool = False
     allow_external_sharing: bool = True
-    max_members: str = "5"
-
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Валидация имени проекта"""
-        if not v or not v.strip():
-            raise ValueError("Имя проекта не может быть пустым")
-        if len(v.strip()) != len(v):
-            raise ValueError(
-                "Имя проекта не должно содержать только пробельные символы"
-            )
-        return v.strip()
+    max_members: int = Field(5, ge=1)
 
 
 class ProjectCreate(ProjectBase):
@@ -42,7 +66,7 @@ class ProjectCreate(ProjectBase):
                 "status": "active",
                 "is_public": False,
                 "allow_external_sharing": True,
-                "max_members": "10",
+                "max_members": 10,
             }
         }
     )
@@ -56,30 +80,18 @@ class ProjectUpdate(BaseModel):
     status: str | None = None
     is_public: bool | None = None
     allow_external_sharing: bool | None = None
-    max_members: str | None = None
+    max_members: int | None = Field(None, ge=1)
 
 
 class Project(ProjectBase):
     """Схема проекта для API"""
 
-    id: str
-    owner_id: str
+    id: UUIDStr
+    owner_id: UUIDStr
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
-    @field_validator("owner_id", mode="before")
-    @classmethod
-    def convert_owner_id_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProjectWithDetails(Project):
@@ -89,9 +101,7 @@ class ProjectWithDetails(Project):
     task_count: int = 0
     completed_task_count: int = 0
     is_at_member_limit: bool = False
-    owner: dict[str, Any] | None = None
-
-    model_config = ConfigDict(from_attributes=True)
+    owner: UserBrief | None = None
 
 
 class ProjectMemberBase(BaseModel):
@@ -123,51 +133,25 @@ class ProjectMemberUpdate(BaseModel):
 class ProjectMember(ProjectMemberBase):
     """Схема участника проекта для API"""
 
-    id: str
-    project_id: str
-    user_id: str
-    invited_by_id: str | None = None
+    id: UUIDStr
+    project_id: UUIDStr
+    user_id: UUIDStr
+    invited_by_id: OptUUIDStr = None
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
-
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
-    @field_validator("project_id", mode="before")
-    @classmethod
-    def convert_project_id_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
-    @field_validator("user_id", mode="before")
-    @classmethod
-    def convert_user_id_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
-    @field_validator("invited_by_id", mode="before")
-    @classmethod
-    def convert_invited_by_id_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProjectMemberWithDetails(ProjectMember):
     """Участник проекта с деталями пользователя"""
 
-    user: dict[str, Any] | None = None
-    invited_by: dict[str, Any] | None = None
+    user: UserBrief | None = None
+    invited_by: UserBrief | None = None
     can_manage_project: bool = False
     can_edit_tasks: bool = False
     can_view_project: bool = True
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class ProjectInvite(BaseModel):
     """Приглашение в проект"""
@@ -190,19 +174,13 @@ class ProjectInvite(BaseModel):
 class PublicProject(BaseModel):
     """Публичная информация о проекте"""
 
-    id: str
+    id: UUIDStr
     name: str
     description: str | None = None
     created_at: datetime
-    owner: dict[str, Any] | None = None
-
-    model_config = ConfigDict(from_attributes=True)
+    owner: UserBrief | None = None
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProjectStats(BaseModel):
@@ -217,4 +195,9 @@ class ProjectStats(BaseModel):
     total_members: int = 0
     active_members: int = 0
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Списки строк валидируются одним вызовом pydantic-core, а не по строке
+PROJECT_LIST_ADAPTER = TypeAdapter(list[Project])
+PROJECT_MEMBER_LIST_ADAPTER = TypeAdapter(list[ProjectMember])
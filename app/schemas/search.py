@@ -3,17 +3,18 @@ Pydantic схемы для поиска
 """
 
 import uuid
-from typing import Any
+from datetime import datetime
+from typing import Any, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from app.schemas.common import QueryStr, ShortStr
 
 
 class SearchQuery(BaseModel):
     """Поисковый запрос"""
 
-    query: str = Field(
-        ..., min_length=1, max_length=500, description="Поисковый запрос"
-    )
+    query: QueryStr = Field(..., description="Поисковый запрос")
     entity_types: list[str] | None = Field(
         default=None,
         description="Типы сущностей для поиска (task, project, sprint, comment)",
@@ -27,6 +28,33 @@ class SearchQuery(BaseModel):
     include_public: bool = Field(default=True, description="Включать публичные объекты")
 
 
+class SearchEntityData(TypedDict, total=False):
+    """Детальные данные найденной сущности
+
+    Набор ключей зависит от типа сущности (задача, проект, спринт, комментарий).
+    Даты передаются строками в ISO-формате.
+    """
+
+    status: str
+    priority: str
+    story_point: str
+    is_public: bool
+    is_edited: bool
+    project_name: str | None
+    task_title: str | None
+    owner_name: str | None
+    assignee_name: str | None
+    creator_name: str | None
+    author_name: str | None
+    member_count: int
+    task_count: int
+    completed_task_count: int
+    start_date: str | None
+    end_date: str | None
+    due_date: str | None
+    created_at: str | None
+
+
 class SearchResult(BaseModel):
     """Результат поиска"""
 
@@ -39,7 +67,9 @@ class SearchResult(BaseModel):
     project_id: str | None = Field(None, description="ID проекта")
     is_public: bool = Field(..., description="Публичный ли объект")
     metadata: dict[str, Any] | None = Field(None, description="Метаданные")
-    entity_data: dict[str, Any] | None = Field(None, description="Данные сущности")
+    entity_data: SearchEntityData | None = Field(None, description="Данные сущности")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class SearchResponse(BaseModel):
@@ -55,10 +85,8 @@ class SearchResponse(BaseModel):
 class SaveSearchRequest(BaseModel):
     """Запрос на сохранение поиска"""
 
-    name: str = Field(..., min_length=1, max_length=255, description="Название поиска")
-    query: str = Field(
-        ..., min_length=1, max_length=500, description="Поисковый запрос"
-    )
+    name: ShortStr = Field(..., description="Название поиска")
+    query: QueryStr = Field(..., description="Поисковый запрос")
     filters: dict[str, Any] | None = Field(None, description="Фильтры")
     is_public: bool = Field(default=False, description="Публичный ли поиск")
 
@@ -72,8 +100,10 @@ class SavedSearch(BaseModel):
     filters: dict[str, Any] | None = Field(None, description="Фильтры")
     user_id: uuid.UUID = Field(..., description="ID пользователя")
     is_public: bool = Field(..., description="Публичный ли поиск")
-    created_at: str = Field(..., description="Дата создания")
-    updated_at: str = Field(..., description="Дата обновления")
+    created_at: datetime = Field(..., description="Дата создания")
+    updated_at: datetime = Field(..., description="Дата обновления")
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReindexResponse(BaseModel):
@@ -98,3 +128,8 @@ class SearchSuggestionsResponse(BaseModel):
 
     suggestions: list[SearchSuggestion] = Field(..., description="Подсказки")
     query: str = Field(..., description="Исходный запрос")
+
+
+# Результаты поиска валидируются одним вызовом pydantic-core, а не по строке
+SEARCH_RESULT_LIST_ADAPTER = TypeAdapter(list[SearchResult])
+SAVED_SEARCH_LIST_ADAPTER = TypeAdapter(list[SavedSearch])
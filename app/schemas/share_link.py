@@ -2,11 +2,16 @@
 Pydantic схемы для публичных ссылок
 """
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import Enum
+from typing import TypedDict
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+
+from app.models.share_link import ShareLink
+from app.schemas.common import Str255
 
 
 class SharePermission(str, Enum):
@@ -27,27 +32,17 @@ class ShareableType(str, Enum):
 class ShareLinkBase(BaseModel):
     """Базовая схема публичной ссылки."""
 
-    title: str | None = Field(None, max_length=255, description="Заголовок ссылки")
+    title: Str255 | None = Field(None, description="Заголовок ссылки")
     description: str | None = Field(None, description="Описание ссылки")
     permission: SharePermission = Field(
         default=SharePermission.VIEW, description="Уровень доступа"
     )
-    password: str | None = Field(None, max_length=255, description="Пароль для доступа")
+    password: Str255 | None = Field(None, description="Пароль для доступа")
     expires_at: datetime | None = Field(None, description="Время истечения ссылки")
     max_views: int | None = Field(
         None, ge=1, description="Максимальное количество просмотров"
     )
 
-    @field_validator("permission")
-    @classmethod
-    def validate_permission(cls, v: str) -> str:
-        """Валидация уровня доступа."""
-        if v not in [SharePermission.VIEW, SharePermission.COMMENT]:
-            raise ValueError(
-                f"Уровень доступа должен быть одним из: {SharePermission.VIEW}, {SharePermission.COMMENT}"
-            )
-        return v
-
 
 class ShareLinkCreate(ShareLinkBase):
     """Схема для создания публичной ссылки."""
@@ -59,10 +54,10 @@ class ShareLinkCreate(ShareLinkBase):
 class ShareLinkUpdate(BaseModel):
     """Схема для обновления публичной ссылки."""
 
-    title: str | None = Field(None, max_length=255)
+    title: Str255 | None = Field(None)
     description: str | None = Field(None)
     permission: SharePermission | None = Field(None)
-    password: str | None = Field(None, max_length=255)
+    password: Str255 | None = Field(None)
     expires_at: datetime | None = Field(None)
     max_views: int | None = Field(None, ge=1)
     is_active: bool | None = Field(None, description="Активность ссылки")
@@ -81,13 +76,91 @@ class ShareLinkResponse(ShareLinkBase):
     created_at: datetime = Field(..., description="Время создания")
     updated_at: datetime = Field(..., description="Время обновления")
     public_url: str = Field(..., description="Публичный URL")
-    is_expired: bool = Field(..., description="Истекла ли ссылка")
-    is_view_limit_exceeded: bool = Field(
-        ..., description="Превышен ли лимит просмотров"
-    )
-    is_accessible: bool = Field(..., description="Доступна ли ссылка")
+    # Пароль в ответ не передается, поэтому признак приходит готовым
     has_password: bool = Field(..., description="Требуется ли пароль")
 
+    model_config = ConfigDict(frozen=True)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def is_expired(self) -> bool:
+        """Истекла ли ссылка"""
+        if not self.expires_at:
+            return False
+        return datetime.now(UTC) > self.expires_at
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def is_view_limit_exceeded(self) -> bool:
+        """Превышен ли лимит просмотров"""
+        if not self.max_views:
+            return False
+        return self.current_views >= self.max_views
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def is_accessible(self) -> bool:
+        """Доступна ли ссылка"""
+        return (
+            self.is_active and not self.is_expired and not self.is_view_limit_exceeded
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ShareLinkOut:
+    """Легковесное представление публичной ссылки для списков.
+
+    Повторяет поля ShareLinkResponse, но без валидации pydantic:
+    orjson сериализует dataclass напрямую.
+    """
+
+    title: str | None
+    description: str | None
+    permission: str
+    expires_at: datetime | None
+    max_views: int | None
+    id: UUID
+    token: str
+    shareable_type: str
+    shareable_id: UUID
+    current_views: int
+    is_active: bool
+    created_by: UUID
+    created_at: datetime
+    updated_at: datetime
+    public_url: str
+    is_expired: bool
+    is_view_limit_exceeded: bool
+    is_accessible: bool
+    has_password: bool
+    # Пароль клиенту никогда не отдается
+    password: None = None
+
+    @classmethod
+    def from_orm(cls, share_link: ShareLink) -> "ShareLinkOut":
+        """Собрать из ORM-модели."""
+        return cls(
+            title=share_link.title,
+            description=share_link.description,
+            permission=share_link.permission,
+            expires_at=share_link.expires_at,
+            max_views=share_link.max_views,
+            id=share_link.id,
+            token=share_link.token,
+            shareable_type=share_link.shareable_type,
+            shareable_id=share_link.shareable_id,
+            current_views=share_link.current_views,
+            is_active=share_link.is_active,
+            created_by=share_link.created_by,
+            created_at=share_link.created_at,
+            updated_at=share_link.updated_at,
+            public_url=share_link.get_public_url(),
+            is_expired=share_link.is_expired,
+            is_view_limit_exceeded=share_link.is_view_limit_exceeded,
+            is_accessible=share_link.is_accessible,
+            has_password=bool(share_link.password),
+        )
+
 
 class ShareLinkAccess(BaseModel):
     """Схема для доступа к публичной ссылке."""
@@ -108,10 +181,32 @@ class ShareLinkStats(BaseModel):
     )
 
 
+class SharedContent(TypedDict, total=False):
+    """Контент объекта, открытого по публичной ссылке.
+
+    Набор ключей зависит от типа объекта; даты передаются строками ISO.
+    """
+
+    type: str
+    id: str
+    name: str
+    title: str
+    description: str | None
+    status: str
+    priority: str
+    story_points: int
+    created_at: str
+    updated_at: str
+
+
 class SharedContentResponse(BaseModel):
     """Ответ с контентом по публичной ссылке."""
 
     share_link: ShareLinkResponse = Field(..., description="Информация о ссылке")
-    content: dict = Field(..., description="Контент объекта")
+    content: SharedContent = Field(..., description="Контент объекта")
     can_comment: bool = Field(..., description="Можно ли оставлять комментарии")
     access_granted: bool = Field(..., description="Предоставлен ли доступ")
+
+
+# Списки ссылок валидируются одним вызовом pydantic-core, а не по строке
+SHARE_LINK_RESPONSE_LIST_ADAPTER = TypeAdapter(list[ShareLinkResponse])
@@ -5,7 +5,9 @@
 from datetime import date, datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+from app.schemas.common import UUIDStr
 
 
 class SprintBase(BaseModel):
@@ -94,8 +96,8 @@ class SprintComplete(BaseModel):
 class Sprint(SprintBase):
     """Схема спринта для API"""
 
-    id: str
-    project_id: str
+    id: UUIDStr
+    project_id: UUIDStr
     completed_points: int = 0
     created_at: datetime
     updated_at: datetime
@@ -110,12 +112,6 @@ class Sprint(SprintBase):
     def serialize_datetime(self, value: datetime) -> str:
         return value.isoformat()
 
-    @field_validator("id", "project_id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
 
 class SprintWithDetails(Sprint):
     """Спринт с дополнительной информацией"""
@@ -163,9 +159,9 @@ class SprintTaskUpdate(BaseModel):
 class SprintTask(SprintTaskBase):
     """Схема задачи спринта для API"""
 
-    id: str
-    sprint_id: str
-    task_id: str
+    id: UUIDStr
+    sprint_id: UUIDStr
+    task_id: UUIDStr
     created_at: datetime
     updated_at: datetime
 
@@ -175,12 +171,6 @@ class SprintTask(SprintTaskBase):
     def serialize_datetime(self, value: datetime) -> str:
         return value.isoformat()
 
-    @field_validator("id", "sprint_id", "task_id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
 
 class SprintTaskWithDetails(SprintTask):
     """Задача спринта с деталями"""
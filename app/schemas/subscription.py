@@ -4,9 +4,10 @@ Pydantic схемы для подписок и пакетов
 
 import uuid
 from datetime import datetime
+from decimal import Decimal
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SubscriptionResponse(BaseModel):
@@ -17,7 +18,7 @@ class SubscriptionResponse(BaseModel):
     storage_limit: int = Field(..., description="Лимит хранилища в байтах")
     file_count_limit: int = Field(..., description="Лимит количества файлов")
     max_file_size: int = Field(..., description="Максимальный размер файла в байтах")
-    allowed_file_types: str = Field(..., description="Разрешенные типы файлов (JSON)")
+    allowed_file_types: list[str] = Field(..., description="Разрешенные типы файлов")
     projects_limit: int = Field(..., description="Лимит проектов")
     users_limit: int = Field(..., description="Лимит пользователей")
     expires_at: datetime | None = Field(None, description="Дата окончания")
@@ -25,8 +26,7 @@ class SubscriptionResponse(BaseModel):
     created_at: datetime = Field(..., description="Дата создания")
     updated_at: datetime = Field(..., description="Дата обновления")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AddOnPackageResponse(BaseModel):
@@ -37,12 +37,11 @@ class AddOnPackageResponse(BaseModel):
     type: str = Field(..., description="Тип пакета")
     price: int = Field(..., description="Цена в центах")
     billing_cycle: str = Field(..., description="Цикл выставления счетов")
-    features: str = Field(..., description="Фичи пакета (JSON)")
+    features: dict[str, Any] = Field(..., description="Фичи пакета")
     description: str | None = Field(None, description="Описание")
     is_active: bool = Field(..., description="Активен ли пакет")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserAddOnResponse(BaseModel):
@@ -58,10 +57,11 @@ class UserAddOnResponse(BaseModel):
     expires_at: datetime | None = Field(None, description="Дата окончания")
     is_active: bool = Field(..., description="Активен ли пакет")
     auto_renew: bool = Field(..., description="Автопродление")
-    usage_data: str | None = Field(None, description="Данные об использовании (JSON)")
+    usage_data: dict[str, Any] | None = Field(
+        None, description="Данные об использовании"
+    )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UpgradeSuggestionResponse(BaseModel):
@@ -90,7 +90,7 @@ class BillingTransactionResponse(BaseModel):
     """Ответ с информацией о транзакции"""
 
     id: str = Field(..., description="ID транзакции")
-    amount: int = Field(..., description="Сумма в центах")
+    amount: Decimal = Field(..., description="Сумма в единицах валюты")
     currency: str = Field(..., description="Валюта")
     status: str = Field(..., description="Статус транзакции")
     payment_method: str | None = Field(None, description="Метод оплаты")
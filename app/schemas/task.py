@@ -2,11 +2,13 @@
 Схемы для задач и комментариев
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from app.schemas.common import OptUUIDStr, UUIDStr
+
 # Для mypy - определяем Literal типы
 TaskStatusLiteral = Literal["todo", "in_progress", "in_review", "done", "blocked"]
 TaskPriorityLiteral = Literal["low", "medium", "high", "urgent"]
@@ -21,7 +23,7 @@ class TaskBase(BaseModel):
     status: str = Field(default="todo")
     priority: str = Field(default="medium")
     story_point: str = Field(default="unknown")
-    due_date: str | None = None
+    due_date: date | None = None
     estimated_hours: int | None = Field(None, ge=0, le=40)
     parent_task_id: str | None = None
 
@@ -80,7 +82,7 @@ class TaskUpdate(BaseModel):
     priority: str | None = None
     story_point: str | None = None
     assignee_id: str | None = None
-    due_date: str | None = None
+    due_date: date | None = None
     estimated_hours: int | None = Field(None, ge=0)
     is_archived: bool | None = None
 
@@ -107,25 +109,19 @@ class TaskReorder(BaseModel):
 class Task(TaskBase):
     """Схема задачи для API"""
 
-    id: str
-    project_id: str
-    creator_id: str
-    assignee_id: str | None = None
+    id: UUIDStr
+    project_id: UUIDStr
+    creator_id: UUIDStr
+    assignee_id: OptUUIDStr = None
     order: int = 0
-    actual_hours: int = 0
     is_archived: bool = False
     story_points: int = 0  # Числовое значение Story Points
+    actual_minutes: int = 0  # Фактическое время по записям времени
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_validator("id", "project_id", "creator_id", "assignee_id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
 
 class TaskWithDetails(Task):
     """Задача с дополнительной информацией"""
@@ -170,21 +166,15 @@ class CommentUpdate(BaseModel):
 class Comment(CommentBase):
     """Схема комментария для API"""
 
-    id: str
-    task_id: str
-    author_id: str
+    id: UUIDStr
+    task_id: UUIDStr
+    author_id: UUIDStr
     is_edited: bool = False
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_validator("id", "task_id", "author_id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
 
 class CommentWithDetails(Comment):
     """Комментарий с деталями автора"""
@@ -219,8 +209,8 @@ class TaskFilter(BaseModel):
     creator_id: str | None = None
     story_point: str | None = None
     is_archived: bool | None = False
-    due_date_from: str | None = None
-    due_date_to: str | None = None
+    due_date_from: date | None = None
+    due_date_to: date | None = None
     search: str | None = None
 
     model_config = ConfigDict(
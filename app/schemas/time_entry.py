@@ -5,7 +5,9 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.schemas.common import UUIDStr
 
 
 class TimeEntryBase(BaseModel):
@@ -126,18 +128,12 @@ class TimeEntryStop(BaseModel):
 class TimeEntry(TimeEntryBase):
     """Схема записи времени для API"""
 
-    id: str
-    user_id: str
-    task_id: str
+    id: UUIDStr
+    user_id: UUIDStr
+    task_id: UUIDStr
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("id", "user_id", "task_id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -7,6 +7,7 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from app.core.constants import EXAMPLE_PASSWORD
+from app.schemas.common import UUIDStr
 
 
 class UserBase(BaseModel):
@@ -83,7 +84,7 @@ class UserInDB(UserBase):
 class User(UserBase):
     """Схема пользователя для API"""
 
-    id: str
+    id: UUIDStr
     created_at: datetime
     updated_at: datetime
     is_verified: bool
@@ -92,12 +93,6 @@ class User(UserBase):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        """Конвертирует UUID в строку"""
-        return str(v) if v is not None else None
-
 
 class UserProfile(User):
     """Профиль пользователя с дополнительной информацией"""
@@ -2,7 +2,6 @@
 Сервис для управления пакетами дополнений
 """
 
-import json
 import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -10,6 +9,7 @@ from typing import Any
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.models.file import FileType
 from app.models.subscription import AddOnPackage, AddOnType, UserAddOn
@@ -45,8 +45,10 @@ class AddOnService:
 
     async def get_user_packages(self, user_id: uuid.UUID) -> list[UserAddOn]:
         """Получить пакеты пользователя"""
-        stmt = select(UserAddOn).where(
-            UserAddOn.user_id == user_id, UserAddOn.is_active == True
+        stmt = (
+            select(UserAddOn)
+            .options(selectinload(UserAddOn.package))
+            .where(UserAddOn.user_id == user_id, UserAddOn.is_active == True)
         )
         result = await self.db.execute(stmt)
         return result.scalars().all()
@@ -89,12 +91,10 @@ class AddOnService:
             package_id=package_id,
             expires_at=expires_at,
             auto_renew=False,  # TODO: реализовать автопродление
-            usage_data=json.dumps(
-                {
-                    "purchased_at": datetime.now(UTC).isoformat(),
-                    "usage_count": 0,
-                }
-            ),
+            usage_data={
+                "purchased_at": datetime.now(UTC).isoformat(),
+                "usage_count": 0,
+            },
         )
 
         self.db.add(user_addon)
@@ -175,7 +175,7 @@ class AddOnService:
         if not user_addon:
             return {}
 
-        usage_data = json.loads(user_addon.usage_data or "{}")
+        usage_data = user_addon.usage_data or {}
 
         return {
             "package_id": package_id,
@@ -194,12 +194,10 @@ class AddOnService:
                 "type": AddOnType.STORAGE,
                 "price": 200,  # $2.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "storage_bytes": 1024 * 1024 * 1024,  # 1 ГБ
-                        "description": "1 ГБ дополнительного хранилища",
-                    }
-                ),
+                "features": {
+                    "storage_bytes": 1024 * 1024 * 1024,  # 1 ГБ
+                    "description": "1 ГБ дополнительного хранилища",
+                },
                 "description": "Добавьте 1 ГБ к вашему лимиту хранилища",
                 "sort_order": 1,
             },
@@ -208,12 +206,10 @@ class AddOnService:
                 "type": AddOnType.STORAGE,
                 "price": 800,  # $8.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "storage_bytes": 5 * 1024 * 1024 * 1024,  # 5 ГБ
-                        "description": "5 ГБ дополнительного хранилища (скидка 20%)",
-                    }
-                ),
+                "features": {
+                    "storage_bytes": 5 * 1024 * 1024 * 1024,  # 5 ГБ
+                    "description": "5 ГБ дополнительного хранилища (скидка 20%)",
+                },
                 "description": "Добавьте 5 ГБ к вашему лимиту хранилища со скидкой 20%",
                 "sort_order": 2,
             },
@@ -222,12 +218,10 @@ class AddOnService:
                 "type": AddOnType.STORAGE,
                 "price": 1500,  # $15.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "storage_bytes": 10 * 1024 * 1024 * 1024,  # 10 ГБ
-                        "description": "10 ГБ дополнительного хранилища (скидка 25%)",
-                    }
-                ),
+                "features": {
+                    "storage_bytes": 10 * 1024 * 1024 * 1024,  # 10 ГБ
+                    "description": "10 ГБ дополнительного хранилища (скидка 25%)",
+                },
                 "description": "Добавьте 10 ГБ к вашему лимиту хранилища со скидкой 25%",
                 "sort_order": 3,
             },
@@ -237,13 +231,11 @@ class AddOnService:
                 "type": AddOnType.VIDEO_AUDIO,
                 "price": 500,  # $5.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "max_video_size_bytes": 100 * 1024 * 1024,  # 100 МБ
-                        "allowed_types": [FileType.VIDEO.value, FileType.AUDIO.value],
-                        "description": "Загрузка видео и аудио до 100 МБ",
-                    }
-                ),
+                "features": {
+                    "max_video_size_bytes": 100 * 1024 * 1024,  # 100 МБ
+                    "allowed_types": [FileType.VIDEO.value, FileType.AUDIO.value],
+                    "description": "Загрузка видео и аудио до 100 МБ",
+                },
                 "description": "Разблокируйте загрузку видео и аудио файлов до 100 МБ",
                 "sort_order": 10,
             },
@@ -252,13 +244,11 @@ class AddOnService:
                 "type": AddOnType.VIDEO_AUDIO,
                 "price": 1500,  # $15.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "max_video_size_bytes": 500 * 1024 * 1024,  # 500 МБ
-                        "allowed_types": [FileType.VIDEO.value, FileType.AUDIO.value],
-                        "description": "Загрузка видео и аудио до 500 МБ",
-                    }
-                ),
+                "features": {
+                    "max_video_size_bytes": 500 * 1024 * 1024,  # 500 МБ
+                    "allowed_types": [FileType.VIDEO.value, FileType.AUDIO.value],
+                    "description": "Загрузка видео и аудио до 500 МБ",
+                },
                 "description": "Разблокируйте загрузку видео и аудио файлов до 500 МБ",
                 "sort_order": 11,
             },
@@ -267,13 +257,11 @@ class AddOnService:
                 "type": AddOnType.VIDEO_AUDIO,
                 "price": 2500,  # $25.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "max_video_size_bytes": 1024 * 1024 * 1024,  # 1 ГБ
-                        "allowed_types": [FileType.VIDEO.value, FileType.AUDIO.value],
-                        "description": "Загрузка видео и аудио до 1 ГБ",
-                    }
-                ),
+                "features": {
+                    "max_video_size_bytes": 1024 * 1024 * 1024,  # 1 ГБ
+                    "allowed_types": [FileType.VIDEO.value, FileType.AUDIO.value],
+                    "description": "Загрузка видео и аудио до 1 ГБ",
+                },
                 "description": "Разблокируйте загрузку видео и аудио файлов до 1 ГБ",
                 "sort_order": 12,
             },
@@ -283,12 +271,10 @@ class AddOnService:
                 "type": AddOnType.USERS,
                 "price": 1000,  # $10.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "users_count": 5,
-                        "description": "Добавьте 5 участников к вашей команде",
-                    }
-                ),
+                "features": {
+                    "users_count": 5,
+                    "description": "Добавьте 5 участников к вашей команде",
+                },
                 "description": "Расширьте команду на 5 дополнительных участников",
                 "sort_order": 20,
             },
@@ -297,12 +283,10 @@ class AddOnService:
                 "type": AddOnType.USERS,
                 "price": 2500,  # $25.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "users_count": 15,
-                        "description": "Добавьте 15 участников к вашей команде (скидка 17%)",
-                    }
-                ),
+                "features": {
+                    "users_count": 15,
+                    "description": "Добавьте 15 участников к вашей команде (скидка 17%)",
+                },
                 "description": "Расширьте команду на 15 дополнительных участников со скидкой 17%",
                 "sort_order": 21,
             },
@@ -312,13 +296,11 @@ class AddOnService:
                 "type": AddOnType.PROJECTS,
                 "price": 500,  # $5.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "projects_count": 10,
-                        "unlimited": False,
-                        "description": "Добавьте 10 проектов",
-                    }
-                ),
+                "features": {
+                    "projects_count": 10,
+                    "unlimited": False,
+                    "description": "Добавьте 10 проектов",
+                },
                 "description": "Создавайте до 10 дополнительных проектов",
                 "sort_order": 30,
             },
@@ -327,12 +309,10 @@ class AddOnService:
                 "type": AddOnType.PROJECTS,
                 "price": 1500,  # $15.00
                 "billing_cycle": "monthly",
-                "features": json.dumps(
-                    {
-                        "unlimited": True,
-                        "description": "Безлимитное количество проектов",
-                    }
-                ),
+                "features": {
+                    "unlimited": True,
+                    "description": "Безлимитное количество проектов",
+                },
                 "description": "Создавайте неограниченное количество проектов",
                 "sort_order": 31,
             },
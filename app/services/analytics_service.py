@@ -4,18 +4,21 @@
 
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, desc, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.database import bulk_copy
+from app.core.serialization import orjson_dumps
 from app.models.analytics import (
     AnalyticsEvent,
     Dashboard,
     ProjectMetrics,
     SprintMetrics,
     UserMetrics,
+    analytics_events_partition_ddl,
 )
 from app.models.project import Project
 from app.models.sprint import Sprint
@@ -66,6 +69,66 @@ class AnalyticsService:
 
         return event
 
+    async def bulk_insert_events(self, events: list[dict[str, Any]]) -> int:
+        """Массово записывает события аналитики через COPY
+
+        Каждый элемент events содержит те же поля, что и аргументы
+        track_event. Строки передаются одним COPY в бинарном формате,
+        минуя unit of work ORM. Время события проставляет БД.
+        """
+        if not events:
+            return 0
+
+        columns = [
+            "id",
+            "event_type",
+            "event_category",
+            "user_id",
+            "entity_type",
+            "entity_id",
+            "event_data",
+            "session_id",
+            "ip_address",
+            "user_agent",
+        ]
+        records = [
+            (
+                uuid4(),
+                item["event_type"],
+                item["event_category"],
+                item.get("user_id"),
+                item.get("entity_type"),
+                item.get("entity_id"),
+                # Кодек jsonb драйвера принимает уже сериализованную строку
+                (
+                    orjson_dumps(item["event_data"]).decode()
+                    if item.get("event_data") is not None
+                    else None
+                ),
+                item.get("session_id"),
+                item.get("ip_address"),
+                item.get("user_agent"),
+            )
+            for item in events
+        ]
+
+        inserted = await bulk_copy(
+            self.db_session, AnalyticsEvent.__table__, columns, records
+        )
+        await self.db_session.commit()
+
+        return inserted
+
+    async def ensure_events_partition(self, month_start: datetime) -> None:
+        """Создает месячную секцию analytics_events, если ее еще нет
+
+        Вызывается заранее (например, из периодической задачи) для
+        следующего месяца, пока в секции по умолчанию нет его строк.
+        """
+        connection = await self.db_session.connection()
+        await connection.execute(analytics_events_partition_ddl(month_start))
+        await self.db_session.commit()
+
     async def get_events(
         self,
         user_id: UUID | None = None,
@@ -453,15 +516,20 @@ class AnalyticsService:
 
     async def update_dashboard_view(self, dashboard_id: UUID) -> None:
         """Обновляет статистику просмотра дашборда"""
-        query = select(Dashboard).where(Dashboard.id == dashboard_id)
-        result = await self.db_session.execute(query)
-        dashboard = result.scalar_one_or_none()
-
-        if dashboard:
-            dashboard.last_viewed = datetime.utcnow()
-            dashboard.view_count += 1
-            dashboard.updated_at = datetime.utcnow()
-            await self.db_session.commit()
+        # Инкремент на стороне БД: без предварительного SELECT и потери обновлений
+        now = datetime.utcnow()
+        query = (
+            update(Dashboard)
+            .where(Dashboard.id == dashboard_id)
+            .values(
+                view_count=Dashboard.view_count + 1,
+                last_viewed=now,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        await self.db_session.execute(query)
+        await self.db_session.commit()
 
     # === Агрегированная аналитика ===
 
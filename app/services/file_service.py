@@ -4,10 +4,11 @@
 
 import hashlib
 import uuid
+from datetime import UTC, datetime
 from pathlib import Path
 
 from fastapi import HTTPException, UploadFile
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -287,7 +288,7 @@ class FileService:
                 content = f.read()
 
             # Обновление статистики
-            db_file.increment_download_count()
+            await self._increment_download_count(file_id)
             await self.db.commit()
 
             return db_file, content
@@ -295,6 +296,24 @@ class FileService:
         except Exception:
             return None
 
+    async def _increment_download_count(self, file_id: uuid.UUID) -> None:
+        """
+        Атомарно увеличить счетчик скачиваний одним UPDATE
+
+        Инкремент выполняется на стороне БД (download_count + 1), поэтому
+        параллельные скачивания не теряют обновления и не требуют
+        чтения строки перед записью.
+        """
+        await self.db.execute(
+            update(File)
+            .where(File.id == file_id)
+            .values(
+                download_count=File.download_count + 1,
+                last_accessed_at=datetime.now(UTC),
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+
     async def _validate_file(self, file: UploadFile) -> None:
         """Валидация файла"""
         if not file.filename:
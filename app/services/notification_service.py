@@ -1,11 +1,13 @@
 """Сервис для управления уведомлениями."""
 
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, insert, lambda_stmt, not_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import raiseload
 
 from app.models.notification import Notification, NotificationType
 from app.models.project import ProjectMember
@@ -23,6 +25,13 @@ from app.schemas.notification import (
 )
 from app.services.notification_websocket_integration import notify_user_websocket
 
+# Размер пачки для многострочного INSERT: ~12 колонок на строку
+# с запасом укладываются в лимит 32767 параметров PostgreSQL
+BULK_INSERT_BATCH_SIZE = 1000
+
+# Размер пачки серверного курсора при выгрузке всех уведомлений
+EXPORT_BATCH_SIZE = 1000
+
 
 class NotificationService:
     """Сервис для работы с уведомлениями."""
@@ -34,11 +43,15 @@ class NotificationService:
         self,
         notification_data: NotificationCreate,
     ) -> Notification:
-        """Создание уведомления."""
-        notification = Notification(**notification_data.model_dump())
-        self.db.add(notification)
+        """Создание уведомления.
+
+        INSERT ... RETURNING сразу возвращает id и даты, без refresh.
+        """
+        notification = await self.db.scalar(
+            insert(Notification).returning(Notification),
+            [notification_data.model_dump()],
+        )
         await self.db.commit()
-        await self.db.refresh(notification)
 
         # Отправляем уведомление через WebSocket
         try:
@@ -49,6 +62,37 @@ class NotificationService:
 
         return notification
 
+    async def create_notifications_bulk(
+        self,
+        notifications_data: list[NotificationCreate],
+    ) -> list[Notification]:
+        """Массовое создание уведомлений.
+
+        Строки вставляются многострочными INSERT ... RETURNING пачками,
+        вместо отдельного INSERT и commit на каждого получателя.
+        """
+        notifications: list[Notification] = []
+        rows = [data.model_dump() for data in notifications_data]
+
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            batch = rows[start : start + BULK_INSERT_BATCH_SIZE]
+            result = await self.db.scalars(
+                insert(Notification).returning(Notification), batch
+            )
+            notifications.extend(result.all())
+
+        await self.db.commit()
+
+        # Отправляем уведомления через WebSocket
+        for notification in notifications:
+            try:
+                await notify_user_websocket(notification)
+            except Exception as e:
+                # Логируем ошибку, но не прерываем создание уведомлений
+                print(f"Ошибка отправки уведомления через WebSocket: {e}")
+
+        return notifications
+
     async def create_user_notification(
         self,
         user_id: UUID,
@@ -62,8 +106,6 @@ class NotificationService:
         metadata_json: dict | None = None,
     ) -> Notification:
         """Создание уведомления пользователя с удобными параметрами."""
-        import json
-
         notification_data = NotificationCreate(
             user_id=user_id,
             title=title,
@@ -73,7 +115,7 @@ class NotificationService:
             task_id=task_id,
             sprint_id=sprint_id,
             action_url=action_url,
-            metadata_json=json.dumps(metadata_json) if metadata_json else None,
+            metadata_json=metadata_json or None,
         )
         return await self.create_notification(notification_data)
 
@@ -86,20 +128,54 @@ class NotificationService:
         notification_type: str | None = None,
     ) -> list[Notification]:
         """Получение уведомлений пользователя."""
-        query = select(Notification).where(Notification.user_id == user_id)  # type: ignore[arg-type]
+        # Лента использует только колонки уведомления: связи не загружаем,
+        # а случайное обращение к ним (N+1) сразу дает ошибку.
+        # lambda_stmt кэширует построенный запрос по месту в коде: на горячем
+        # пути не строится заново select() и его ключ кэша, аргументы метода
+        # уходят в связанные параметры
+        query = lambda_stmt(
+            lambda: select(Notification)
+            .options(raiseload("*"))
+            .where(Notification.user_id == user_id)  # type: ignore[arg-type]
+        )
 
         if unread_only:
-            query = query.where(Notification.is_read == False)  # type: ignore[arg-type]
+            # NOT is_read совпадает с условием частичного индекса ленты
+            query += lambda s: s.where(not_(Notification.is_read))
 
         if notification_type:
-            query = query.where(Notification.notification_type == notification_type)  # type: ignore[arg-type]
+            query += lambda s: s.where(
+                Notification.notification_type == notification_type
+            )
 
-        query = query.order_by(desc(Notification.created_at))  # type: ignore[arg-type]
-        query = query.limit(limit).offset(offset)
+        query += (
+            lambda s: s.order_by(desc(Notification.created_at))
+            .limit(limit)
+            .offset(offset)
+        )
 
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def iter_user_notifications(
+        self, user_id: UUID, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Sequence[Notification]]:
+        """Выгрузка всех уведомлений пользователя пачками.
+
+        Строки читаются через серверный курсор, поэтому в памяти
+        одновременно находится не больше batch_size уведомлений.
+        """
+        query = (
+            select(Notification)
+            .options(raiseload("*"))
+            .where(Notification.user_id == user_id)  # type: ignore[arg-type]
+            .order_by(desc(Notification.created_at))  # type: ignore[arg-type]
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream_scalars(query)
+        async for batch in result.partitions(batch_size):
+            yield batch
+
     async def get_notification_by_id(
         self, notification_id: UUID, user_id: UUID
     ) -> Notification | None:
@@ -114,12 +190,26 @@ class NotificationService:
     async def mark_notification_read(
         self, notification_id: UUID, user_id: UUID
     ) -> Notification | None:
-        """Отметить уведомление как прочитанное."""
-        notification = await self.get_notification_by_id(notification_id, user_id)
-        if notification:
-            notification.mark_as_read()
-            await self.db.commit()
-            await self.db.refresh(notification)
+        """Отметить уведомление как прочитанное одним UPDATE ... RETURNING.
+
+        Время прочтения берется из часов БД; у уже прочитанного
+        уведомления read_at не меняется.
+        """
+        result = await self.db.execute(
+            update(Notification)
+            .where(
+                Notification.id == notification_id,
+                Notification.user_id == user_id,  # type: ignore[arg-type]
+            )
+            .values(
+                is_read=True,
+                read_at=func.coalesce(Notification.read_at, func.now()),
+            )
+            .returning(Notification)
+            .execution_options(populate_existing=True)
+        )
+        notification = result.scalar_one_or_none()
+        await self.db.commit()
         return notification
 
     async def mark_notifications_unread(
@@ -140,23 +230,18 @@ class NotificationService:
         return list(notifications)
 
     async def mark_all_notifications_read(self, user_id: UUID) -> int:
-        """Отметить все уведомления как прочитанные."""
-        query = (
-            select(Notification)
+        """Отметить все уведомления как прочитанные одним UPDATE."""
+        result = await self.db.execute(
+            update(Notification)
             .where(
                 Notification.user_id == user_id,  # type: ignore[arg-type]
                 Notification.is_read == False,  # type: ignore[arg-type]
             )
-            .with_for_update()
+            .values(is_read=True, read_at=func.now())
+            .execution_options(synchronize_session="fetch")
         )
-        result = await self.db.execute(query)
-        notifications = result.scalars().all()
-
-        for notification in notifications:
-            notification.mark_as_read()
-
         await self.db.commit()
-        return len(notifications)
+        return result.rowcount
 
     async def delete_notification(self, notification_id: UUID, user_id: UUID) -> bool:
         """Удалить уведомление."""
@@ -186,9 +271,11 @@ class NotificationService:
 
     async def get_unread_count(self, user_id: UUID) -> int:
         """Получить количество непрочитанных уведомлений."""
-        query = select(func.count(Notification.id)).where(
-            Notification.user_id == user_id,  # type: ignore[arg-type]
-            Notification.is_read == False,  # type: ignore[arg-type]
+        query = lambda_stmt(
+            lambda: select(func.count(Notification.id)).where(
+                Notification.user_id == user_id,  # type: ignore[arg-type]
+                Notification.is_read == False,  # type: ignore[arg-type]
+            )
         )
         result = await self.db.execute(query)
         return result.scalar() or 0
@@ -215,10 +302,9 @@ class NotificationService:
         unread = len(unread_result.scalars().all()) or 0
 
         # Недавние (менее 24 часов)
-        recent_time = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=24)
         recent_query = select(func.count(Notification.id)).where(
             Notification.user_id == user_id,  # type: ignore[arg-type]
-            Notification.created_at >= recent_time,  # type: ignore[arg-type]
+            Notification.is_recent,
         )
         recent_result = await self.db.execute(recent_query)
         recent = recent_result.scalar() or 0
@@ -429,7 +515,7 @@ class NotificationService:
         self, sprint_id: UUID, project_id: UUID
     ) -> list[Notification]:
         """Уведомление о начале спринта."""
-        notifications: list[Notification] = []
+        notifications_data: list[NotificationCreate] = []
 
         # Получаем всех участников проекта
         members_query = select(ProjectMember).where(
@@ -450,17 +536,15 @@ class NotificationService:
                     )
                 )
                 notification_data.user_id = member.user_id
+                notifications_data.append(notification_data)
 
-                notification = await self.create_notification(notification_data)
-                notifications.append(notification)
-
-        return list(notifications)
+        return await self.create_notifications_bulk(notifications_data)
 
     async def notify_sprint_completed(
         self, sprint_id: UUID, project_id: UUID
     ) -> list[Notification]:
         """Уведомление о завершении спринта."""
-        notifications: list[Notification] = []
+        notifications_data: list[NotificationCreate] = []
 
         # Получаем всех участников проекта
         members_query = select(ProjectMember).where(
@@ -481,11 +565,9 @@ class NotificationService:
                     )
                 )
                 notification_data.user_id = member.user_id
+                notifications_data.append(notification_data)
 
-                notification = await self.create_notification(notification_data)
-                notifications.append(notification)
-
-        return list(notifications)
+        return await self.create_notifications_bulk(notifications_data)
 
     async def cleanup_old_notifications(
         self, days_old: int = 30, read_only: bool = True
@@ -4,7 +4,7 @@
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from app.core.database import get_db_session_context
 from app.models.project import Project, ProjectMember, ProjectRole
@@ -395,7 +395,11 @@ class ProjectService:
     ) -> Project | None:
         """Внутренний метод для проверки прав доступа к проекту"""
 
-        query = select(Project).where(Project.id == project_id)
+        query = (
+            select(Project)
+            .options(undefer(Project.member_count))
+            .where(Project.id == project_id)
+        )
 
         # Если нужно проверить участие в проекте
         if user_id:
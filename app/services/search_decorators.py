@@ -59,7 +59,9 @@ def auto_index(entity_type: SearchableType) -> Callable[..., Callable]:
                         "status": result.status,
                         "priority": result.priority,
                         "story_point": result.story_point,
-                        "due_date": result.due_date,
+                        "due_date": (
+                            result.due_date.isoformat() if result.due_date else None
+                        ),
                     }
 
                 elif entity_type == SearchableType.PROJECT and isinstance(result, type):
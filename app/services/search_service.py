@@ -2,18 +2,19 @@
 Сервис для полнотекстового поиска
 """
 
-import json
 import uuid
+from collections.abc import Sequence
 from typing import Any
 
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from app.models.project import Project, ProjectMember
 from app.models.search import SavedSearch, SearchableType, SearchIndex
 from app.models.sprint import Sprint
 from app.models.task import Comment, Task
+from app.schemas.search import SearchEntityData
 
 
 class SearchService:
@@ -38,20 +39,16 @@ class SearchService:
         # Удаляем существующий индекс
         await self.remove_from_index(entity_type, entity_id)
 
-        # Создаем поисковый вектор
-        search_text = f"{title} {content or ''}"
-
-        # Создаем новый индекс
+        # Создаем новый индекс (search_vector вычисляет БД)
         search_index = SearchIndex(
             title=title,
             content=content,
-            search_vector=func.to_tsvector("russian", search_text),
             entity_type=entity_type,
             entity_id=entity_id,
             project_id=project_id,
             user_id=user_id,
             is_public=is_public,
-            search_metadata=json.dumps(metadata) if metadata else None,
+            search_metadata=metadata or None,
         )
 
         self.db.add(search_index)
@@ -84,7 +81,7 @@ class SearchService:
         self,
         query: str,
         user_id: uuid.UUID,
-        entity_types: list[SearchableType] | None = None,
+        entity_types: Sequence[str] | None = None,
         project_ids: list[uuid.UUID] | None = None,
         limit: int = 50,
         offset: int = 0,
@@ -173,11 +170,7 @@ class SearchService:
                     str(search_index.project_id) if search_index.project_id else None
                 ),
                 "is_public": search_index.is_public,
-                "metadata": (
-                    json.loads(search_index.search_metadata)
-                    if search_index.search_metadata
-                    else None
-                ),
+                "metadata": search_index.search_metadata,
                 "entity_data": entity_data,  # Может быть None
             }
             results.append(result)
@@ -214,7 +207,7 @@ class SearchService:
         self,
         entity_type: SearchableType,
         entity_id: uuid.UUID,
-    ) -> dict[str, Any] | None:
+    ) -> SearchEntityData | None:
         """Получить детальные данные сущности"""
 
         if entity_type == SearchableType.TASK:
@@ -238,7 +231,7 @@ class SearchService:
                     "project_name": task.project.name if task.project else None,
                     "assignee_name": task.assignee.full_name if task.assignee else None,
                     "creator_name": task.creator.full_name if task.creator else None,
-                    "due_date": task.due_date,
+                    "due_date": (task.due_date.isoformat() if task.due_date else None),
                     "created_at": (
                         task.created_at.isoformat() if task.created_at else None
                     ),
@@ -249,7 +242,7 @@ class SearchService:
                 select(Project)
                 .options(
                     selectinload(Project.owner),
-                    selectinload(Project.members),
+                    undefer(Project.member_count),
                 )
                 .where(Project.id == entity_id)
             )
@@ -270,7 +263,11 @@ class SearchService:
         elif entity_type == SearchableType.SPRINT:
             stmt = (
                 select(Sprint)
-                .options(selectinload(Sprint.project))
+                .options(
+                    selectinload(Sprint.project),
+                    undefer(Sprint.task_count),
+                    undefer(Sprint.completed_task_count),
+                )
                 .where(Sprint.id == entity_id)
             )
             result = await self.db.execute(stmt)
@@ -330,7 +327,7 @@ class SearchService:
         saved_search = SavedSearch(
             name=name,
             query=query,
-            filters=json.dumps(filters) if filters else None,
+            filters=filters or None,
             user_id=user_id,
             is_public=is_public,
         )
@@ -405,7 +402,7 @@ class SearchService:
                     "status": task.status,
                     "priority": task.priority,
                     "story_point": task.story_point,
-                    "due_date": task.due_date,
+                    "due_date": (task.due_date.isoformat() if task.due_date else None),
                 },
             )
 
@@ -3,25 +3,26 @@
 """
 
 import secrets
-from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.project import Project, ProjectMember
 from app.models.share_link import ShareableType as ModelShareableType
 from app.models.share_link import ShareLink
 from app.models.share_link import SharePermission as ModelSharePermission
 from app.models.task import Task
-from app.schemas.share_link import ShareableType as SchemaShareableType
 from app.schemas.share_link import (
+    SHARE_LINK_RESPONSE_LIST_ADAPTER,
+    SharedContent,
     ShareLinkCreate,
-    ShareLinkResponse,
     ShareLinkStats,
     ShareLinkUpdate,
 )
+from app.schemas.share_link import ShareableType as SchemaShareableType
 
 
 class ShareLinkService:
@@ -137,7 +138,7 @@ class ShareLinkService:
 
     async def access_shared_content(
         self, token: str, password: str | None = None
-    ) -> tuple[ShareLink, dict] | None:
+    ) -> tuple[ShareLink, SharedContent] | None:
         """Получить доступ к контенту по публичной ссылке."""
         share_link = await self.get_share_link_by_token(token)
 
@@ -145,8 +146,9 @@ class ShareLinkService:
             return None
 
         # Увеличиваем счетчик просмотров
-        share_link.increment_views()
-        await self.db.commit()
+        if not await self._increment_views(share_link):
+            # Лимит просмотров исчерпан параллельными запросами
+            return None
 
         # Получаем контент
         content = await self._get_shared_content(
@@ -156,6 +158,28 @@ class ShareLinkService:
 
         return share_link, content
 
+    async def _increment_views(self, share_link: ShareLink) -> bool:
+        """Атомарно увеличить счетчик просмотров одним UPDATE ... RETURNING.
+
+        Условие доступности проверяется в том же запросе, поэтому
+        параллельные просмотры не превышают max_views.
+        """
+        result = await self.db.execute(
+            update(ShareLink)
+            .where(ShareLink.id == share_link.id, ShareLink.is_accessible)
+            .values(current_views=ShareLink.current_views + 1)
+            .returning(ShareLink.current_views)
+            .execution_options(synchronize_session=False)
+        )
+        current_views = result.scalar_one_or_none()
+        await self.db.commit()
+
+        if current_views is None:
+            return False
+
+        set_committed_value(share_link, "current_views", current_views)
+        return True
+
     async def get_share_stats(self, user_id: UUID) -> ShareLinkStats:
         """Получить статистику ссылок пользователя."""
         # Общая статистика
@@ -176,7 +200,7 @@ class ShareLinkService:
         # Истекшие ссылки
         expired_query = select(func.count(ShareLink.id)).where(
             ShareLink.created_by == user_id,
-            ShareLink.expires_at < datetime.now(UTC),
+            ShareLink.is_expired,
         )
         expired_result = await self.db.execute(expired_query)
         expired_links = expired_result.scalar() or 0
@@ -203,9 +227,9 @@ class ShareLinkService:
             active_links=active_links,
             expired_links=expired_links,
             total_views=total_views,
-            most_viewed=[
-                ShareLinkResponse.model_validate(link.to_dict()) for link in most_viewed
-            ],
+            most_viewed=SHARE_LINK_RESPONSE_LIST_ADAPTER.validate_python(
+                [link.to_dict() for link in most_viewed]
+            ),
         )
 
     async def _token_exists(self, token: str) -> bool:
@@ -250,7 +274,7 @@ class ShareLinkService:
 
     async def _get_shared_content(
         self, shareable_type: ModelShareableType, shareable_id: UUID
-    ) -> dict:
+    ) -> SharedContent:
         """Получить контент для шаринга."""
         if shareable_type == ModelShareableType.PROJECT:
             query = select(Project).where(Project.id == shareable_id)
@@ -7,7 +7,7 @@ from datetime import date, datetime, timedelta
 
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from app.models.sprint import Sprint, SprintStatus, SprintTask
 from app.models.task import TaskStatus
@@ -48,7 +48,7 @@ class SprintService:
         """Получение спринта по ID"""
         result = await self.db.execute(
             select(Sprint)
-            .options(selectinload(Sprint.sprint_tasks).selectinload(SprintTask.task))
+            .options(undefer(Sprint.task_count), undefer(Sprint.completed_task_count))
             .where(Sprint.id == uuid.UUID(sprint_id))
         )
         return result.scalar_one_or_none()
@@ -388,7 +388,7 @@ class SprintService:
         """Получение активного спринта проекта"""
         result = await self.db.execute(
             select(Sprint)
-            .options(selectinload(Sprint.sprint_tasks).selectinload(SprintTask.task))
+            .options(undefer(Sprint.task_count), undefer(Sprint.completed_task_count))
             .where(
                 and_(
                     Sprint.project_id == uuid.UUID(project_id),
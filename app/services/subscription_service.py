@@ -2,13 +2,14 @@
 Сервис для работы с подписками и монетизацией
 """
 
-import json
 import uuid
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.config import get_settings
 from app.models.file import File, FileType
@@ -22,6 +23,16 @@ from app.models.subscription import (
 from app.models.user import User
 
 
+@lru_cache(maxsize=64)
+def allowed_file_types_header(file_types: tuple[str, ...]) -> str:
+    """Значение заголовка X-Allowed-File-Types для набора типов файлов
+
+    Наборов типов столько же, сколько комбинаций тарифа и пакетов, поэтому
+    строка собирается один раз на набор, а не на каждый запрос.
+    """
+    return ",".join(file_types)
+
+
 class SubscriptionService:
     """Сервис для управления подписками и лимитами"""
 
@@ -45,12 +56,13 @@ class SubscriptionService:
         addons = await self.get_user_addons(user_id)
 
         # Базовые лимиты из подписки
+        base_limits: dict[str, Any]
         if subscription:
             base_limits = {
                 "storage_limit": subscription.storage_limit,
                 "file_count_limit": subscription.file_count_limit,
                 "max_file_size": subscription.max_file_size,
-                "allowed_file_types": json.loads(subscription.allowed_file_types),
+                "allowed_file_types": list(subscription.allowed_file_types),
                 "projects_limit": subscription.projects_limit,
                 "users_limit": subscription.users_limit,
             }
@@ -60,7 +72,7 @@ class SubscriptionService:
 
         # Добавляем лимиты из пакетов
         for addon in addons:
-            addon_features = json.loads(addon.package.features)
+            addon_features = addon.package.features
             if addon.package.type == AddOnType.STORAGE:
                 base_limits["storage_limit"] += addon_features.get("storage_bytes", 0)
             elif addon.package.type == AddOnType.USERS:
@@ -89,14 +101,19 @@ class SubscriptionService:
         """Получить активные пакеты пользователя"""
         from sqlalchemy import and_, or_
 
-        current_time = datetime.now()
-        stmt = select(UserAddOn).where(
-            and_(
-                UserAddOn.user_id == user_id,
-                UserAddOn.is_active == True,
-                or_(
-                    UserAddOn.expires_at.is_(None), UserAddOn.expires_at > current_time
-                ),
+        current_time = datetime.now(UTC)
+        stmt = (
+            select(UserAddOn)
+            .options(selectinload(UserAddOn.package))
+            .where(
+                and_(
+                    UserAddOn.user_id == user_id,
+                    UserAddOn.is_active == True,
+                    or_(
+                        UserAddOn.expires_at.is_(None),
+                        UserAddOn.expires_at > current_time,
+                    ),
+                )
             )
         )
         result = await self.db.execute(stmt)
@@ -148,7 +165,8 @@ class SubscriptionService:
         self, user_id: uuid.UUID, file_size: int, file_type: FileType
     ) -> None:
         """Отследить использование ресурсов"""
-        today = datetime.now().date()
+        # Запись за сутки привязана к началу дня по UTC
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
 
         # Ищем запись за сегодня
         stmt = select(UsageTracker).where(
@@ -165,7 +183,6 @@ class SubscriptionService:
                 tracker.video_uploads += 1
             elif file_type == FileType.AUDIO:
                 tracker.audio_uploads += 1
-            tracker.updated_at = datetime.now()
         else:
             # Создаем новую запись
             tracker = UsageTracker(
@@ -186,14 +203,22 @@ class SubscriptionService:
         """Получить отчет об использовании"""
         start_date = datetime.now(UTC) - timedelta(days=days)
 
+        # Не больше одной строки за день: читаем только нужные колонки кортежами,
+        # без ORM-объектов и identity map
         stmt = (
-            select(UsageTracker)
+            select(
+                UsageTracker.date,
+                UsageTracker.storage_used,
+                UsageTracker.files_count,
+                UsageTracker.video_uploads,
+                UsageTracker.audio_uploads,
+            )
             .where(UsageTracker.user_id == user_id, UsageTracker.date >= start_date)
             .order_by(UsageTracker.date.desc())
         )
 
         result = await self.db.execute(stmt)
-        trackers = result.scalars().all()
+        trackers = result.all()
 
         if not trackers:
             return {
@@ -326,7 +351,6 @@ class SubscriptionService:
             user_id=user_id,
             plan=SubscriptionPlan.FREE,
             **limits,
-            allowed_file_types=json.dumps(limits["allowed_file_types"]),
         )
 
         self.db.add(subscription)
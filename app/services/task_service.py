@@ -121,7 +121,10 @@ class TaskService:
         await self.db.flush()  # Получаем ID без commit
 
         # ✅ Оптимизированная загрузка связанных данных
-        await self.db.refresh(task, ["project", "creator", "assignee", "parent_task"])
+        await self.db.refresh(
+            task,
+            ["project", "creator", "assignee", "parent_task", "actual_minutes"],
+        )
 
         # commit будет выполнен автоматически через get_db()
         return task
@@ -220,15 +223,15 @@ class TaskService:
 
         query = query.order_by(Task.order.asc(), Task.created_at.desc())
         query = query.offset(skip).limit(limit)
+        # Связи загружаются пакетно (по запросу на связь), а не refresh на задачу
+        query = query.options(
+            selectinload(Task.creator),
+            selectinload(Task.assignee),
+            selectinload(Task.subtasks),
+        )
 
         result = await self.db.execute(query)
-        tasks = result.scalars().all()
-
-        # Загружаем связи
-        for task in tasks:
-            await self.db.refresh(task, ["creator", "assignee", "subtasks"])
-
-        return list(tasks)
+        return list(result.scalars().all())
 
     @auto_index(SearchableType.TASK)
     async def update_task(
@@ -512,10 +515,8 @@ class TaskService:
             select(func.count(Task.id)).where(
                 and_(
                     Task.project_id == project_id,
-                    Task.due_date.isnot(None),
-                    Task.status != TaskStatus.DONE,
+                    Task.is_overdue,
                     Task.is_archived.is_(False),
-                    # TODO: добавить проверку даты
                 )
             )
         )
@@ -271,11 +271,11 @@ class UserService:
             username=user.username,
             full_name=user.full_name,
             avatar_url=user.avatar_url,
-            is_active=user.is_active_bool,
+            is_active=user.is_active,
             role=user.role or "USER",
-            is_verified=user.is_verified_bool,
-            github_id=user.github_id_str,
-            github_username=user.github_username_str,
+            is_verified=user.is_verified,
+            github_id=user.github_id,
+            github_username=user.github_username,
             created_at=user.created_at,
             updated_at=user.updated_at,
             project_count=project_count,
@@ -7,7 +7,7 @@ from datetime import date, datetime
 from uuid import UUID
 
 from sqlalchemy import and_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from app.core.database import get_db_session_context
 from app.exceptions import (
@@ -220,7 +220,9 @@ class ProjectValidator(BaseValidator):
     async def validate_member_limit(project_id: str) -> None:
         """Проверка лимита участников проекта"""
         async with get_db_session_context() as session:
-            project = await session.get(Project, project_id)
+            project = await session.get(
+                Project, project_id, options=[undefer(Project.member_count)]
+            )
 
             if not project:
                 raise NotFoundError("Проект", project_id)
@@ -228,9 +230,7 @@ class ProjectValidator(BaseValidator):
             if project.is_at_member_limit:
                 from app.exceptions import ProjectMemberLimitError
 
-                raise ProjectMemberLimitError(
-                    project.member_count, int(project.max_members)
-                )
+                raise ProjectMemberLimitError(project.member_count, project.max_members)
 
     @staticmethod
     async def validate_user_not_member(project_id: str, user_id: str) -> None:
@@ -256,12 +256,17 @@ class TaskValidator(BaseValidator):
     """Валидатор для задач"""
 
     @staticmethod
-    async def validate_task_exists(task_id: str) -> Task:
-        """Проверка существования задачи"""
+    async def validate_task_exists(task_id: str, load_subtasks: bool = False) -> Task:
+        """Проверка существования задачи
+
+        load_subtasks загружает подзадачи для has_subtasks: ленивая подгрузка
+        связей задачи запрещена (lazy="raise_on_sql").
+        """
         BaseValidator.validate_uuid(task_id, "task_id")
 
         async with get_db_session_context() as session:
-            task = await session.get(Task, task_id)
+            options = [selectinload(Task.subtasks)] if load_subtasks else []
+            task = await session.get(Task, task_id, options=options)
 
             if not task:
                 raise NotFoundError("Задача", task_id)
@@ -363,7 +368,7 @@ class TaskValidator(BaseValidator):
     @staticmethod
     async def validate_task_deletion(task_id: str) -> Task:
         """Проверка возможности удаления задачи"""
-        task = await TaskValidator.validate_task_exists(task_id)
+        task = await TaskValidator.validate_task_exists(task_id, load_subtasks=True)
 
         if task.has_subtasks:
             from app.exceptions import TaskHasSubtasksError
@@ -0,0 +1,33 @@
+"""Add partial index for image files
+
+Revision ID: add_files_images_index
+Revises: drop_redundant_id_indexes
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_files_images_index"
+down_revision: str | None = "drop_redundant_id_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create partial index on image files"""
+    op.create_index(
+        "ix_files_images",
+        "files",
+        ["uploader_id", "uploaded_at"],
+        postgresql_where=sa.text("file_type = 'image' AND NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    """Drop partial index on image files"""
+    op.drop_index("ix_files_images", table_name="files")
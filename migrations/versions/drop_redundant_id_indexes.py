@@ -0,0 +1,42 @@
+"""Drop redundant indexes on primary key id columns
+
+Revision ID: drop_redundant_id_indexes
+Revises: a1dafd8ebd3e
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "drop_redundant_id_indexes"
+down_revision: str | None = "a1dafd8ebd3e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Таблицы, для которых первичный ключ id дублировался отдельным индексом
+TABLES = (
+    "users",
+    "projects",
+    "project_members",
+    "sprints",
+    "tasks",
+    "comments",
+    "notifications",
+    "sprint_tasks",
+    "time_entries",
+)
+
+
+def upgrade() -> None:
+    """Drop ix_<table>_id indexes: primary key already provides a btree"""
+    for table in TABLES:
+        op.drop_index(op.f(f"ix_{table}_id"), table_name=table)
+
+
+def downgrade() -> None:
+    """Recreate ix_<table>_id indexes"""
+    for table in TABLES:
+        op.create_index(op.f(f"ix_{table}_id"), table, ["id"], unique=False)
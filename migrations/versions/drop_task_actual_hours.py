@@ -0,0 +1,37 @@
+"""Drop tasks.actual_hours in favour of time entry totals
+
+Revision ID: drop_task_actual_hours
+Revises: task_due_date_date_type
+Create Date: 2026-10-17 15:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "drop_task_actual_hours"
+down_revision: str | None = "task_due_date_date_type"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Drop actual_hours: time is summed from time_entries"""
+    op.drop_column("tasks", "actual_hours")
+
+
+def downgrade() -> None:
+    """Restore actual_hours column"""
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "actual_hours",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Фактическое время в часах",
+        ),
+    )
@@ -0,0 +1,52 @@
+"""Convert JSON text columns to JSONB
+
+Revision ID: json_columns_to_jsonb
+Revises: project_members_project_role_index
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "json_columns_to_jsonb"
+down_revision: str | None = "project_members_project_role_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (таблица, колонка)
+JSON_COLUMNS = (
+    ("notifications", "metadata_json"),
+    ("search_index", "search_metadata"),
+    ("saved_searches", "filters"),
+)
+
+
+def upgrade() -> None:
+    """Convert text columns to jsonb"""
+    for table_name, column_name in JSON_COLUMNS:
+        op.alter_column(
+            table_name,
+            column_name,
+            existing_type=sa.Text(),
+            type_=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column_name}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    """Convert jsonb columns back to text"""
+    for table_name, column_name in JSON_COLUMNS:
+        op.alter_column(
+            table_name,
+            column_name,
+            existing_type=postgresql.JSONB(),
+            type_=sa.Text(),
+            existing_nullable=True,
+            postgresql_using=f"{column_name}::text",
+        )
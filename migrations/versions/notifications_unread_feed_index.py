@@ -0,0 +1,38 @@
+"""Add partial index for unread notification feed
+
+Revision ID: notifications_unread_feed_index
+Revises: json_columns_to_jsonb
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "notifications_unread_feed_index"
+down_revision: str | None = "json_columns_to_jsonb"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create unread feed index and drop single-column is_read index"""
+    op.create_index(
+        "ix_notifications_user_unread_feed",
+        "notifications",
+        ["user_id", "created_at"],
+        postgresql_where=sa.text("NOT is_read"),
+        postgresql_include=["notification_type"],
+    )
+    op.drop_index("ix_notifications_is_read", table_name="notifications")
+
+
+def downgrade() -> None:
+    """Restore is_read index and drop unread feed index"""
+    op.create_index(
+        "ix_notifications_is_read", "notifications", ["is_read"], unique=False
+    )
+    op.drop_index("ix_notifications_user_unread_feed", table_name="notifications")
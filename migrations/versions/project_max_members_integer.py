@@ -0,0 +1,44 @@
+"""Convert projects.max_members to integer
+
+Revision ID: project_max_members_integer
+Revises: add_files_images_index
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "project_max_members_integer"
+down_revision: str | None = "add_files_images_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Store max_members as integer with default 5"""
+    op.alter_column(
+        "projects",
+        "max_members",
+        existing_type=sa.String(length=10),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        server_default="5",
+        postgresql_using="max_members::integer",
+    )
+
+
+def downgrade() -> None:
+    """Store max_members as string again"""
+    op.alter_column(
+        "projects",
+        "max_members",
+        existing_type=sa.Integer(),
+        type_=sa.String(length=10),
+        existing_nullable=False,
+        server_default=None,
+        postgresql_using="max_members::varchar(10)",
+    )
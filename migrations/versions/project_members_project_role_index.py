@@ -0,0 +1,31 @@
+"""Add composite index on project_members (project_id, role)
+
+Revision ID: project_members_project_role_index
+Revises: project_max_members_integer
+Create Date: 2026-10-17 11:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "project_members_project_role_index"
+down_revision: str | None = "project_max_members_integer"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create composite index for member lookups and counts"""
+    op.create_index(
+        "ix_project_members_project_id_role",
+        "project_members",
+        ["project_id", "role"],
+    )
+
+
+def downgrade() -> None:
+    """Drop composite index on project_members"""
+    op.drop_index("ix_project_members_project_id_role", table_name="project_members")
@@ -0,0 +1,52 @@
+"""Add full-text and entity indexes to search_index
+
+Revision ID: search_index_gin_indexes
+Revises: search_vector_generated_column
+Create Date: 2026-10-17 13:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "search_index_gin_indexes"
+down_revision: str | None = "search_vector_generated_column"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create GIN, entity and partial project indexes"""
+    op.create_index(
+        "ix_search_index_search_vector",
+        "search_index",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_search_index_entity",
+        "search_index",
+        ["entity_type", "entity_id"],
+        unique=True,
+    )
+    # Полный индекс по project_id заменяется частичным
+    op.drop_index("ix_search_index_project_id", table_name="search_index")
+    op.create_index(
+        "ix_search_index_project_id",
+        "search_index",
+        ["project_id"],
+        postgresql_where=sa.text("project_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop added indexes and restore full project_id index"""
+    op.drop_index("ix_search_index_project_id", table_name="search_index")
+    op.create_index(
+        "ix_search_index_project_id", "search_index", ["project_id"], unique=False
+    )
+    op.drop_index("ix_search_index_entity", table_name="search_index")
+    op.drop_index("ix_search_index_search_vector", table_name="search_index")
@@ -0,0 +1,49 @@
+"""Make search_index.search_vector a generated column
+
+Revision ID: search_vector_generated_column
+Revises: notifications_unread_feed_index
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "search_vector_generated_column"
+down_revision: str | None = "notifications_unread_feed_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector('russian', coalesce(title, '') || ' ' || coalesce(content, ''))"
+)
+
+
+def upgrade() -> None:
+    """Replace search_vector with a stored generated column"""
+    op.drop_column("search_index", "search_vector")
+    op.add_column(
+        "search_index",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=False,
+            comment="Полнотекстовый вектор",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Restore search_vector as a regular column"""
+    op.drop_column("search_index", "search_vector")
+    op.add_column(
+        "search_index",
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+    )
+    op.execute(f"UPDATE search_index SET search_vector = {SEARCH_VECTOR_EXPRESSION}")
+    op.alter_column("search_index", "search_vector", nullable=False)
@@ -0,0 +1,38 @@
+"""Add composite indexes for tasks, comments and time entries
+
+Revision ID: task_comment_time_entry_indexes
+Revises: search_index_gin_indexes
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "task_comment_time_entry_indexes"
+down_revision: str | None = "search_index_gin_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (имя индекса, таблица, колонки)
+INDEXES = (
+    ("ix_tasks_project_status", "tasks", ["project_id", "status"]),
+    ("ix_tasks_assignee_archived", "tasks", ["assignee_id", "is_archived"]),
+    ("ix_comments_task_created", "comments", ["task_id", "created_at"]),
+    ("ix_time_entries_user_start", "time_entries", ["user_id", "start_time"]),
+    ("ix_time_entries_task_id", "time_entries", ["task_id"]),
+)
+
+
+def upgrade() -> None:
+    """Create composite foreign key indexes"""
+    for index_name, table_name, columns in INDEXES:
+        op.create_index(index_name, table_name, columns)
+
+
+def downgrade() -> None:
+    """Drop composite foreign key indexes"""
+    for index_name, table_name, _columns in reversed(INDEXES):
+        op.drop_index(index_name, table_name=table_name)
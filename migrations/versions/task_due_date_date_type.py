@@ -0,0 +1,44 @@
+"""Convert tasks.due_date to date
+
+Revision ID: task_due_date_date_type
+Revises: task_comment_time_entry_indexes
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "task_due_date_date_type"
+down_revision: str | None = "task_comment_time_entry_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Store due_date as native date and index it for overdue queries"""
+    op.alter_column(
+        "tasks",
+        "due_date",
+        existing_type=sa.String(length=20),
+        type_=sa.Date(),
+        existing_nullable=True,
+        postgresql_using="NULLIF(due_date, '')::date",
+    )
+    op.create_index("ix_tasks_due_date", "tasks", ["due_date"])
+
+
+def downgrade() -> None:
+    """Store due_date as ISO string again"""
+    op.drop_index("ix_tasks_due_date", table_name="tasks")
+    op.alter_column(
+        "tasks",
+        "due_date",
+        existing_type=sa.Date(),
+        type_=sa.String(length=20),
+        existing_nullable=True,
+        postgresql_using="to_char(due_date, 'YYYY-MM-DD')",
+    )
@@ -0,0 +1,63 @@
+"""Make time_entries.duration_minutes a generated column
+
+Revision ID: time_entry_duration_generated_column
+Revises: drop_task_actual_hours
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "time_entry_duration_generated_column"
+down_revision: str | None = "drop_task_actual_hours"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+DURATION_MINUTES_EXPRESSION = (
+    "FLOOR(EXTRACT(EPOCH FROM (end_time - start_time)) / 60)::integer"
+)
+
+
+def upgrade() -> None:
+    """Replace duration_minutes with a stored generated column"""
+    # Записи, заданные только длительностью, получают end_time,
+    # иначе после пересоздания колонки длительность потеряется
+    op.execute(
+        "UPDATE time_entries "
+        "SET start_time = coalesce(start_time, created_at), "
+        "end_time = coalesce(start_time, created_at) "
+        "+ duration_minutes * interval '1 minute' "
+        "WHERE end_time IS NULL AND duration_minutes IS NOT NULL AND NOT is_active"
+    )
+    op.drop_column("time_entries", "duration_minutes")
+    op.add_column(
+        "time_entries",
+        sa.Column(
+            "duration_minutes",
+            sa.Integer(),
+            sa.Computed(DURATION_MINUTES_EXPRESSION, persisted=True),
+            nullable=True,
+            comment="Длительность в минутах",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Restore duration_minutes as a regular column"""
+    op.drop_column("time_entries", "duration_minutes")
+    op.add_column(
+        "time_entries",
+        sa.Column(
+            "duration_minutes",
+            sa.Integer(),
+            nullable=True,
+            comment="Длительность в минутах",
+        ),
+    )
+    op.execute(
+        f"UPDATE time_entries SET duration_minutes = {DURATION_MINUTES_EXPRESSION}"
+    )
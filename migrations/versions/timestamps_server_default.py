@@ -0,0 +1,49 @@
+"""Set server-side now() defaults for created_at/updated_at
+
+Revision ID: timestamps_server_default
+Revises: time_entry_duration_generated_column
+Create Date: 2026-10-17 16:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "timestamps_server_default"
+down_revision: str | None = "time_entry_duration_generated_column"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Таблицы моделей на BaseModel, которые ведет Alembic
+TABLES = (
+    "users",
+    "files",
+    "projects",
+    "project_members",
+    "sprints",
+    "tasks",
+    "comments",
+    "sprint_tasks",
+    "time_entries",
+    "notifications",
+    "share_links",
+    "search_index",
+    "saved_searches",
+)
+
+
+def upgrade() -> None:
+    """Default created_at/updated_at to now() on the server"""
+    for table_name in TABLES:
+        for column_name in ("created_at", "updated_at"):
+            op.alter_column(table_name, column_name, server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    """Drop server-side timestamp defaults"""
+    for table_name in TABLES:
+        for column_name in ("created_at", "updated_at"):
+            op.alter_column(table_name, column_name, server_default=None)
@@ -131,11 +131,6 @@ def override_get_db(db_session: AsyncSession):
 @pytest_asyncio.fixture
 async def client(override_get_db):
     """Создание тестового клиента"""
-    from app.schemas.auth import update_auth_forward_refs
-
-    # Обновляем forward references для Pydantic
-    update_auth_forward_refs()
-
     app.dependency_overrides[get_db] = override_get_db
 
     async with AsyncClient(
@@ -209,7 +204,7 @@ async def test_project_with_user(auth_headers, db_session: AsyncSession):
         status="ACTIVE",
         is_public=False,
         allow_external_sharing=True,
-        max_members="5",
+        max_members=5,
         owner_id=user.id,
     )
 
@@ -243,7 +238,7 @@ def test_project_data():
         "status": "ACTIVE",  # Используем значение из Python enum ProjectStatus
         "is_public": False,
         "allow_external_sharing": True,
-        "max_members": "5",
+        "max_members": 5,
     }
 
 
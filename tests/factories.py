@@ -50,7 +50,7 @@ class ProjectFactory(factory.Factory):
     status = ProjectStatus.ACTIVE
     is_public = False
     allow_external_sharing = True
-    max_members = "10"
+    max_members = 10
     owner = factory.SubFactory(UserFactory)
 
     @factory.post_generation
@@ -129,8 +129,11 @@ class TimeEntryFactory(factory.Factory):
     class Meta:
         model = None  # Будет определена после импорта модели
 
+    class Params:
+        # duration_minutes в модели генерируется БД из start_time/end_time
+        duration_minutes = fuzzy.FuzzyChoice([15, 30, 60, 90, 120, 180, 240])
+
     description = factory.Faker("sentence", nb_words=6)
-    duration_minutes = fuzzy.FuzzyChoice([15, 30, 60, 90, 120, 180, 240])
 
     # Время
     start_time = factory.LazyFunction(
@@ -259,7 +262,6 @@ class TestScenariosFactory:
                 description=f"Работа над задачей {_i+1}",
                 start_time=start_time,
                 end_time=start_time + timedelta(minutes=duration),
-                duration_minutes=duration,
                 user=user,
                 task=task,
             )
@@ -12,6 +12,7 @@ from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.file import File, FileType
+from app.schemas.file import FileResponse
 from app.services.file_service import FileService
 
 
@@ -331,3 +332,22 @@ class TestFileService:
         # Восстановление
         test_file.restore()
         assert not test_file.is_deleted
+
+    def test_formatted_size_units(self) -> None:
+        """Тест форматирования размера на границах единиц"""
+        assert File(file_size=0).formatted_size == "0.0 B"
+        assert File(file_size=1023).formatted_size == "1023.0 B"
+        assert File(file_size=1024).formatted_size == "1.0 KB"
+        assert File(file_size=1536).formatted_size == "1.5 KB"
+        assert File(file_size=5 * 1024**2).formatted_size == "5.0 MB"
+        assert File(file_size=2 * 1024**3).formatted_size == "2.0 GB"
+        assert File(file_size=3 * 1024**5).formatted_size == "3072.0 TB"
+
+    async def test_file_response_computed_fields(self, test_file: File) -> None:
+        """Тест вычисляемых полей схемы ответа файла"""
+        data = FileResponse.model_validate(test_file).model_dump()
+
+        assert data["file_extension"] == test_file.file_extension
+        assert data["formatted_size"] == test_file.formatted_size
+        assert data["is_image"] == test_file.is_image
+        assert data["is_document"] == test_file.is_document
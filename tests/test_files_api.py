@@ -368,6 +368,7 @@ class TestFilesAPI:
         assert "type_stats" in result
         assert "avg_file_size" in result
         assert result["total_files"] >= 1
+        assert set(result["type_stats"]["image"]) == {"count", "size"}
 
     async def test_upload_file_with_task_and_project(
         self,
@@ -64,3 +64,121 @@ async def test_task_service_improvements(db_session: AsyncSession):
     assert task.order == 1  # Первая задача в колонке
 
     print("Улучшения работают корректно!")
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_usage_tracker(db_session: AsyncSession):
+    """
+    ✅ Массовая вставка через COPY в транзакции сессии
+    """
+    import uuid
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import func, select
+
+    from app.core.database import bulk_copy
+    from app.models.subscription import UsageTracker
+
+    unique_suffix = uuid.uuid4().hex[:8]
+    user = User(
+        email=f"copy_{unique_suffix}@example.com",
+        username=f"copyuser_{unique_suffix}",
+        full_name="Copy User",
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    columns = [
+        "id",
+        "user_id",
+        "date",
+        "storage_used",
+        "files_count",
+        "projects_count",
+        "users_count",
+        "api_calls",
+        "video_uploads",
+        "audio_uploads",
+    ]
+    start = datetime(2024, 1, 1)
+    rows = [
+        (uuid.uuid4(), user.id, start + timedelta(days=day), 100, 1, 0, 0, 5, 0, 0)
+        for day in range(30)
+    ]
+
+    inserted = await bulk_copy(db_session, UsageTracker.__table__, columns, rows)
+    await db_session.commit()
+
+    total = await db_session.scalar(
+        select(func.sum(UsageTracker.storage_used)).where(
+            UsageTracker.user_id == user.id
+        )
+    )
+    assert inserted == 30
+    assert total == 3000
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_analytics_events(db_session: AsyncSession):
+    """
+    ✅ Массовая запись событий аналитики через COPY
+    """
+    import uuid
+
+    from sqlalchemy import func, select
+
+    from app.models.analytics import AnalyticsEvent
+    from app.services.analytics_service import AnalyticsService
+
+    session_id = f"copy_{uuid.uuid4().hex[:8]}"
+    events = [
+        {
+            "event_type": "page_view",
+            "event_category": "navigation",
+            "event_data": {"page": index},
+            "session_id": session_id,
+        }
+        for index in range(5)
+    ]
+
+    service = AnalyticsService(db_session)
+    inserted = await service.bulk_insert_events(events)
+
+    count = await db_session.scalar(
+        select(func.count(AnalyticsEvent.id)).where(
+            AnalyticsEvent.session_id == session_id
+        )
+    )
+    assert inserted == 5
+    assert count == 5
+    assert await service.bulk_insert_events([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_analytics_event_timestamp_default_is_utc(db_session: AsyncSession):
+    """
+    ✅ Время события по умолчанию пишется в UTC независимо от часового пояса БД
+    """
+    import uuid
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import select, text
+
+    from app.models.analytics import AnalyticsEvent
+
+    await db_session.execute(text("SET TIME ZONE 'Asia/Vladivostok'"))
+    session_id = f"utc_{uuid.uuid4().hex[:8]}"
+    db_session.add(
+        AnalyticsEvent(
+            event_type="page_view",
+            event_category="navigation",
+            session_id=session_id,
+        )
+    )
+    await db_session.flush()
+
+    timestamp = await db_session.scalar(
+        select(AnalyticsEvent.timestamp).where(AnalyticsEvent.session_id == session_id)
+    )
+    assert timestamp is not None
+    assert abs(datetime.utcnow() - timestamp) < timedelta(minutes=5)
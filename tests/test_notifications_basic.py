@@ -4,11 +4,26 @@
 
 import uuid
 from datetime import UTC, datetime, timedelta
+from typing import get_args
 
+import orjson
 import pytest
 
+from app.core.serialization import orjson_dumps, orjson_dumps_lines
 from app.models.notification import Notification, NotificationType
 from app.models.user import User
+from app.schemas.notification import (
+    NotificationCreate,
+    NotificationFactory,
+    NotificationOut,
+    NotificationRead,
+    NotificationTypeLiteral,
+    ProjectMemberAddedNotification,
+    SprintCompletedNotification,
+    SprintStartedNotification,
+    TaskAssignedNotification,
+    TaskCompletedNotification,
+)
 from app.services.notification_service import NotificationService
 
 
@@ -164,6 +179,20 @@ class TestNotificationModel:
         assert recent_notification.is_recent is True
         assert old_notification.is_recent is False
 
+    async def test_notification_is_recent_at(self):
+        """Тест проверки недавности относительно заданного момента"""
+        now = datetime.now(UTC)
+        notification = Notification(
+            title="Notification",
+            message="Message",
+            notification_type=NotificationType.TASK_ASSIGNED,
+            created_at=now - timedelta(hours=23),
+        )
+
+        assert notification.is_recent_at(now) is True
+        assert notification.is_recent_at(now + timedelta(hours=2)) is False
+        assert notification.to_dict(now=now)["is_recent"] is True
+
     async def test_notification_to_dict(self, db_session):
         """Тест преобразования в словарь"""
         user = create_test_user()
@@ -185,15 +214,69 @@ class TestNotificationModel:
         notification_dict = notification.to_dict()
 
         assert isinstance(notification_dict, dict)
-        assert notification_dict["id"] == str(notification.id)
-        assert notification_dict["user_id"] == str(user.id)
+        assert notification_dict["id"] == notification.id
+        assert notification_dict["user_id"] == user.id
         assert notification_dict["title"] == "Test Notification"
         assert notification_dict["message"] == "Test message"
         assert notification_dict["notification_type"] == NotificationType.TASK_ASSIGNED
         assert notification_dict["action_url"] == "/test-url"
         assert notification_dict["is_read"] is False
-        assert "created_at" in notification_dict
-        assert "updated_at" in notification_dict
+        assert notification_dict["created_at"] == notification.created_at
+        assert notification_dict["updated_at"] == notification.updated_at
+
+    async def test_notification_to_json(self, db_session):
+        """Тест сериализации в JSON через orjson"""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        notification = Notification(
+            user_id=user.id,
+            title="Test Notification",
+            message="Test message",
+            notification_type=NotificationType.TASK_ASSIGNED,
+        )
+        db_session.add(notification)
+        await db_session.commit()
+        await db_session.refresh(notification)
+
+        notification_json = orjson.loads(notification.to_json())
+
+        assert notification_json["id"] == str(notification.id)
+        assert notification_json["user_id"] == str(user.id)
+        assert notification_json["project_id"] is None
+        assert notification_json["read_at"] is None
+        assert notification_json["is_read"] is False
+        assert notification_json["created_at"].startswith(
+            notification.created_at.date().isoformat()
+        )
+
+    async def test_notification_out_matches_read_schema(self, db_session):
+        """Тест: NotificationOut совпадает по данным с NotificationRead"""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        notification = Notification(
+            user_id=user.id,
+            title="Test Notification",
+            message="Test message",
+            notification_type=NotificationType.TASK_ASSIGNED,
+        )
+        db_session.add(notification)
+        await db_session.commit()
+        await db_session.refresh(notification)
+
+        now = datetime.now(UTC)
+        notification_out = orjson.loads(
+            orjson_dumps(NotificationOut.from_orm(notification, now))
+        )
+        notification_read = NotificationRead.model_validate(notification)
+
+        # Сравнение с JSON-режимом pydantic: тот же формат дат, что у response_model
+        assert notification_out == notification_read.model_dump(mode="json")
 
 
 @pytest.mark.asyncio
@@ -222,6 +305,55 @@ class TestNotificationService:
         assert notification.message == "Service message"
         assert notification.notification_type == NotificationType.TASK_ASSIGNED
 
+    async def test_create_notification_metadata_is_dict(self, db_session):
+        """Тест хранения метаданных уведомления как JSONB"""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        service = NotificationService(db_session)
+
+        notification = await service.create_user_notification(
+            user_id=user.id,
+            title="Metadata Notification",
+            message="Metadata message",
+            notification_type=NotificationType.TASK_ASSIGNED,
+            metadata_json={"assigner_id": str(user.id), "priority": 2},
+        )
+        await db_session.refresh(notification)
+
+        assert notification.metadata_json == {
+            "assigner_id": str(user.id),
+            "priority": 2,
+        }
+
+    async def test_create_notifications_bulk(self, db_session):
+        """Тест массового создания уведомлений"""
+        users = [create_test_user() for _ in range(3)]
+        db_session.add_all(users)
+        await db_session.commit()
+
+        service = NotificationService(db_session)
+
+        notifications = await service.create_notifications_bulk(
+            [
+                NotificationCreate(
+                    user_id=user.id,
+                    title="Bulk Notification",
+                    message="Bulk message",
+                    notification_type=NotificationType.SPRINT_STARTED,
+                )
+                for user in users
+            ]
+        )
+
+        assert len(notifications) == 3
+        assert {n.user_id for n in notifications} == {user.id for user in users}
+        assert all(n.id is not None and n.is_read is False for n in notifications)
+        for user in users:
+            assert await service.get_unread_count(user.id) == 1
+
     async def test_get_user_notifications(self, db_session):
         """Тест получения уведомлений пользователя"""
         user = create_test_user()
@@ -315,6 +447,69 @@ class TestNotificationService:
         unread_count = await service.get_unread_count(user.id)
         assert unread_count == 0
 
+        # Повторный вызов ничего не обновляет
+        assert await service.mark_all_notifications_read(user.id) == 0
+
+    async def test_iter_user_notifications(self, db_session):
+        """Тест потоковой выгрузки уведомлений пачками"""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        service = NotificationService(db_session)
+        for i in range(5):
+            await service.create_user_notification(
+                user_id=user.id,
+                title=f"Notification {i}",
+                message=f"Message {i}",
+                notification_type=NotificationType.WELCOME,
+            )
+
+        batches = [
+            batch
+            async for batch in service.iter_user_notifications(user.id, batch_size=2)
+        ]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+        # Пачки сериализуются в JSON Lines
+        now = datetime.now(UTC)
+        lines = orjson_dumps_lines(
+            NotificationOut.from_orm(n, now) for n in batches[0]
+        ).splitlines()
+        assert len(lines) == 2
+        assert orjson.loads(lines[0])["user_id"] == str(user.id)
+
+    async def test_mark_notification_read(self, db_session):
+        """Тест отметки одного уведомления как прочитанного"""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        service = NotificationService(db_session)
+        notification = await service.create_user_notification(
+            user_id=user.id,
+            title="Notification",
+            message="Message",
+            notification_type=NotificationType.TASK_ASSIGNED,
+        )
+
+        marked = await service.mark_notification_read(notification.id, user.id)
+        assert marked is not None
+        assert marked.is_read is True
+        assert marked.read_at is not None
+
+        # Время первого прочтения сохраняется
+        first_read_at = marked.read_at
+        marked = await service.mark_notification_read(notification.id, user.id)
+        assert marked.read_at == first_read_at
+
+        # Чужое уведомление не найдено
+        other = await service.mark_notification_read(notification.id, uuid.uuid4())
+        assert other is None
+
     async def test_delete_notification(self, db_session):
         """Тест удаления уведомления"""
         user = create_test_user()
@@ -398,3 +593,46 @@ class TestNotificationType:
         assert NotificationType.is_valid_type("invalid_type") is False
         assert NotificationType.is_valid_type("") is False
         assert NotificationType.is_valid_type(None) is False
+
+    def test_notification_type_literal_matches_constants(self):
+        """Тест соответствия Literal-типа схем константам NotificationType"""
+        assert get_args(NotificationTypeLiteral) == tuple(
+            NotificationType.get_all_types()
+        )
+
+
+class TestNotificationFactory:
+    """Тесты фабрики уведомлений"""
+
+    def test_factory_results_pass_validation(self):
+        """Схемы фабрики (model_construct) проходят полную валидацию"""
+        task_id, project_id, sprint_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        user_id, other_id = uuid.uuid4(), uuid.uuid4()
+
+        created = [
+            NotificationFactory.task_assigned(
+                TaskAssignedNotification(
+                    task_id=task_id, assignee_id=user_id, assigner_id=other_id
+                )
+            ),
+            NotificationFactory.task_completed(
+                TaskCompletedNotification(
+                    task_id=task_id, project_id=project_id, completer_id=user_id
+                )
+            ),
+            NotificationFactory.project_member_added(
+                ProjectMemberAddedNotification(
+                    project_id=project_id, member_id=user_id, inviter_id=other_id
+                )
+            ),
+            NotificationFactory.sprint_started(
+                SprintStartedNotification(sprint_id=sprint_id, project_id=project_id)
+            ),
+            NotificationFactory.sprint_completed(
+                SprintCompletedNotification(sprint_id=sprint_id, project_id=project_id)
+            ),
+        ]
+
+        for notification in created:
+            validated = NotificationCreate.model_validate(notification.model_dump())
+            assert validated == notification
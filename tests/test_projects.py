@@ -6,7 +6,12 @@ import uuid
 
 from httpx import AsyncClient
 
-from app.schemas.project import ProjectUpdate
+from app.models.project import ProjectMember, ProjectRole
+from app.schemas.project import (
+    ProjectMemberWithDetails,
+    ProjectUpdate,
+    ProjectWithDetails,
+)
 
 
 class TestProjects:
@@ -163,3 +168,45 @@ class TestProjects:
 
         assert response.status_code == 404
         assert "Ресурс не найден" in response.json()["detail"]
+
+
+class TestProjectMemberPermissions:
+    """Тесты проверок прав участника по роли"""
+
+    def test_role_permissions(self):
+        """Тест прав для каждой роли"""
+        owner = ProjectMember(role=ProjectRole.OWNER)
+        member = ProjectMember(role=ProjectRole.MEMBER)
+        viewer = ProjectMember(role=ProjectRole.VIEWER)
+
+        assert owner.can_manage_project is True
+        assert owner.can_edit_project is True
+        assert owner.can_edit_tasks is True
+        assert owner.can_view_project is True
+
+        assert member.can_manage_project is False
+        assert member.can_edit_project is True
+        assert member.can_edit_tasks is True
+        assert member.can_view_project is True
+
+        assert viewer.can_manage_project is False
+        assert viewer.can_edit_project is False
+        assert viewer.can_edit_tasks is False
+        assert viewer.can_view_project is True
+
+    def test_unknown_role_has_no_permissions(self):
+        """Тест отсутствия прав без роли"""
+        member = ProjectMember()
+
+        assert member.permissions == 0
+        assert member.can_view_project is False
+
+
+class TestProjectSchemasConfig:
+    """Тесты наследования конфигурации схем проекта"""
+
+    def test_details_schemas_inherit_config(self):
+        """Схемы с деталями наследуют конфигурацию базовых схем"""
+        for schema in (ProjectWithDetails, ProjectMemberWithDetails):
+            assert schema.model_config["from_attributes"] is True
+            assert schema.model_config["frozen"] is True
@@ -38,16 +38,12 @@ class TestAuthValidation:
 
         # Короткие пароли должны вызывать ошибку
         if len(password) < 6:
-            with pytest.raises(
-                ValueError, match="Пароль должен содержать минимум 6 символов"
-            ):
+            with pytest.raises(ValidationError, match="at least 6 characters"):
                 RegisterRequest(email=valid_email, password=password)
 
         # Слишком длинные пароли должны вызывать ошибку
         elif len(password) > 128:
-            with pytest.raises(
-                ValueError, match="Пароль не должен превышать 128 символов"
-            ):
+            with pytest.raises(ValidationError, match="at most 128 characters"):
                 RegisterRequest(email=valid_email, password=password)
 
         # Валидные пароли должны проходить
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.search import SearchableType, SearchIndex
 from app.models.user import User
-from app.schemas.search import SearchQuery
+from app.schemas.search import SEARCH_RESULT_LIST_ADAPTER, SearchQuery
 from app.services.search_service import SearchService
 
 
@@ -47,7 +47,6 @@ class TestSearchAPI:
         search_index = SearchIndex(
             title="Test Task",
             content="Test task description",
-            search_vector="test task description",
             entity_type=SearchableType.TASK,
             entity_id=uuid.uuid4(),
             user_id=test_user.id,
@@ -489,6 +488,11 @@ class TestSearchModels:
         with pytest.raises(ValueError):
             SearchableType("invalid_type")
 
+        # Проверка на границе API возвращает член перечисления
+        assert SearchableType.validate("task") is SearchableType.TASK
+        with pytest.raises(ValueError):
+            SearchableType.validate("invalid_type")
+
     def test_search_query_schema(self) -> None:
         """Тест схемы поискового запроса"""
         # Корректные данные
@@ -531,6 +535,29 @@ class TestSearchModels:
         with pytest.raises(ValueError):
             SearchQuery(query="test", limit=101)
 
+    def test_search_result_entity_data(self) -> None:
+        """Тест типизированных данных сущности в результате поиска"""
+        row = {
+            "id": str(uuid.uuid4()),
+            "entity_type": "task",
+            "entity_id": str(uuid.uuid4()),
+            "title": "Задача",
+            "rank": 0.5,
+            "is_public": False,
+            "entity_data": {
+                "status": "todo",
+                "member_count": 3,
+                "unknown_key": "value",
+            },
+        }
+
+        (result,) = SEARCH_RESULT_LIST_ADAPTER.validate_python([row])
+        assert result.entity_data == {"status": "todo", "member_count": 3}
+
+        row["entity_data"] = {"member_count": "не число"}
+        with pytest.raises(ValueError):
+            SEARCH_RESULT_LIST_ADAPTER.validate_python([row])
+
 
 class TestSearchPage:
     """Тесты страницы поиска"""
@@ -64,6 +64,8 @@ async def test_index_task(db_session: AsyncSession, async_user_factory):
     assert search_index.entity_id == task.id
     assert search_index.project_id == project.id
     assert search_index.user_id == test_user.id
+    # search_vector заполняется генерируемой колонкой
+    assert search_index.search_vector
 
 
 @pytest.mark.asyncio
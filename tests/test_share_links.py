@@ -2,14 +2,18 @@
 Тесты для публичных ссылок (External Sharing)
 """
 
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
+import orjson
 import pytest
+from sqlalchemy import select
 
+from app.core.serialization import orjson_dumps
 from app.models.project import Project, ProjectMember, ProjectRole, ProjectStatus
 from app.models.share_link import ShareableType, ShareLink, SharePermission
 from app.models.user import User
-from app.schemas.share_link import ShareLinkCreate
+from app.schemas.share_link import ShareLinkCreate, ShareLinkOut, ShareLinkResponse
 from app.services.share_link_service import ShareLinkService
 
 
@@ -85,6 +89,52 @@ class TestShareLinkModel:
         assert active_link.is_accessible is True
         assert inactive_link.is_accessible is False
 
+    async def test_share_link_is_accessible_sql_matches_python(self, db_session):
+        """Тест совпадения SQL- и Python-версий is_accessible."""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        def make_link(**kwargs) -> ShareLink:
+            return ShareLink(
+                token=f"token_{uuid4().hex[:8]}",
+                shareable_type=ShareableType.PROJECT,
+                shareable_id=uuid4(),
+                permission=SharePermission.VIEW,
+                created_by=user.id,
+                **kwargs,
+            )
+
+        now = datetime.now(UTC)
+        links = [
+            make_link(is_active=True),
+            make_link(is_active=True, expires_at=now + timedelta(days=1)),
+            make_link(is_active=True, expires_at=now - timedelta(days=1)),
+            make_link(is_active=True, max_views=2, current_views=1),
+            make_link(is_active=True, max_views=2, current_views=2),
+            make_link(is_active=False),
+        ]
+        db_session.add_all(links)
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(ShareLink.id).where(
+                ShareLink.created_by == user.id, ShareLink.is_accessible
+            )
+        )
+        accessible_ids = set(result.scalars().all())
+
+        assert accessible_ids == {link.id for link in links if link.is_accessible}
+        assert [link.is_accessible for link in links] == [
+            True,
+            True,
+            False,
+            True,
+            False,
+            False,
+        ]
+
     async def test_share_link_increment_views(self, db_session):
         """Тест увеличения счетчика просмотров."""
         user = create_test_user()
@@ -147,6 +197,59 @@ class TestShareLinkModel:
         assert link_dict["is_accessible"] is True
         assert "public_url" in link_dict
 
+    async def test_share_link_out_matches_response(self, db_session):
+        """Тест: ShareLinkOut совпадает по данным с ShareLinkResponse."""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        share_link = ShareLink(
+            token=f"out_token_{uuid4().hex[:8]}",
+            shareable_type=ShareableType.PROJECT,
+            shareable_id=uuid4(),
+            password="secret",
+            created_by=user.id,
+        )
+        db_session.add(share_link)
+        await db_session.commit()
+        await db_session.refresh(share_link)
+
+        link_out = orjson.loads(orjson_dumps(ShareLinkOut.from_orm(share_link)))
+        link_response = ShareLinkResponse.model_validate(share_link.to_dict())
+
+        assert link_out["password"] is None
+        assert link_out["has_password"] is True
+        # Сравнение с JSON-режимом pydantic: тот же формат дат, что у response_model
+        assert link_out == link_response.model_dump(mode="json")
+
+    async def test_share_link_response_computed_flags(self, db_session):
+        """Тест: вычисляемые признаки ShareLinkResponse совпадают с моделью."""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        share_link = ShareLink(
+            token=f"flags_token_{uuid4().hex[:8]}",
+            shareable_type=ShareableType.PROJECT,
+            shareable_id=uuid4(),
+            expires_at=datetime.now(UTC) - timedelta(hours=1),
+            max_views=2,
+            current_views=2,
+            created_by=user.id,
+        )
+        db_session.add(share_link)
+        await db_session.commit()
+        await db_session.refresh(share_link)
+
+        link_response = ShareLinkResponse.model_validate(share_link.to_dict())
+
+        assert link_response.is_expired is True
+        assert link_response.is_view_limit_exceeded is True
+        assert link_response.is_accessible is False
+        assert link_response.model_dump()["is_accessible"] is False
+
 
 @pytest.mark.asyncio
 class TestShareLinkService:
@@ -345,3 +448,46 @@ class TestShareLinkService:
             assert token not in tokens  # Проверяем уникальность
             assert len(token) == 48  # token_urlsafe(36) дает 48 символов
             tokens.add(token)
+
+    async def test_access_shared_content_respects_view_limit(self, db_session):
+        """Тест атомарного учета просмотров с лимитом."""
+        user = create_test_user()
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        project = Project(
+            name="Viewed Project",
+            description="Test Description",
+            owner_id=user.id,
+            status=ProjectStatus.ACTIVE,
+        )
+        db_session.add(project)
+        await db_session.commit()
+        await db_session.refresh(project)
+
+        db_session.add(
+            ProjectMember(
+                project_id=project.id, user_id=user.id, role=ProjectRole.OWNER
+            )
+        )
+        await db_session.commit()
+
+        service = ShareLinkService(db_session)
+        share_link = await service.create_share_link(
+            ShareLinkCreate(
+                shareable_type=ShareableType.PROJECT,
+                shareable_id=project.id,
+                max_views=1,
+            ),
+            user.id,
+        )
+
+        accessed = await service.access_shared_content(share_link.token)
+        assert accessed is not None
+        accessed_link, content = accessed
+        assert accessed_link.current_views == 1
+        assert content["name"] == "Viewed Project"
+
+        # Лимит исчерпан
+        assert await service.access_shared_content(share_link.token) is None
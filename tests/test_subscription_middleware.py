@@ -0,0 +1,64 @@
+"""
+Тесты middleware подписок
+"""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import Request, Response
+
+from app.services.subscription_service import allowed_file_types_header
+
+# Пакет app/middleware/ перекрыт модулем app/middleware.py, поэтому
+# модуль middleware подписок загружается по пути к файлу
+_SUBSCRIPTION_MIDDLEWARE_PATH = (
+    Path(__file__).resolve().parents[1] / "app" / "middleware" / "subscription.py"
+)
+_spec = importlib.util.spec_from_file_location(
+    "subscription_middleware", _SUBSCRIPTION_MIDDLEWARE_PATH
+)
+assert _spec is not None and _spec.loader is not None
+subscription_middleware = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(subscription_middleware)
+
+
+class TestSubscriptionInfoMiddleware:
+    """Тесты middleware для заголовков с лимитами подписки"""
+
+    @pytest.mark.asyncio
+    async def test_limit_headers_added(self):
+        """Тест заголовков лимитов без служебных ключей в limits"""
+        middleware = subscription_middleware.SubscriptionInfoMiddleware(MagicMock())
+        request = MagicMock(spec=Request)
+        request.state = MagicMock(spec=[])
+        request.state.limits = {
+            "storage_limit": 100,
+            "file_count_limit": 10,
+            "max_file_size": 5,
+            "allowed_file_types": ["image", "document"],
+        }
+        response = MagicMock(spec=Response)
+        response.headers = {}
+
+        result = await middleware.dispatch(request, AsyncMock(return_value=response))
+
+        assert result.headers["X-Allowed-File-Types"] == "image,document"
+        assert result.headers["X-Storage-Limit"] == "100"
+        assert "allowed_file_types_csv" not in request.state.limits
+
+
+class TestAllowedFileTypesHeader:
+    """Тесты кэширования заголовка X-Allowed-File-Types"""
+
+    def test_allowed_file_types_header_cached(self):
+        """Тест: строка заголовка собирается один раз на набор типов"""
+        allowed_file_types_header.cache_clear()
+
+        first = allowed_file_types_header(("image", "video"))
+        second = allowed_file_types_header(("image", "video"))
+
+        assert first == "image,video"
+        assert second is first
+        assert allowed_file_types_header.cache_info().hits == 1
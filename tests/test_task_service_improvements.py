@@ -425,3 +425,189 @@ class TestTaskServiceSkills:
         # ✅ Проверяем статус
         assert task.status == status
         assert task.order == 1  # Первая задача в каждой колонке статуса
+
+    async def test_completion_percentage_sql_matches_python(
+        self, db_session: AsyncSession, test_user_data: dict, test_project_data: dict
+    ):
+        """
+        ✅ SQL-версия completion_percentage совпадает с Python-версией
+        """
+        from sqlalchemy import select
+        from sqlalchemy.orm import selectinload
+
+        from app.core.security import get_password_hash
+        from app.models.task import Task, TaskStatus
+
+        user_data = test_user_data.copy()
+        user_data["hashed_password"] = get_password_hash(user_data.pop("password"))
+
+        user = User(**user_data)
+        db_session.add(user)
+        await db_session.flush()
+
+        project = Project(**test_project_data, owner_id=user.id)
+        db_session.add(project)
+        await db_session.flush()
+
+        def make_task(title: str, status: TaskStatus, parent: Task | None = None):
+            return Task(
+                title=title,
+                status=status,
+                project_id=project.id,
+                creator_id=user.id,
+                parent_task_id=parent.id if parent else None,
+            )
+
+        parent = make_task("Parent", TaskStatus.IN_PROGRESS)
+        done_leaf = make_task("Done leaf", TaskStatus.DONE)
+        todo_leaf = make_task("Todo leaf", TaskStatus.TODO)
+        db_session.add_all([parent, done_leaf, todo_leaf])
+        await db_session.flush()
+
+        db_session.add_all(
+            [
+                make_task("Sub 1", TaskStatus.DONE, parent),
+                make_task("Sub 2", TaskStatus.DONE, parent),
+                make_task("Sub 3", TaskStatus.TODO, parent),
+                make_task("Sub 4", TaskStatus.BLOCKED, parent),
+            ]
+        )
+        await db_session.commit()
+
+        ids = [parent.id, done_leaf.id, todo_leaf.id]
+        result = await db_session.execute(
+            select(Task.id, Task.completion_percentage).where(Task.id.in_(ids))
+        )
+        sql_values = dict(result.all())
+
+        result = await db_session.execute(
+            select(Task)
+            .options(selectinload(Task.subtasks))
+            .where(Task.id.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+        python_values = {
+            task.id: task.completion_percentage for task in result.scalars()
+        }
+
+        assert sql_values == python_values
+        assert python_values == {
+            parent.id: 50.0,
+            done_leaf.id: 100.0,
+            todo_leaf.id: 0.0,
+        }
+
+    async def test_is_overdue_sql_matches_python(
+        self, db_session: AsyncSession, test_user_data: dict, test_project_data: dict
+    ):
+        """
+        ✅ SQL-версия is_overdue совпадает с Python-версией
+        """
+        from datetime import date, timedelta
+
+        from sqlalchemy import select
+
+        from app.core.security import get_password_hash
+        from app.models.task import Task, TaskStatus
+
+        user_data = test_user_data.copy()
+        user_data["hashed_password"] = get_password_hash(user_data.pop("password"))
+
+        user = User(**user_data)
+        db_session.add(user)
+        await db_session.flush()
+
+        project = Project(**test_project_data, owner_id=user.id)
+        db_session.add(project)
+        await db_session.flush()
+
+        today = date.today()
+        tasks = [
+            Task(title=title, status=status, due_date=due_date)
+            for title, status, due_date in [
+                ("Overdue", TaskStatus.TODO, today - timedelta(days=1)),
+                ("Done late", TaskStatus.DONE, today - timedelta(days=1)),
+                ("Due today", TaskStatus.IN_PROGRESS, today),
+                ("No due date", TaskStatus.TODO, None),
+            ]
+        ]
+        for task in tasks:
+            task.project_id = project.id
+            task.creator_id = user.id
+        db_session.add_all(tasks)
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(Task.id).where(Task.project_id == project.id, Task.is_overdue)
+        )
+
+        assert set(result.scalars().all()) == {t.id for t in tasks if t.is_overdue}
+        assert [task.is_overdue for task in tasks] == [True, False, False, False]
+
+    async def test_actual_minutes_sql_matches_python(
+        self, db_session: AsyncSession, test_user_data: dict, test_project_data: dict
+    ):
+        """
+        ✅ actual_minutes суммирует записи времени при загрузке задачи
+        """
+        from datetime import UTC, datetime, timedelta
+
+        from sqlalchemy import select
+
+        from app.core.security import get_password_hash
+        from app.models.task import Task, TaskStatus
+        from app.models.time_entry import TimeEntry
+
+        user_data = test_user_data.copy()
+        user_data["hashed_password"] = get_password_hash(user_data.pop("password"))
+
+        user = User(**user_data)
+        db_session.add(user)
+        await db_session.flush()
+
+        project = Project(**test_project_data, owner_id=user.id)
+        db_session.add(project)
+        await db_session.flush()
+
+        tracked, untracked = (
+            Task(
+                title=title,
+                status=TaskStatus.TODO,
+                project_id=project.id,
+                creator_id=user.id,
+            )
+            for title in ("Tracked", "Untracked")
+        )
+        db_session.add_all([tracked, untracked])
+        await db_session.flush()
+
+        start = datetime(2024, 1, 1, 9, 0, tzinfo=UTC)
+        db_session.add_all(
+            [
+                TimeEntry(
+                    task_id=tracked.id,
+                    user_id=user.id,
+                    start_time=start,
+                    end_time=start + timedelta(minutes=minutes),
+                )
+                for minutes in (30, 45)
+            ]
+            # Незавершенная запись (таймер идет) не учитывается
+            + [TimeEntry(task_id=tracked.id, user_id=user.id, start_time=start)]
+        )
+        await db_session.commit()
+
+        ids = [tracked.id, untracked.id]
+        result = await db_session.execute(
+            select(Task.id, Task.actual_minutes).where(Task.id.in_(ids))
+        )
+        sql_values = dict(result.all())
+
+        result = await db_session.execute(
+            select(Task)
+            .where(Task.id.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+        loaded_values = {task.id: task.actual_minutes for task in result.scalars()}
+
+        assert sql_values == loaded_values == {tracked.id: 75, untracked.id: 0}
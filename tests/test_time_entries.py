@@ -106,6 +106,33 @@ class TestTimeEntries:
         data = response.json()
         assert data["duration_minutes"] == 60
 
+    async def test_task_actual_minutes_from_time_entries(
+        self,
+        client: AsyncClient,
+        test_user_data: dict,
+        test_project_data: dict,
+        test_task_data: dict,
+    ):
+        """Тест фактического времени задачи по временным записям"""
+        headers = await self.get_auth_headers(client, test_user_data)
+        project = await self.create_test_project(client, headers, test_project_data)
+        task = await self.create_test_task(
+            client, headers, project["id"], test_task_data
+        )
+        assert task["actual_minutes"] == 0
+
+        for minutes in (60, 45):
+            await client.post(
+                "/api/v1/time-entries/",
+                json={"task_id": task["id"], "duration_minutes": minutes},
+                headers=headers,
+            )
+
+        response = await client.get(f"/api/v1/tasks/{task['id']}", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["actual_minutes"] == 105
+
     async def test_start_timer(
         self,
         client: AsyncClient,